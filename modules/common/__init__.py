@@ -0,0 +1,5 @@
+# common/__init__.py
+"""
+Helpers shared by the add-ons in modules/, so they don't import each
+other's internals. Contains no Blender classes and needs no register().
+"""
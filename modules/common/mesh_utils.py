@@ -0,0 +1,98 @@
+# mesh_utils.py
+"""
+Mesh data helpers shared by the exporters.
+They work on bpy.types.Mesh data directly through bmesh and numpy, so
+they need no mode switches, selection changes or operator calls.
+"""
+
+import bmesh
+import logging
+import numpy as np
+
+# --- Setup Logger ---
+logger = logging.getLogger(__name__)
+if not logger.handlers:
+    handler = logging.StreamHandler()
+    formatter = logging.Formatter("%(name)s:%(levelname)s: %(message)s")
+    handler.setFormatter(formatter)
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)  # Default level
+
+# --- Constants ---
+# Triangulate modifier quad methods → bmesh.ops.triangulate quad methods
+QUAD_METHODS = {
+    "BEAUTY": "BEAUTY",
+    "FIXED": "FIXED",
+    "FIXED_ALTERNATE": "ALTERNATE",
+    "SHORTEST_DIAGONAL": "SHORT_EDGE",
+    "LONGEST_DIAGONAL": "LONG_EDGE",
+}
+NGON_METHODS = {"BEAUTY", "CLIP"}
+# Temporary corner attribute that carries custom normals through bmesh
+TEMP_NORMALS_ATTR = "easymesh_tri_normals"
+
+
+def is_triangulated(mesh):
+    """True if every polygon of mesh is already a triangle."""
+    return len(mesh.loops) == 3 * len(mesh.polygons)
+
+
+def triangulate_mesh_data(mesh, quad_method="BEAUTY", ngon_method="BEAUTY",
+                          keep_normals=True):
+    """
+    Triangulates all quads and n-gons of a mesh in place with
+    bmesh.ops.triangulate.
+
+    Custom normals are kept by storing the corner normals in a temporary
+    corner attribute, which bmesh copies onto the new triangles, and
+    setting them again afterwards.
+
+    Args:
+        mesh (bpy.types.Mesh): The mesh to triangulate. Must not be in
+            Edit Mode.
+        quad_method (str): A triangulate modifier quad method
+            (see QUAD_METHODS).
+        ngon_method (str): "BEAUTY" or "CLIP".
+        keep_normals (bool): Whether to keep custom normals.
+
+    Returns:
+        int: Number of faces that were split.
+    """
+    if not mesh.polygons or is_triangulated(mesh):
+        return 0
+
+    bm_quad_method = QUAD_METHODS.get(quad_method, "BEAUTY")
+    bm_ngon_method = ngon_method if ngon_method in NGON_METHODS else "BEAUTY"
+    has_custom_normals = mesh.has_custom_normals
+
+    if has_custom_normals and keep_normals:
+        normals = np.empty(len(mesh.loops) * 3, dtype=np.float32)
+        mesh.corner_normals.foreach_get("vector", normals)
+        attr = mesh.attributes.new(TEMP_NORMALS_ATTR, "FLOAT_VECTOR",
+                                   "CORNER")
+        attr.data.foreach_set("vector", normals)
+
+    bm = bmesh.new()
+    try:
+        bm.from_mesh(mesh)
+        faces = [face for face in bm.faces if len(face.verts) > 3]
+        bmesh.ops.triangulate(
+            bm, faces=faces,
+            quad_method=bm_quad_method, ngon_method=bm_ngon_method
+        )
+        bm.to_mesh(mesh)
+    finally:
+        bm.free()
+
+    if has_custom_normals:
+        if keep_normals:
+            attr = mesh.attributes[TEMP_NORMALS_ATTR]
+            normals = np.empty(len(mesh.loops) * 3, dtype=np.float32)
+            attr.data.foreach_get("vector", normals)
+            mesh.attributes.remove(attr)
+        else:
+            # Zero vectors reset every corner to its automatic normal
+            normals = np.zeros(len(mesh.loops) * 3, dtype=np.float32)
+        mesh.normals_split_custom_set(normals.reshape(-1, 3))
+    mesh.update()
+    return len(faces)
@@ -0,0 +1,101 @@
+# selection_utils.py
+"""
+Selection helpers shared by the exporters.
+Their cost depends on the number of selected objects
+(view_layer.objects.selected), not on the size of the scene.
+"""
+
+import contextlib
+import logging
+
+# --- Setup Logger ---
+logger = logging.getLogger(__name__)
+if not logger.handlers:
+    handler = logging.StreamHandler()
+    formatter = logging.Formatter("%(name)s:%(levelname)s: %(message)s")
+    handler.setFormatter(formatter)
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)  # Default level
+
+
+def deselect_all(view_layer):
+    """
+    Deselects every selected object of a view layer. Equivalent to
+    bpy.ops.object.select_all(action="DESELECT") without the operator.
+    """
+    for obj in list(view_layer.objects.selected):
+        obj.select_set(False, view_layer=view_layer)
+
+
+def select_objects(view_layer, objects):
+    """
+    Selects objects in a view layer, skipping ones that are gone or not
+    in it.
+
+    Returns:
+        list: The objects that were selected.
+    """
+    selected = []
+    for obj in objects:
+        if not obj:
+            continue
+        try:
+            obj.select_set(True, view_layer=view_layer)
+            selected.append(obj)
+        except (ReferenceError, RuntimeError):
+            logger.warning("Could not select an object "
+                           "- reference invalid or not in view layer.")
+    return selected
+
+
+def set_active_object(view_layer, obj):
+    """Sets the active object, ignoring objects not in the view layer."""
+    try:
+        view_layer.objects.active = obj
+        return True
+    except (ReferenceError, RuntimeError, ValueError):
+        return False
+
+
+@contextlib.contextmanager
+def temp_selection_context(context, active_object=None, selected_objects=None):
+    """
+    Temporarily set the active object and selection using direct API.
+    Only the previously selected objects are stored and restored.
+    
+    Args:
+        context (bpy.context): The current Blender context.
+        active_object (bpy.types.Object, optional): 
+            The object to set as active.
+        selected_objects (list, optional): List of objects to select.
+    
+    Returns:
+        None
+    """
+    view_layer = context.view_layer
+    # Store original state
+    original_active = view_layer.objects.active
+    original_selected = list(view_layer.objects.selected)
+    
+    try:
+        deselect_all(view_layer)
+        
+        # Select requested objects directly
+        if selected_objects and not isinstance(selected_objects, list):
+            selected_objects = [selected_objects]
+        selected = select_objects(view_layer, selected_objects or [])
+        
+        # Set active object directly
+        if active_object:
+            set_active_object(view_layer, active_object)
+        elif selected:
+            set_active_object(view_layer, selected[0])
+        
+        yield
+    
+    finally:
+        # Restore original state directly
+        deselect_all(view_layer)
+        select_objects(view_layer, original_selected)
+        if original_active:
+            set_active_object(view_layer, original_active)
@@ -18,6 +18,8 @@ import logging
 from . import properties
 from . import operators
 from . import panels
+from . import export_stats
+from . import decimation_cache
 from . import export_indicators # Still needed for timer and recent list
 
 # --- Setup Logger ---
@@ -33,6 +35,8 @@ if not logger.handlers:
 # Registration
 classes = (
     *operators.classes,
+    *export_stats.classes,
+    *decimation_cache.classes,
     *panels.classes,
     # export_indicators registers its own classes/timer
 )
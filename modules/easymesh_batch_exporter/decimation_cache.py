@@ -0,0 +1,301 @@
+# decimation_cache.py
+"""
+Persistent cache of decimation results.
+
+Collapse decimation is the most expensive export step, and its result
+only depends on the source mesh and the decimate settings. Each result
+is stored as a compressed .npz file of the decimated mesh arrays
+(topology plus generic attributes such as UVs), keyed by a content hash
+of the source mesh and the settings. One cache is shared by a whole
+batch, which evicts the least recently used files once it is done, so
+the directory is bounded in size.
+
+Deform weights, custom split normals and shape keys are not stored, so
+meshes that have them are never cached: a hit would lose that data.
+"""
+
+import bpy
+import os
+import json
+import hashlib
+import logging
+import numpy as np
+from bpy.types import Operator
+from .export_manifest import hash_mesh_data, ATTRIBUTE_LAYOUTS
+
+# --- Setup Logger ---
+logger = logging.getLogger(__name__)
+if not logger.handlers:
+    handler = logging.StreamHandler()
+    formatter = logging.Formatter("%(name)s:%(levelname)s: %(message)s")
+    handler.setFormatter(formatter)
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)  # Default level
+
+# --- Constants ---
+CACHE_VERSION = 1
+CACHE_DIR_NAME = "decimation_cache"
+
+
+def get_cache_dir():
+    """Returns (and creates) the directory the cache files live in."""
+    try:
+        # Available when installed as an extension (Blender 4.2+)
+        return bpy.utils.extension_path_user(
+            __package__.rsplit(".modules.", 1)[0],
+            path=CACHE_DIR_NAME, create=True
+        )
+    except (ValueError, AttributeError):
+        return bpy.utils.user_resource(
+            "DATAFILES", path=f"easymesh_{CACHE_DIR_NAME}", create=True
+        )
+
+
+# --- Mesh Arrays ---
+
+
+def _read(collection, key, length, dtype):
+    values = np.empty(length, dtype=dtype)
+    if length:
+        collection.foreach_get(key, values)
+    return values
+
+
+def mesh_to_arrays(mesh):
+    """
+    Reads a mesh's topology and generic attributes into numpy arrays.
+
+    Returns:
+        dict: Array name → numpy array, plus a JSON "meta" entry.
+    """
+    arrays = {
+        "co": _read(mesh.vertices, "co", len(mesh.vertices) * 3,
+                    np.float32),
+        "edges": _read(mesh.edges, "vertices", len(mesh.edges) * 2,
+                       np.int32),
+        "loop_vertex": _read(mesh.loops, "vertex_index", len(mesh.loops),
+                             np.int32),
+        "loop_edge": _read(mesh.loops, "edge_index", len(mesh.loops),
+                           np.int32),
+        "loop_start": _read(mesh.polygons, "loop_start",
+                            len(mesh.polygons), np.int32),
+    }
+    attributes = []
+    for index, attr in enumerate(mesh.attributes):
+        if attr.name.startswith(".") or attr.name == "position":
+            continue
+        layout = ATTRIBUTE_LAYOUTS.get(attr.data_type)
+        if layout is None:
+            continue
+        key, components, dtype = layout
+        arrays[f"attr_{index}"] = _read(attr.data, key,
+                                        len(attr.data) * components, dtype)
+        attributes.append((f"attr_{index}", attr.name, attr.domain,
+                           attr.data_type))
+    uv_layers = mesh.uv_layers
+    meta = {
+        "attributes": attributes,
+        "active_uv": uv_layers.active.name if uv_layers.active else None,
+        "render_uv": next((uv.name for uv in uv_layers
+                           if uv.active_render), None),
+    }
+    arrays["meta"] = np.array(json.dumps(meta))
+    return arrays
+
+
+def arrays_to_mesh(arrays, mesh):
+    """Replaces mesh's geometry with arrays written by mesh_to_arrays."""
+    meta = json.loads(str(arrays["meta"]))
+    mesh.clear_geometry()
+    mesh.vertices.add(len(arrays["co"]) // 3)
+    mesh.edges.add(len(arrays["edges"]) // 2)
+    mesh.loops.add(len(arrays["loop_vertex"]))
+    mesh.polygons.add(len(arrays["loop_start"]))
+    mesh.vertices.foreach_set("co", arrays["co"])
+    mesh.edges.foreach_set("vertices", arrays["edges"])
+    mesh.loops.foreach_set("vertex_index", arrays["loop_vertex"])
+    mesh.loops.foreach_set("edge_index", arrays["loop_edge"])
+    mesh.polygons.foreach_set("loop_start", arrays["loop_start"])
+
+    for array_name, name, domain, data_type in meta["attributes"]:
+        attr = mesh.attributes.get(name)
+        if attr is None or attr.domain != domain \
+                or attr.data_type != data_type:
+            if attr is not None:
+                mesh.attributes.remove(attr)
+            attr = mesh.attributes.new(name, data_type, domain)
+        key = ATTRIBUTE_LAYOUTS[data_type][0]
+        attr.data.foreach_set(key, arrays[array_name])
+
+    uv_layers = mesh.uv_layers
+    if meta["active_uv"] in uv_layers:
+        uv_layers.active = uv_layers[meta["active_uv"]]
+    if meta["render_uv"] in uv_layers:
+        uv_layers[meta["render_uv"]].active_render = True
+    mesh.update()
+
+
+# --- Cache ---
+
+
+def is_cacheable(obj):
+    """
+    True if obj's mesh survives a round trip through mesh_to_arrays:
+    it has no deform weights, custom normals or shape keys.
+    """
+    mesh = obj.data
+    return not (obj.vertex_groups or mesh.has_custom_normals
+                or mesh.shape_keys)
+
+
+class DecimationCache:
+    """Bounded on-disk cache of decimated meshes with LRU eviction."""
+
+    def __init__(self, cache_dir, max_bytes):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def make_key(self, obj, ratio, decimate_type, sym_axis, sym):
+        """
+        Returns the cache key for decimating obj's mesh with these
+        settings, or None if the mesh has data the cache can't restore.
+        """
+        mesh = obj.data
+        if not is_cacheable(obj):
+            return None
+        hasher = hashlib.blake2b(digest_size=16)
+        hash_mesh_data(mesh, hasher)
+        hasher.update(
+            f"v{CACHE_VERSION}:{bpy.app.version_string}:{ratio:.6f}:"
+            f"{decimate_type}:{sym}:{sym_axis if sym else ''}".encode()
+        )
+        return hasher.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.npz")
+
+    def load(self, key, mesh):
+        """
+        Rebuilds mesh from the cached result for key.
+
+        Returns:
+            bool: True on a cache hit.
+        """
+        path = self._path(key)
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                arrays_to_mesh(data, mesh)
+            # The modification time records recency for LRU eviction
+            os.utime(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return False
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache entry {path}: {e}")
+            self.misses += 1
+            return False
+        self.hits += 1
+        return True
+
+    def store(self, key, mesh):
+        """
+        Writes the decimated mesh for key. Old entries are removed by
+        evict, which the batch calls once at its end.
+        """
+        path = self._path(key)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, "wb") as f:
+                np.savez_compressed(f, **mesh_to_arrays(mesh))
+            os.replace(temp_path, path)
+        except Exception as e:
+            # A failed store must never fail the export itself
+            logger.warning(f"Could not write decimation cache entry: {e}")
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+    def entries(self):
+        """Returns [(mtime, size, path)] of all cache files."""
+        entries = []
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return entries
+        for name in names:
+            if not name.endswith(".npz"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue # Evicted by another process meanwhile
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def evict(self):
+        """Removes least recently used files until within max_bytes."""
+        entries = sorted(self.entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+
+    def clear(self):
+        """Removes every cache file. Returns the number removed."""
+        removed = 0
+        for _, _, path in self.entries():
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+
+def get_cache(scene_props):
+    """
+    Returns the decimation cache configured in scene_props, or None if
+    caching is disabled or the cache directory is unavailable. Created
+    once per batch (or worker), so hits and misses add up.
+    """
+    if not getattr(scene_props, "mesh_export_decimate_cache", False):
+        return None
+    try:
+        cache_dir = get_cache_dir()
+    except Exception as e:
+        logger.warning(f"Decimation cache unavailable: {e}")
+        return None
+    return DecimationCache(
+        cache_dir, scene_props.mesh_export_decimate_cache_mb * 1024 * 1024
+    )
+
+
+# --- Operators ---
+
+
+class MESH_OT_clear_decimation_cache(Operator):
+    """Deletes all cached decimation results"""
+    bl_idname = "mesh.clear_decimation_cache"
+    bl_label = "Clear Decimation Cache"
+    bl_options = {"REGISTER"}
+
+    def execute(self, context):
+        cache = DecimationCache(get_cache_dir(), 0)
+        removed = cache.clear()
+        self.report({"INFO"}, f"Removed {removed} cached decimations.")
+        logger.info(f"Removed {removed} cached decimations.")
+        return {"FINISHED"}
+
+
+classes = (
+    MESH_OT_clear_decimation_cache,
+)
@@ -0,0 +1,191 @@
+# export_dedupe.py
+"""
+Export deduplication for linked duplicates and identical meshes.
+
+Objects are grouped by their export fingerprint (see export_manifest),
+which hashes each mesh datablock once, so linked duplicates cost one hash
+and separate but identical meshes end up in the same group. Only the
+first object of a group goes through the export pipeline; the others
+either get hardlinks (or copies) of its files under their own names, or
+an entry in a mapping file with the source files and their transform.
+
+Objects with geometry nodes, or with modifiers that read other objects
+or collections, are never grouped: their output depends on scene data
+the fingerprint can't fully cover.
+"""
+
+import os
+import json
+import shutil
+import logging
+from . import export_manifest
+
+# --- Setup Logger ---
+logger = logging.getLogger(__name__)
+if not logger.handlers:
+    handler = logging.StreamHandler()
+    formatter = logging.Formatter("%(name)s:%(levelname)s: %(message)s")
+    handler.setFormatter(formatter)
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)  # Default level
+
+# --- Constants ---
+MAPPING_NAME = "easymesh_instances.json"
+MAPPING_VERSION = 1
+
+
+# --- Grouping ---
+
+
+def can_share_export(obj):
+    """
+    True if obj's output only depends on what its fingerprint covers:
+    no geometry nodes and no modifier that reads another ID.
+    """
+    for modifier in obj.modifiers:
+        if modifier.type == "NODES":
+            return False
+        if export_manifest.get_modifier_references(modifier):
+            return False
+    return True
+
+
+def group_duplicates(objects, settings_dict):
+    """
+    Groups objects whose exported files would be identical.
+
+    Args:
+        objects (list): Original mesh objects, in export order.
+        settings_dict (dict): Settings from properties.settings_as_dict.
+
+    Returns:
+        list: Groups as lists of objects, the representative first, in
+            the order of their representatives.
+    """
+    settings_hash = export_manifest.fingerprint_settings(settings_dict)
+    # Copied files contain the representative's location unless every
+    # object is moved to the origin; mapping entries record their own
+    include_location = (settings_dict["mesh_export_dedupe"] == "COPY"
+                        and not settings_dict["mesh_export_zero_location"])
+    mesh_cache = {}
+    groups = {}
+    for obj in objects:
+        if not can_share_export(obj):
+            groups[("unique", obj.name)] = [obj]
+            continue
+        try:
+            key = export_manifest.fingerprint_object(
+                obj, settings_hash, mesh_cache, include_location
+            )
+        except Exception as e:
+            logger.warning(f"Could not fingerprint {obj.name}, "
+                           f"exporting it separately: {e}")
+            key = ("unique", obj.name)
+        groups.setdefault(key, []).append(obj)
+    return list(groups.values())
+
+
+# --- File Copies ---
+
+
+def get_duplicate_paths(files, source_base_name, base_name):
+    """
+    Maps the files exported under source_base_name to the same files
+    named with base_name (LOD suffixes and extensions are kept).
+
+    Returns:
+        list: (source path, duplicate path) pairs.
+    """
+    pairs = []
+    for path in files:
+        directory, file_name = os.path.split(path)
+        if not file_name.startswith(source_base_name):
+            continue
+        pairs.append((path, os.path.join(
+            directory, base_name + file_name[len(source_base_name):]
+        )))
+    return pairs
+
+
+def link_or_copy(source, target):
+    """
+    Atomically replaces target with a hardlink to source, or with a copy
+    if the file system doesn't support hardlinks.
+    """
+    temp_path = f"{target}.{os.getpid()}.tmp"
+    try:
+        try:
+            os.link(source, temp_path)
+        except OSError:
+            shutil.copy2(source, temp_path)
+        os.replace(temp_path, target)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+# --- Mapping File ---
+
+
+class InstanceMapping:
+    """
+    Mapping file listing deduplicated objects with the files of the
+    object that was exported for them and their own transform.
+    """
+
+    def __init__(self, export_dir):
+        self.export_dir = export_dir
+        self.path = os.path.join(export_dir, MAPPING_NAME)
+        self.entries = {}
+        self.dirty = False
+
+    def load(self):
+        """Loads the mapping; a missing or invalid file gives no entries."""
+        self.entries = {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == MAPPING_VERSION:
+                self.entries = data.get("instances", {})
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read instance mapping: {e}")
+        return self
+
+    def save(self):
+        """Writes the mapping atomically if it changed."""
+        if not self.dirty:
+            return
+        temp_path = f"{self.path}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": MAPPING_VERSION,
+                           "instances": self.entries}, f, indent=1)
+            os.replace(temp_path, self.path)
+            self.dirty = False
+        except OSError as e:
+            logger.error(f"Could not write instance mapping: {e}")
+
+    def update(self, obj, source_name, files):
+        """
+        Records obj as an instance of the files exported for source.
+        Files are stored relative to the export directory, as formats
+        write into their own sub-folders.
+        """
+        self.entries[obj.name] = {
+            "source": source_name,
+            "files": [os.path.relpath(path, self.export_dir).replace(
+                          os.sep, "/") for path in files],
+            "location": list(obj.location),
+            "matrix_world": [list(row) for row in obj.matrix_world],
+        }
+        self.dirty = True
+
+    def remove(self, object_name):
+        """Forgets an object, e.g. once it is exported on its own."""
+        if self.entries.pop(object_name, None) is not None:
+            self.dirty = True
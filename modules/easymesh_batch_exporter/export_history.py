@@ -0,0 +1,265 @@
+# export_history.py
+"""
+Persistent export history.
+
+Every exported file is recorded in an SQLite database in the export
+directory: object, LOD level, format, path, file size, triangle and
+polygon counts, export seconds and the settings hash. Unlike the
+viewport indicators, which expire after a few minutes, the history keeps
+every export and can be queried by object, date and format.
+
+Queries always go through an index and are limited, and the panel's
+results are cached by the database file's modification time, so the
+history stays fast with hundreds of thousands of rows.
+"""
+
+import os
+import time
+import sqlite3
+import logging
+import datetime
+
+# --- Setup Logger ---
+logger = logging.getLogger(__name__)
+if not logger.handlers:
+    handler = logging.StreamHandler()
+    formatter = logging.Formatter("%(name)s:%(levelname)s: %(message)s")
+    handler.setFormatter(formatter)
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)  # Default level
+
+# --- Constants ---
+HISTORY_NAME = ".easymesh_history.sqlite"
+HISTORY_VERSION = 1
+# Seconds between commits during a batch; close() commits the rest
+COMMIT_INTERVAL = 2.0
+# Sorts after any character object names can contain
+PREFIX_END = "\U0010ffff"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS exports (
+    id INTEGER PRIMARY KEY,
+    exported REAL NOT NULL,
+    object_name TEXT NOT NULL,
+    lod INTEGER,
+    format TEXT NOT NULL,
+    file_path TEXT NOT NULL,
+    file_size INTEGER,
+    triangles INTEGER,
+    polygons INTEGER,
+    seconds REAL,
+    settings_hash TEXT
+);
+CREATE INDEX IF NOT EXISTS exports_by_time
+    ON exports (exported);
+CREATE INDEX IF NOT EXISTS exports_by_object
+    ON exports (object_name, exported);
+CREATE INDEX IF NOT EXISTS exports_by_format
+    ON exports (format, exported);
+"""
+
+# (database path, mtime, size, query arguments) → rows, for panel redraws
+_query_cache = {}
+
+
+def get_history_path(export_dir):
+    """Path of the history database of an export directory."""
+    return os.path.join(export_dir, HISTORY_NAME)
+
+
+def parse_since(text):
+    """
+    Parses a point in time typed into the panel.
+
+    Args:
+        text (str): "YYYY-MM-DD", "YYYY-MM-DD HH:MM", or a relative age
+            such as "3d", "12h" or "30m". Empty means no limit.
+
+    Returns:
+        float: Unix time, or None for an empty text.
+
+    Raises:
+        ValueError: If text isn't in one of these forms.
+    """
+    text = text.strip()
+    if not text:
+        return None
+    units = {"m": 60, "h": 3600, "d": 86400, "w": 604800}
+    if text[-1].lower() in units and text[:-1].strip().isdigit():
+        # Whole minutes, so panel queries stay cacheable between redraws
+        now = int(time.time()) // 60 * 60
+        return now - int(text[:-1]) * units[text[-1].lower()]
+    for date_format in ("%Y-%m-%d %H:%M", "%Y-%m-%d"):
+        try:
+            return datetime.datetime.strptime(text, date_format).timestamp()
+        except ValueError:
+            continue
+    raise ValueError(f"Invalid date '{text}', use YYYY-MM-DD[ HH:MM] "
+                     f"or an age like 3d, 12h")
+
+
+def _filter_clause(object_prefix="", fmt="", since=None):
+    """
+    Builds an indexable WHERE clause. Object names are matched by
+    prefix as a range, which SQLite answers from exports_by_object.
+    """
+    conditions = []
+    args = []
+    if object_prefix:
+        conditions.append("object_name >= ? AND object_name < ?")
+        args += [object_prefix, object_prefix + PREFIX_END]
+    if fmt:
+        conditions.append("format = ?")
+        args.append(fmt)
+    if since is not None:
+        conditions.append("exported >= ?")
+        args.append(since)
+    clause = " WHERE " + " AND ".join(conditions) if conditions else ""
+    return clause, args
+
+
+class ExportHistory:
+    """Connection to the history database of one export directory."""
+
+    def __init__(self, export_dir):
+        self.path = get_history_path(export_dir)
+        self.connection = None
+        self.last_commit = 0.0
+
+    def open(self, read_only=False):
+        """
+        Opens the database, creating it unless read_only. Read-only
+        connections never write, so the file's modification time keeps
+        identifying its content.
+        """
+        if read_only:
+            self.connection = sqlite3.connect(
+                f"file:{self.path}?mode=ro", uri=True
+            )
+        else:
+            self.connection = sqlite3.connect(self.path)
+            self.connection.execute("PRAGMA synchronous = NORMAL")
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        if read_only:
+            if version != HISTORY_VERSION:
+                self.close()
+                raise sqlite3.DatabaseError(
+                    f"Unsupported history version {version} in {self.path}"
+                )
+            return self
+        if version not in (0, HISTORY_VERSION):
+            self.connection.close()
+            self.connection = None
+            raise sqlite3.DatabaseError(
+                f"Unsupported history version {version} in {self.path}"
+            )
+        self.connection.executescript(SCHEMA)
+        self.connection.execute(f"PRAGMA user_version = {HISTORY_VERSION}")
+        self.connection.commit()
+        self.last_commit = time.time()
+        return self
+
+    def close(self):
+        """Commits pending records and closes the database."""
+        if self.connection is None:
+            return
+        try:
+            self.connection.commit()
+        finally:
+            self.connection.close()
+            self.connection = None
+
+    def record(self, object_name, file_records, settings_hash=None,
+               exported=None):
+        """
+        Records the files written for one object.
+
+        Args:
+            object_name (str): Name of the original object.
+            file_records (list): (path, lod level, format, triangles,
+                polygons, seconds) tuples, see ObjectExportResult.
+            settings_hash (str, optional): Hash of the export settings.
+            exported (float, optional): Unix time, defaults to now.
+        """
+        if exported is None:
+            exported = time.time()
+        rows = []
+        for path, lod_level, fmt, triangles, polygons, seconds in (
+                file_records):
+            try:
+                size = os.path.getsize(path)
+            except OSError:
+                size = None
+            rows.append((exported, object_name, lod_level, fmt, path, size,
+                         triangles, polygons, seconds, settings_hash))
+        if not rows:
+            return
+        self.connection.executemany(
+            "INSERT INTO exports (exported, object_name, lod, format, "
+            "file_path, file_size, triangles, polygons, seconds, "
+            "settings_hash) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+        )
+        if time.time() - self.last_commit >= COMMIT_INTERVAL:
+            self.connection.commit()
+            self.last_commit = time.time()
+
+    def query(self, object_prefix="", fmt="", since=None, limit=50):
+        """
+        Returns the newest matching exports.
+
+        Returns:
+            list: (exported, object name, lod, format, file path,
+                file size, triangles, polygons, seconds, settings hash)
+                tuples, newest first.
+        """
+        clause, args = _filter_clause(object_prefix, fmt, since)
+        return self.connection.execute(
+            "SELECT exported, object_name, lod, format, file_path, "
+            "file_size, triangles, polygons, seconds, settings_hash "
+            f"FROM exports{clause} ORDER BY exported DESC LIMIT ?",
+            args + [limit]
+        ).fetchall()
+
+    def stale_objects(self, since, object_prefix="", fmt=""):
+        """
+        Returns the names of matching objects whose last export is older
+        than since.
+        """
+        clause, args = _filter_clause(object_prefix, fmt)
+        return [row[0] for row in self.connection.execute(
+            f"SELECT object_name FROM exports{clause} "
+            f"GROUP BY object_name HAVING MAX(exported) < ?",
+            args + [since]
+        )]
+
+
+def query_cached(export_dir, object_prefix="", fmt="", since=None,
+                 limit=50):
+    """
+    ExportHistory.query for panels: results are cached by the database's
+    modification time, so redraws don't touch SQLite.
+
+    Returns:
+        list: Rows as returned by ExportHistory.query, [] if there is no
+            history.
+    """
+    path = get_history_path(export_dir)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return []
+    key = (path, stat.st_mtime, stat.st_size,
+           object_prefix, fmt, since, limit)
+    if key not in _query_cache:
+        _query_cache.clear()
+        history = ExportHistory(export_dir)
+        try:
+            history.open(read_only=True)
+            _query_cache[key] = history.query(object_prefix, fmt, since,
+                                              limit)
+        except sqlite3.Error as e:
+            logger.warning(f"Could not read export history: {e}")
+            _query_cache[key] = []
+        finally:
+            history.close()
+    return _query_cache[key]
@@ -5,14 +5,28 @@ exported objects.
 
 Relies on custom properties set by the main export operator:
 - mesh_export_timestamp: Time of export.
-- mesh_export_status: Current status (FRESH, STALE, NONE).
+- mesh_export_status: Current status (FRESH, STALE, NONE, DIRTY).
 
 Requires the user to set their 3D Viewport shading colour 
 type to 'Object' in Solid display mode to see the colour changes.
+
+Exported objects are kept in a registry with their next status
+transition in a min-heap. The timer only touches objects whose
+transition is due and sleeps until the next one, instead of scanning
+every object at a fixed interval. The registry is rebuilt from the
+custom properties once after a file is loaded and after each undo
+or redo.
+
+A depsgraph_update_post handler marks exported objects DIRTY when their
+geometry, modifiers, transform, mesh or materials change. It only looks
+up the IDs of each update in dicts of tracked objects and their data, so
+its cost depends on the update, not on the size of the file. Dirty
+objects keep their colour until they are exported again.
 """
 
 import bpy
 import time
+import heapq
 import logging
 from enum import Enum
 from bpy.types import Operator
@@ -33,6 +47,7 @@ class ExportStatus(Enum):
     FRESH = 0   # Just exported (green)
     STALE = 1   # Exported a while ago (yellow)
     NONE = 2    # No indicator needed / Expired
+    DIRTY = 3   # Changed since it was exported (orange)
 
 
 # Timing constants (in seconds)
@@ -51,10 +66,38 @@ ORIGINAL_COLOUR_PROP = "mesh_exporter_original_colour"
 STATUS_COLOURS = {
     ExportStatus.FRESH.value: (0.2, 0.8, 0.2, 1.0),  # Green
     ExportStatus.STALE.value: (0.8, 0.8, 0.2, 1.0),  # Yellow
+    ExportStatus.DIRTY.value: (0.9, 0.4, 0.1, 1.0),  # Orange
 }
 
-# Timer interval
-_TIMER_INTERVAL_SECONDS = 5.0
+# Shortest timer delay, so a burst of due transitions can't spin
+_MIN_TIMER_INTERVAL_SECONDS = 0.05
+
+# --- Registry ---
+# Object session_uid → (object name, export time), oldest export first.
+# Also serves the Recent Exports panel, which reads it newest first.
+_registry = {}
+# Min-heap of (due time, session_uid, export time) status transitions
+_expiry_heap = []
+# When the timer will next run, None if it isn't scheduled
+_scheduled_due = None
+# Set until the registry has been built from the objects' properties
+_needs_rebuild = True
+# True while update_timer_callback runs; its return value reschedules
+_in_timer = False
+
+# --- Dirty Tracking ---
+# Exported objects unchanged since: session_uid → object name
+_clean = {}
+# Exported objects changed since: session_uid → object name
+_dirty = {}
+# Mesh/material session_uid → session_uids of tracked objects using it
+_data_users = {}
+# Objects the depsgraph handler saw change, marked by a timer
+_pending_dirty = set()
+# Set while a batch tick runs; it edits shared materials temporarily
+_tracking_paused = False
+# Scene frame of the last depsgraph update, to ignore animation playback
+_last_frame = None
 
 
 # --- Core Functions ---
@@ -73,27 +116,244 @@ def mark_object_as_exported(obj):
     """
     if obj is None or obj.type != "MESH":
         return
-        
-    # Ensure timer is registered
-    if not bpy.app.timers.is_registered(update_timer_callback):
-        logger.warning("Export indicators timer not registered - "
-                       "registering now")
-        try:
-            bpy.app.timers.register(
-                update_timer_callback,
-                first_interval=_TIMER_INTERVAL_SECONDS,
-                persistent=True
-            )
-        except Exception as e:
-            logger.error(f"Failed to register timer in "
-                         f"mark_object_as_exported: {e}")
-    
+
     # Mark the object
-    obj[EXPORT_TIME_PROP] = time.time()
+    export_time = time.time()
+    obj[EXPORT_TIME_PROP] = export_time
     obj[EXPORT_STATUS_PROP] = ExportStatus.FRESH.value
     set_object_colour(obj)
+    register_exported_object(obj, export_time)
     logger.info(f"Marked {obj.name} as freshly exported")
 
+
+def get_status_for_elapsed(elapsed_time):
+    """Returns the ExportStatus of an object exported elapsed_time ago."""
+    if elapsed_time < FRESH_DURATION_SECONDS:
+        return ExportStatus.FRESH
+    if elapsed_time < STALE_DURATION_SECONDS:
+        return ExportStatus.STALE
+    return ExportStatus.NONE
+
+
+def get_next_transition(export_time, status):
+    """Returns when an object in status changes status, None if never."""
+    if status == ExportStatus.FRESH:
+        return export_time + FRESH_DURATION_SECONDS
+    if status == ExportStatus.STALE:
+        return export_time + STALE_DURATION_SECONDS
+    return None
+
+
+def register_exported_object(obj, export_time):
+    """
+    Adds obj to the registry and schedules its next status transition.
+
+    Args:
+        obj (bpy.types.Object): The exported object.
+        export_time (float): Its export timestamp.
+
+    Returns:
+        None
+    """
+    uid = obj.session_uid
+    # Re-inserted so the registry stays in export order
+    _registry.pop(uid, None)
+    _registry[uid] = (obj.name, export_time)
+    _track_clean(obj)
+    due = get_next_transition(
+        export_time, get_status_for_elapsed(time.time() - export_time)
+    )
+    if due is None:
+        due = time.time() # Already expired, clean it up right away
+    heapq.heappush(_expiry_heap, (due, uid, export_time))
+    _schedule_timer(due)
+
+
+def _schedule_timer(due):
+    """Makes sure the timer runs no later than due."""
+    global _scheduled_due
+    if _in_timer:
+        return
+    if bpy.app.timers.is_registered(update_timer_callback):
+        if _scheduled_due is not None and _scheduled_due <= due:
+            return
+        bpy.app.timers.unregister(update_timer_callback)
+    _scheduled_due = due
+    try:
+        bpy.app.timers.register(
+            update_timer_callback,
+            first_interval=max(due - time.time(), 0.0),
+            persistent=True  # Make timer survive file loads
+        )
+    except Exception as e:
+        _scheduled_due = None
+        logger.error(f"Failed to register timer: {e}")
+
+
+def _lookup_object(uid, name):
+    """Returns the object with session_uid uid, last seen as name."""
+    obj = bpy.data.objects.get(name)
+    if obj is not None and obj.session_uid == uid:
+        return obj
+    # Renamed since it was exported
+    for obj in bpy.data.objects:
+        if obj.session_uid == uid:
+            return obj
+    return None
+
+
+def _find_object(uid, name):
+    """_lookup_object for registered objects, updating renamed ones."""
+    obj = _lookup_object(uid, name)
+    if obj is not None and obj.name != name:
+        _registry[uid] = (obj.name, _registry[uid][1])
+    return obj
+
+
+def clear_registry():
+    """Forgets every registered, clean and dirty object."""
+    _registry.clear()
+    _expiry_heap.clear()
+    _clean.clear()
+    _dirty.clear()
+    _data_users.clear()
+    _pending_dirty.clear()
+
+
+# --- Dirty Tracking ---
+
+
+def _track_clean(obj):
+    """Watches obj, its mesh and its materials for changes."""
+    uid = obj.session_uid
+    _dirty.pop(uid, None)
+    _clean[uid] = obj.name
+    data_blocks = [obj.data]
+    data_blocks += [slot.material for slot in obj.material_slots]
+    for data in data_blocks:
+        if data is not None:
+            _data_users.setdefault(data.session_uid, set()).add(uid)
+
+
+def mark_object_as_dirty(obj):
+    """
+    Marks an exported object as changed since its export. It stays
+    DIRTY until it is exported again or the indicators are cleared.
+
+    Args:
+        obj (bpy.types.Object): The changed object.
+    """
+    uid = obj.session_uid
+    _clean.pop(uid, None)
+    _registry.pop(uid, None) # No FRESH/STALE transitions any more
+    _dirty[uid] = obj.name
+    obj[EXPORT_STATUS_PROP] = ExportStatus.DIRTY.value
+    set_object_colour(obj)
+    logger.info(f"Marked {obj.name} as changed since export")
+
+
+def get_dirty_objects():
+    """
+    Returns the objects changed since their export. Objects that were
+    deleted or whose status was undone are forgotten.
+
+    Returns:
+        list: Dirty mesh objects.
+    """
+    dirty = []
+    for uid, name in list(_dirty.items()):
+        obj = _lookup_object(uid, name)
+        if (obj is None or obj.get(EXPORT_STATUS_PROP)
+                != ExportStatus.DIRTY.value):
+            del _dirty[uid]
+            continue
+        _dirty[uid] = obj.name
+        dirty.append(obj)
+    return dirty
+
+
+def get_dirty_count():
+    """Number of objects changed since their export."""
+    return len(_dirty)
+
+
+def pause_dirty_tracking():
+    """Ignores depsgraph updates until resume_dirty_tracking."""
+    global _tracking_paused
+    _tracking_paused = True
+    # A resume left by the previous batch tick mustn't end this pause
+    if bpy.app.timers.is_registered(_resume_tracking):
+        bpy.app.timers.unregister(_resume_tracking)
+
+
+def resume_dirty_tracking():
+    """
+    Resumes dirty tracking from the next event loop iteration, so the
+    updates of the changes made so far are still ignored: timers run
+    before the depsgraph handlers of their iteration, after those of
+    the previous one.
+    """
+    if not bpy.app.timers.is_registered(_resume_tracking):
+        bpy.app.timers.register(_resume_tracking)
+
+
+def _resume_tracking():
+    global _tracking_paused
+    _tracking_paused = False
+    return None
+
+
+@bpy.app.handlers.persistent
+def _on_depsgraph_update(scene, depsgraph):
+    """
+    Queues tracked objects whose geometry, modifiers or transform, or
+    whose mesh or materials, were updated. Only this update's IDs are
+    looked at; the objects are marked by a timer, outside evaluation.
+    Updates of a frame change are animation, not edits, and are ignored.
+    """
+    global _last_frame
+    frame_changed = scene.frame_current != _last_frame
+    _last_frame = scene.frame_current
+    if _tracking_paused or frame_changed or not _clean:
+        return
+    for update in depsgraph.updates:
+        id_data = update.id.original
+        uid = id_data.session_uid
+        if isinstance(id_data, bpy.types.Object):
+            # Selection and colour changes only update shading
+            if uid in _clean and (update.is_updated_geometry
+                                  or update.is_updated_transform):
+                _pending_dirty.add(uid)
+            continue
+        for user_uid in _data_users.get(uid, ()):
+            if user_uid in _clean:
+                _pending_dirty.add(user_uid)
+    if (_pending_dirty
+            and not bpy.app.timers.is_registered(_apply_pending_dirty)):
+        bpy.app.timers.register(_apply_pending_dirty)
+
+
+def _apply_pending_dirty():
+    """Marks the objects queued by _on_depsgraph_update as dirty."""
+    changed = False
+    while _pending_dirty:
+        uid = _pending_dirty.pop()
+        name = _clean.get(uid)
+        if name is None:
+            continue # Exported again or cleared meanwhile
+        try:
+            obj = _lookup_object(uid, name)
+            if obj is None:
+                del _clean[uid]
+                continue
+            mark_object_as_dirty(obj)
+            changed = True
+        except ReferenceError:
+            _clean.pop(uid, None)
+    if changed:
+        _redraw_all_areas()
+    return None
+
 def _delete_prop(obj, prop_name):
     """
     Safely delete a custom property from an object if it exists.
@@ -291,139 +551,216 @@ def set_object_colour(obj):
                      f"for {obj.name}: {e}")
 
 
-def update_all_export_statuses():
+def apply_export_status(obj, new_status):
     """
-    Iterate through objects, update export status based on elapsed time.
-    Returns True if any object's status changed, indicating a redraw is needed.
+    Moves obj to new_status: sets the status property and colour, or for
+    NONE restores the colour and removes the tracking properties.
+
+    Returns:
+        bool: True if the status changed.
+    """
+    old_status_val = obj.get(EXPORT_STATUS_PROP, ExportStatus.NONE.value)
+    if new_status.value == old_status_val:
+        return False
+    if new_status == ExportStatus.NONE:
+        # Restores colour, removes original prop
+        restore_object_colour(obj)
+        # Remove remaining tracking props
+        _delete_prop(obj, EXPORT_TIME_PROP)
+        _delete_prop(obj, EXPORT_STATUS_PROP)
+    else:
+        # Becoming FRESH or STALE: Set new status prop, then colour
+        obj[EXPORT_STATUS_PROP] = new_status.value
+        set_object_colour(obj)
+    old_status_name = (ExportStatus(old_status_val).name
+                       if isinstance(old_status_val, int) else "UNKNOWN")
+    logger.info(f"  → {obj.name}: {old_status_name} → {new_status.name}")
+    return True
+
+
+def process_due_transitions():
+    """
+    Applies the status transitions that are due. Only the objects
+    popped from the expiry heap are touched.
+
+    Returns:
+        bool: True if any object's status changed (redraw needed).
     """
     current_time = time.time()
     needs_redraw = False
-    status_changes = []
+    while _expiry_heap and _expiry_heap[0][0] <= current_time:
+        _, uid, export_time = heapq.heappop(_expiry_heap)
+        entry = _registry.get(uid)
+        if entry is None or entry[1] != export_time:
+            continue # Re-exported or cleared since it was scheduled
+        try:
+            obj = _find_object(uid, entry[0])
+            if obj is None or obj.get(EXPORT_TIME_PROP) != export_time:
+                # Deleted, or its properties changed (undo, clear)
+                del _registry[uid]
+                continue
+            new_status = get_status_for_elapsed(current_time - export_time)
+            needs_redraw |= apply_export_status(obj, new_status)
+            due = get_next_transition(export_time, new_status)
+            if due is None:
+                del _registry[uid]
+            else:
+                heapq.heappush(_expiry_heap, (due, uid, export_time))
+        except ReferenceError:
+            logger.debug("Object became invalid during status update.")
+            _registry.pop(uid, None)
+        except Exception as e:
+            logger.error(f"Error updating status for {entry[0]}: {e}")
+            _registry.pop(uid, None)
+    return needs_redraw
 
-    if not bpy.data or not bpy.data.objects:
-        logger.debug("No objects found to update statuses")
-        return False
 
-    # Iterate safely over object list copy
-    for obj in list(bpy.data.objects):
+def rebuild_registry():
+    """
+    Rebuilds the registry from the objects' export properties (after a
+    file load) and applies any transitions that are already due.
+
+    Returns:
+        bool: True if any object's status changed.
+    """
+    global _needs_rebuild
+    _needs_rebuild = False
+    clear_registry()
+    exported = []
+    for obj in bpy.data.objects:
         try:
-            if not (obj and obj.type == "MESH" and EXPORT_TIME_PROP in obj):
+            if obj.type != "MESH":
+                continue
+            if obj.get(EXPORT_STATUS_PROP) == ExportStatus.DIRTY.value:
+                _dirty[obj.session_uid] = obj.name
+                continue
+            if EXPORT_TIME_PROP not in obj:
                 continue
-
             export_time = obj.get(EXPORT_TIME_PROP, 0)
             if not export_time:
                 logger.warning(f"Object {obj.name} missing timestamp prop.")
                 continue
-
-            elapsed_time = current_time - export_time
-            old_status_val = obj.get(EXPORT_STATUS_PROP, 
-                                     ExportStatus.NONE.value)
-            old_status_name = (ExportStatus(old_status_val).name 
-                               if isinstance(old_status_val, int) 
-                               else "UNKNOWN")
-
-            new_status = ExportStatus.NONE
-            if elapsed_time < FRESH_DURATION_SECONDS:
-                new_status = ExportStatus.FRESH
-            elif elapsed_time < STALE_DURATION_SECONDS:
-                new_status = ExportStatus.STALE
-
-            new_status_val = new_status.value
-            
-            # Only log when there's a status change
-            if new_status_val != old_status_val:
-                status_changes.append((obj.name, old_status_name, 
-                                       new_status.name, elapsed_time))
-                needs_redraw = True
-                
-                # State transition logic
-                if new_status == ExportStatus.NONE:
-                    # Restores colour, removes original prop
-                    restore_object_colour(obj)
-                    # Remove remaining tracking props
-                    _delete_prop(obj, EXPORT_TIME_PROP)
-                    _delete_prop(obj, EXPORT_STATUS_PROP)
-                else:
-                    # Becoming FRESH or STALE: Set new status prop, then colour
-                    obj[EXPORT_STATUS_PROP] = new_status_val
-                    set_object_colour(obj)
-
+            exported.append((export_time, obj))
         except ReferenceError:
-            logger.debug("Object became invalid during status update loop.")
-            continue
-        except Exception as e:
-            obj_name = obj.name if obj and hasattr(obj, 'name') else 'N/A'
-            logger.error(f"Error updating status for object {obj_name}: {e}")
             continue
-    
-    # Log status changes together for easier debugging
-    if status_changes:
-        logger.info(f"Status changes detected: {len(status_changes)} "
-                    f"objects updated")
-        for change in status_changes:
-            name, old, new, elapsed = change
-            logger.info(f"  → {name}: {old} → {new} (elapsed: {elapsed:.1f}s)")
-    
-    return needs_redraw
+    exported.sort(key=lambda item: item[0])
+    for export_time, obj in exported:
+        register_exported_object(obj, export_time)
+    if _registry or _dirty:
+        logger.info(f"Export indicators: tracking {len(_registry)} "
+                    f"objects, {len(_dirty)} changed since export")
+    return process_due_transitions()
 
 
-def get_recently_exported_objects():
-    """Get a list of objects with active FRESH/STALE status, sorted."""
-    exported_objects = []
+def update_all_export_statuses():
+    """
+    Rescans all objects and updates their export status.
+    Returns True if any object's status changed, indicating a redraw is needed.
+    """
     if not bpy.data or not bpy.data.objects:
-        return []
+        logger.debug("No objects found to update statuses")
+        return False
+    return rebuild_registry()
 
-    for obj in bpy.data.objects:
-        try:
-            if (obj and obj.type == "MESH" and EXPORT_TIME_PROP in obj):
-                status = obj.get(EXPORT_STATUS_PROP, ExportStatus.NONE.value)
-                if status != ExportStatus.NONE.value:
-                    timestamp = obj.get(EXPORT_TIME_PROP, 0)
-                    exported_objects.append((obj, timestamp))
-        except ReferenceError:
-             continue # Object invalid
 
-    return sorted(exported_objects, key=lambda item: item[1], reverse=True)
+def get_recently_exported_objects(limit=None):
+    """
+    Get objects with active FRESH/STALE status, newest first.
+    Read from the registry, which mark_object_as_exported, the timer and
+    the clear operator keep up to date, so no objects are scanned or
+    sorted; the cost depends on limit only. Renamed objects are found by
+    session_uid and deleted ones are forgotten.
+
+    Args:
+        limit (int, optional): Maximum number of objects to return.
+
+    Returns:
+        list: (object, export time) tuples.
+    """
+    recent = []
+    deleted = []
+    for uid, (name, export_time) in reversed(_registry.items()):
+        if limit is not None and len(recent) >= limit:
+            break
+        obj = _find_object(uid, name)
+        if obj is None:
+            deleted.append(uid)
+            continue
+        recent.append((obj, export_time))
+    for uid in deleted:
+        del _registry[uid] # Its heap entry is skipped lazily
+    return recent
+
+
+def get_recent_export_count():
+    """Number of objects with an active FRESH/STALE status."""
+    return len(_registry)
 
 
 # --- Timer Logic ---
 
 def update_timer_callback():
-    """Function called periodically by Blender's timer."""
+    """
+    Applies due status transitions, then sleeps until the next one.
+    Unregisters itself (returns None) once nothing is pending.
+    """
+    global _scheduled_due, _in_timer
+    _scheduled_due = None
+    _in_timer = True
     try:
-        current_time = time.time()
-        logger.debug(f"[MESH_EXPORTER] Timer tick at {current_time}")
-        
-        status_updated = update_all_export_statuses()
+        if _needs_rebuild:
+            status_updated = rebuild_registry()
+        else:
+            status_updated = process_due_transitions()
         
         if status_updated:
-            # More aggressive UI updating
-            context = bpy.context
-            if (context 
-                and hasattr(context, "window_manager") 
-                and context.window_manager):
-                for window in context.window_manager.windows:
-                    if not hasattr(window, "screen") or not window.screen:
-                        continue
-                    for area in window.screen.areas:
-                        try:
-                            # Force update for all area types
-                            area.tag_redraw()
-                        except Exception as e:
-                            # Log potential errors during redraw 
-                            # without stopping timer
-                            logger.debug(f"Error redrawing area "
-                                         f"{area.type}: {e}")
-                            pass
-            else:
-                logger.warning("Timer callback couldn't redraw: "
-                               "invalid context")
+            _redraw_all_areas()
     except Exception as e:
         # Log but don't stop the timer
         logger.error(f"[MESH_EXPORTER] Timer error: {e}", exc_info=True)
-    
-    # Always return the interval to keep the timer running
-    return _TIMER_INTERVAL_SECONDS
+    finally:
+        _in_timer = False
+
+    if not _expiry_heap:
+        return None # Registered again by the next export
+    _scheduled_due = _expiry_heap[0][0]
+    return max(_scheduled_due - time.time(), _MIN_TIMER_INTERVAL_SECONDS)
+
+
+def _redraw_all_areas():
+    context = bpy.context
+    if not (context and getattr(context, "window_manager", None)):
+        logger.warning("Timer callback couldn't redraw: invalid context")
+        return
+    for window in context.window_manager.windows:
+        if not getattr(window, "screen", None):
+            continue
+        for area in window.screen.areas:
+            try:
+                area.tag_redraw()
+            except Exception as e:
+                # Log potential errors during redraw without stopping
+                logger.debug(f"Error redrawing area {area.type}: {e}")
+
+
+@bpy.app.handlers.persistent
+def _on_load_post(*args):
+    """Session uids change with a new file, so the registry is rebuilt."""
+    global _needs_rebuild
+    clear_registry()
+    _needs_rebuild = True
+    _schedule_timer(time.time())
+
+
+@bpy.app.handlers.persistent
+def _on_undo_redo(*args):
+    """
+    Undo and redo restore the export properties of earlier states, so
+    the registry is rebuilt from them.
+    """
+    global _needs_rebuild
+    _needs_rebuild = True
+    _schedule_timer(time.time())
 
 
 # --- Operators ---
@@ -457,6 +794,7 @@ class MESH_OT_clear_all_indicators(Operator):
                     logger.warning(f"Error clearing indicators "
                                    f"for {obj_name}: {e}")
 
+        clear_registry()
         msg = f"Cleared export indicators from {count} objects."
         self.report({"INFO"}, msg)
         logger.info(msg)
@@ -523,17 +861,21 @@ def register():
         except Exception as e:
             logger.warning(f"Failed to unregister existing timer: {e}")
 
-    # Now register a fresh timer with persistence
-    try:
-        bpy.app.timers.register(
-            update_timer_callback,
-            first_interval=_TIMER_INTERVAL_SECONDS,
-            persistent=True  # Make timer survive file loads
-        )
-        logger.info(f"Export indicator timer registered (interval: "
-                    f"{_TIMER_INTERVAL_SECONDS}s, persistent)")
-    except Exception as e:
-        logger.error(f"Failed to register timer: {e}", exc_info=True)
+    if _on_load_post not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_on_load_post)
+    if _on_depsgraph_update not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+    for handlers in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if _on_undo_redo not in handlers:
+            handlers.append(_on_undo_redo)
+
+    # bpy.data isn't accessible during registration; the first timer run
+    # builds the registry and then sleeps until the next transition
+    global _needs_rebuild, _scheduled_due
+    _needs_rebuild = True
+    _scheduled_due = None
+    _schedule_timer(time.time())
+    logger.info("Export indicator timer registered (expiry scheduled)")
 
 
 def unregister():
@@ -546,6 +888,17 @@ def unregister():
             logger.info("Export indicator timer unregistered.")
         except Exception as e:
             logger.error(f"Failed to unregister timer: {e}")
+    if _on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post)
+    if _on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+    for handlers in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if _on_undo_redo in handlers:
+            handlers.remove(_on_undo_redo)
+    for timer in (_apply_pending_dirty, _resume_tracking):
+        if bpy.app.timers.is_registered(timer):
+            bpy.app.timers.unregister(timer)
+    clear_registry()
 
     # No longer restoring viewport settings automatically
 
@@ -0,0 +1,217 @@
+# export_journal.py
+"""
+Crash-safe batch journal and atomic output files.
+
+Every batch appends one JSON line per finished object to a journal in
+the export directory, flushed to disk right away, with its output files
+and fingerprint. A batch that never wrote its end record (Blender
+crashed or the batch was cancelled) can be resumed: objects whose
+journal entry still matches their fingerprint and whose files exist are
+skipped.
+
+Exporters write into a per-process staging directory inside the export
+directory; finished files are then moved into place with os.replace, so
+a crash never leaves a half-written file under its final name.
+"""
+
+import os
+import json
+import time
+import shutil
+import logging
+
+# --- Setup Logger ---
+logger = logging.getLogger(__name__)
+if not logger.handlers:
+    handler = logging.StreamHandler()
+    formatter = logging.Formatter("%(name)s:%(levelname)s: %(message)s")
+    handler.setFormatter(formatter)
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)  # Default level
+
+# --- Constants ---
+JOURNAL_NAME = ".easymesh_journal.jsonl"
+JOURNAL_VERSION = 1
+STAGING_DIR_NAME = ".easymesh_staging"
+
+# (journal path, mtime, size) → pending state, for panel redraws
+_state_cache = {}
+
+
+# --- Atomic Output ---
+
+
+def get_staging_dir(export_dir):
+    """
+    Returns an empty staging directory for one export of this process.
+    Files keep their final names inside it, so references between them
+    (.mtl, .bin, textures) stay valid once they are moved.
+    """
+    staging_dir = os.path.join(export_dir, STAGING_DIR_NAME,
+                               str(os.getpid()))
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    os.makedirs(staging_dir, exist_ok=True)
+    return staging_dir
+
+
+def commit_staged_files(staging_dir, export_dir, main_file):
+    """
+    Moves every file written to staging_dir into export_dir, keeping
+    relative paths. main_file is moved last, so it only appears once all
+    files it references are in place.
+
+    Returns:
+        list: Final paths of the moved files.
+    """
+    staged = []
+    for root, _, names in os.walk(staging_dir):
+        for name in names:
+            path = os.path.join(root, name)
+            staged.append((path == main_file, path))
+    moved = []
+    for _, path in sorted(staged):
+        target = os.path.join(export_dir,
+                              os.path.relpath(path, staging_dir))
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        os.replace(path, target)
+        moved.append(target)
+    return moved
+
+
+def remove_staging_dir(staging_dir):
+    """Removes a staging directory and anything left in it."""
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    try:
+        # Drop the shared parent once no process uses it any more
+        os.rmdir(os.path.dirname(staging_dir))
+    except OSError:
+        pass
+
+
+# --- Journal ---
+
+
+class ExportJournal:
+    """Append-only record of one batch's finished objects."""
+
+    def __init__(self, export_dir):
+        self.path = os.path.join(export_dir, JOURNAL_NAME)
+        self.header = None
+        # {object name: last record}
+        self.finished = {}
+        self.complete = False
+
+    def load(self):
+        """
+        Reads the journal. A truncated last line (crash while writing)
+        is ignored.
+        """
+        self.header = None
+        self.finished = {}
+        self.complete = False
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    self._apply(record)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Could not read export journal: {e}")
+        if self.header and self.header.get("version") != JOURNAL_VERSION:
+            self.header = None
+        return self
+
+    def _apply(self, record):
+        kind = record.get("type")
+        if kind == "batch":
+            self.header = record
+            self.finished = {}
+            self.complete = False
+        elif kind == "object":
+            self.finished[record["object"]] = record
+        elif kind == "end":
+            self.complete = True
+
+    def _append(self, record):
+        try:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError as e:
+            logger.error(f"Could not write export journal: {e}")
+            return
+        self._apply(record)
+
+    def start(self, object_names, settings_dict):
+        """Starts a new batch, replacing the previous journal."""
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+        self._append({
+            "type": "batch",
+            "version": JOURNAL_VERSION,
+            "started": time.time(),
+            "objects": list(object_names),
+            "settings": settings_dict,
+        })
+
+    def record(self, object_name, files, fingerprint):
+        """Records a successfully exported object."""
+        self._append({
+            "type": "object",
+            "object": object_name,
+            "files": list(files),
+            "fingerprint": fingerprint,
+        })
+
+    def end(self):
+        """Marks the batch as complete, so it is no longer resumable."""
+        self._append({"type": "end", "finished": time.time()})
+
+    @property
+    def resumable(self):
+        return self.header is not None and not self.complete
+
+    def is_finished(self, object_name, fingerprint):
+        """
+        True if object_name was exported with this fingerprint in the
+        journaled batch and all of its files still exist.
+        """
+        record = self.finished.get(object_name)
+        if not record or record.get("fingerprint") != fingerprint:
+            return False
+        files = record.get("files", [])
+        return bool(files) and all(os.path.isfile(f) for f in files)
+
+    def pending_names(self):
+        """Names of the batch's objects without a finished record."""
+        if self.header is None:
+            return []
+        return [name for name in self.header["objects"]
+                if name not in self.finished]
+
+
+def get_pending_count(export_dir):
+    """
+    Returns how many objects of an unfinished batch in export_dir have
+    no finished record, or 0 if there is nothing to resume. Cached by the
+    journal's modification time, as the panel calls it on every redraw.
+    """
+    path = os.path.join(export_dir, JOURNAL_NAME)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return 0
+    key = (path, stat.st_mtime, stat.st_size)
+    if key not in _state_cache:
+        _state_cache.clear()
+        journal = ExportJournal(export_dir).load()
+        _state_cache[key] = (len(journal.pending_names())
+                             if journal.resumable else 0)
+    return _state_cache[key]
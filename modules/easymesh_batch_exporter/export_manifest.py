@@ -0,0 +1,399 @@
+# export_manifest.py
+"""
+Content fingerprints and the on-disk export manifest used for
+incremental export.
+
+A fingerprint covers everything that influences an object's exported
+files: mesh data (read in bulk with foreach_get), the modifier stack
+with its geometry nodes inputs and the objects its modifiers read,
+material node trees, the object transform and the relevant exporter
+settings.
+The manifest, stored in the export directory, maps each original object
+to the fingerprint it was last exported with and the files written.
+"""
+
+import bpy
+import os
+import json
+import hashlib
+import logging
+import numpy as np
+
+# --- Setup Logger ---
+logger = logging.getLogger(__name__)
+if not logger.handlers:
+    handler = logging.StreamHandler()
+    formatter = logging.Formatter("%(name)s:%(levelname)s: %(message)s")
+    handler.setFormatter(formatter)
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)  # Default level
+
+# --- Constants ---
+MANIFEST_NAME = ".easymesh_manifest.json"
+MANIFEST_VERSION = 2
+
+# Settings that don't change the exported files
+NON_OUTPUT_SETTINGS = {
+    "mesh_export_path",
+    "mesh_export_parallel",
+    "mesh_export_parallel_workers",
+    "mesh_export_incremental",
+    "mesh_export_decimate_cache",
+    "mesh_export_decimate_cache_mb",
+    "mesh_export_texture_cache_mb",
+    "mesh_export_bounded_memory",
+    "mesh_export_purge_interval",
+    "mesh_export_history",
+    "mesh_export_history_object",
+    "mesh_export_history_format",
+    "mesh_export_history_since",
+}
+
+# Attribute data type → (foreach key, components, numpy dtype)
+ATTRIBUTE_LAYOUTS = {
+    "FLOAT": ("value", 1, np.float32),
+    "INT": ("value", 1, np.int32),
+    "INT8": ("value", 1, np.int32),
+    "BOOLEAN": ("value", 1, bool),
+    "FLOAT2": ("vector", 2, np.float32),
+    "INT32_2D": ("value", 2, np.int32),
+    "FLOAT_VECTOR": ("vector", 3, np.float32),
+    "FLOAT_COLOR": ("color", 4, np.float32),
+    "BYTE_COLOR": ("color", 4, np.float32),
+    "QUATERNION": ("value", 4, np.float32),
+}
+
+# Node properties that only affect the node editor
+NODE_UI_PROPERTIES = {"name", "label", "location", "width", "width_hidden",
+                      "height", "dimensions", "select", "hide", "mute",
+                      "show_options", "show_preview", "show_texture",
+                      "use_custom_color", "color", "parent"}
+
+# Modifier properties that only affect the modifier panel, edit mode or
+# rendering, not the exported (viewport) result
+MODIFIER_UI_PROPERTIES = {"name", "show_expanded", "is_active",
+                          "show_on_cage", "show_in_editmode", "show_render",
+                          "is_override_data", "execution_time",
+                          "persistent_uid"}
+
+
+# --- Fingerprints ---
+
+
+def _hash_array(hasher, collection, key, length, dtype):
+    """Reads one property of a collection in bulk and feeds it to hasher."""
+    values = np.empty(length, dtype=dtype)
+    if length:
+        collection.foreach_get(key, values)
+    hasher.update(key.encode())
+    hasher.update(values.tobytes())
+
+
+def hash_mesh_data(mesh, hasher):
+    """
+    Feeds a mesh's topology and attribute arrays to a hashlib hasher.
+
+    Args:
+        mesh (bpy.types.Mesh): The mesh to hash.
+        hasher: A hashlib hash object.
+
+    Returns:
+        None
+    """
+    hasher.update(f"{len(mesh.vertices)}/{len(mesh.edges)}/"
+                  f"{len(mesh.loops)}/{len(mesh.polygons)}".encode())
+    _hash_array(hasher, mesh.vertices, "co", len(mesh.vertices) * 3,
+                np.float32)
+    _hash_array(hasher, mesh.edges, "vertices", len(mesh.edges) * 2,
+                np.int32)
+    _hash_array(hasher, mesh.loops, "vertex_index", len(mesh.loops),
+                np.int32)
+    _hash_array(hasher, mesh.polygons, "loop_start", len(mesh.polygons),
+                np.int32)
+
+    # Generic attributes: UVs, colours, material indices, sharp flags...
+    # Internal (".") attributes such as selection state are ignored.
+    for attr in sorted(mesh.attributes, key=lambda a: a.name):
+        if attr.name.startswith(".") or attr.name == "position":
+            continue
+        layout = ATTRIBUTE_LAYOUTS.get(attr.data_type)
+        if layout is None:
+            continue
+        key, components, dtype = layout
+        hasher.update(f"{attr.name}:{attr.domain}:{attr.data_type}".encode())
+        _hash_array(hasher, attr.data, key, len(attr.data) * components,
+                    dtype)
+
+    if mesh.has_custom_normals:
+        _hash_array(hasher, mesh.corner_normals, "vector",
+                    len(mesh.corner_normals) * 3, np.float32)
+    if mesh.shape_keys:
+        for key_block in mesh.shape_keys.key_blocks:
+            hasher.update(f"key:{key_block.name}:{key_block.value}".encode())
+            _hash_array(hasher, key_block.data, "co",
+                        len(key_block.data) * 3, np.float32)
+
+
+def _rna_value(value):
+    """Converts an RNA property value to a stable string."""
+    if isinstance(value, bpy.types.ID):
+        return f"ID:{value.name}"
+    if hasattr(value, "__len__") and not isinstance(value, str):
+        try:
+            return repr(tuple(value))
+        except TypeError:
+            return ""
+    return repr(value)
+
+
+def _idprop_value(value):
+    """Converts an ID property value (e.g. a geometry nodes input)."""
+    if isinstance(value, bpy.types.ID):
+        return f"ID:{value.name}"
+    if hasattr(value, "to_dict"):
+        return repr(sorted(value.to_dict().items()))
+    if hasattr(value, "to_list"):
+        return repr(value.to_list())
+    return repr(value)
+
+
+def _hash_rna_struct(struct, hasher, skip=()):
+    """Feeds the simple (non-collection) RNA properties of struct."""
+    for prop in struct.bl_rna.properties:
+        if (prop.identifier == "rna_type" or prop.type == "COLLECTION"
+                or prop.identifier in skip):
+            continue
+        if prop.type == "POINTER" and not isinstance(
+                getattr(struct, prop.identifier, None), bpy.types.ID):
+            continue
+        try:
+            value = getattr(struct, prop.identifier)
+        except AttributeError:
+            continue
+        hasher.update(f"{prop.identifier}={_rna_value(value)};".encode())
+
+
+def _hash_node_tree(tree, hasher, visited=None):
+    """
+    Feeds a node tree: node settings, unlinked input values, links, and
+    the images and nested groups the nodes use.
+    """
+    if visited is None:
+        visited = set()
+    if tree.as_pointer() in visited:
+        return
+    visited.add(tree.as_pointer())
+    hasher.update(f"tree:{tree.name}".encode())
+    for node in sorted(tree.nodes, key=lambda n: n.name):
+        hasher.update(f"node:{node.name}:{node.bl_idname}:".encode())
+        _hash_rna_struct(node, hasher, NODE_UI_PROPERTIES)
+        for socket in node.inputs:
+            if not socket.is_linked and hasattr(socket, "default_value"):
+                hasher.update(f"in:{socket.identifier}="
+                              f"{_rna_value(socket.default_value)};".encode())
+        image = getattr(node, "image", None)
+        if image is not None:
+            hasher.update(f"img:{image.name}:{image.filepath}".encode())
+        if getattr(node, "node_tree", None) is not None:
+            _hash_node_tree(node.node_tree, hasher, visited)
+    for link in tree.links:
+        hasher.update(f"link:{link.from_node.name}:"
+                      f"{link.from_socket.identifier}>{link.to_node.name}:"
+                      f"{link.to_socket.identifier}".encode())
+
+
+def _hash_materials(obj, hasher):
+    """Feeds assigned materials and their node trees."""
+    for slot in obj.material_slots:
+        mat = slot.material
+        hasher.update(f"slot:{slot.link}:"
+                      f"{mat.name if mat else ''}".encode())
+        if mat and mat.node_tree:
+            _hash_node_tree(mat.node_tree, hasher)
+
+
+def get_mesh_digest(mesh, mesh_cache=None):
+    """
+    Returns the digest of hash_mesh_data for mesh.
+
+    Args:
+        mesh (bpy.types.Mesh): The mesh to hash.
+        mesh_cache (dict, optional): {mesh pointer: digest}, so meshes
+            shared by several objects are only hashed once.
+    """
+    mesh_key = mesh.as_pointer()
+    mesh_digest = mesh_cache.get(mesh_key) if mesh_cache is not None else None
+    if mesh_digest is None:
+        mesh_hasher = hashlib.blake2b(digest_size=16)
+        hash_mesh_data(mesh, mesh_hasher)
+        mesh_digest = mesh_hasher.hexdigest()
+        if mesh_cache is not None:
+            mesh_cache[mesh_key] = mesh_digest
+    return mesh_digest
+
+
+def get_modifier_references(modifier):
+    """
+    Returns the IDs a modifier reads: object/collection/node group
+    pointers and ID-valued geometry nodes inputs.
+    """
+    references = []
+    for prop in modifier.bl_rna.properties:
+        if prop.type == "POINTER":
+            value = getattr(modifier, prop.identifier, None)
+            if isinstance(value, bpy.types.ID):
+                references.append(value)
+    for key in modifier.keys():
+        value = modifier[key]
+        if isinstance(value, bpy.types.ID):
+            references.append(value)
+    return references
+
+
+def _hash_referenced_object(obj, target, hasher, mesh_cache):
+    """
+    Feeds an object a modifier of obj reads: its transform relative to
+    obj, which is what the modifier sees, and its mesh.
+    """
+    relative = obj.matrix_world.inverted_safe() @ target.matrix_world
+    hasher.update(f"ref:{target.name}:"
+                  f"{[tuple(row) for row in relative]!r}".encode())
+    if target.type == "MESH" and target.data is not None:
+        hasher.update(get_mesh_digest(target.data, mesh_cache).encode())
+
+
+def _hash_modifiers(obj, hasher, mesh_cache):
+    """
+    Feeds the modifier stack: RNA settings, geometry nodes inputs (ID
+    properties) and the node groups and objects the modifiers read.
+    """
+    for modifier in obj.modifiers:
+        hasher.update(f"mod:{modifier.type}:".encode())
+        _hash_rna_struct(modifier, hasher, MODIFIER_UI_PROPERTIES)
+        for key in sorted(modifier.keys()):
+            hasher.update(f"{key}={_idprop_value(modifier[key])};".encode())
+        for ref in get_modifier_references(modifier):
+            if isinstance(ref, bpy.types.Object):
+                _hash_referenced_object(obj, ref, hasher, mesh_cache)
+            elif isinstance(ref, bpy.types.Collection):
+                for target in sorted(ref.all_objects, key=lambda o: o.name):
+                    _hash_referenced_object(obj, target, hasher, mesh_cache)
+            elif isinstance(ref, bpy.types.NodeTree):
+                _hash_node_tree(ref, hasher)
+
+
+def fingerprint_settings(settings_dict):
+    """
+    Returns a hash of the exporter settings that affect the output.
+
+    Args:
+        settings_dict (dict): Settings from properties.settings_as_dict.
+
+    Returns:
+        str: Hex digest.
+    """
+    relevant = {key: value for key, value in settings_dict.items()
+                if key not in NON_OUTPUT_SETTINGS}
+    return hashlib.blake2b(
+        json.dumps(relevant, sort_keys=True).encode(), digest_size=16
+    ).hexdigest()
+
+
+def fingerprint_object(obj, settings_hash, mesh_cache=None,
+                       include_location=True):
+    """
+    Returns a fingerprint covering everything that determines the files
+    exported for obj.
+
+    Args:
+        obj (bpy.types.Object): The original mesh object.
+        settings_hash (str): Result of fingerprint_settings.
+        mesh_cache (dict, optional): {mesh pointer: digest}, so meshes
+            shared by several objects are only hashed once.
+        include_location (bool): Whether the object location is covered.
+            Rotation and scale always are, as they are baked into the mesh.
+
+    Returns:
+        str: Hex digest.
+    """
+    mesh_digest = get_mesh_digest(obj.data, mesh_cache)
+
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(f"v{MANIFEST_VERSION}:{settings_hash}:"
+                  f"{mesh_digest}".encode())
+    _hash_modifiers(obj, hasher, mesh_cache)
+    _hash_materials(obj, hasher)
+    matrix = obj.matrix_basis if include_location \
+        else obj.matrix_basis.to_3x3()
+    hasher.update(repr([tuple(row) for row in matrix]).encode())
+    hasher.update(repr([group.name for group in obj.vertex_groups]).encode())
+    # Collection triangle budgets drive "Budget %" LOD targets
+    hasher.update(repr([getattr(coll, "mesh_export_tri_budget", 0)
+                        for coll in obj.users_collection]).encode())
+    return hasher.hexdigest()
+
+
+# --- Manifest ---
+
+
+class ExportManifest:
+    """Records the fingerprint and output files of each exported object."""
+
+    def __init__(self, export_dir):
+        self.path = os.path.join(export_dir, MANIFEST_NAME)
+        self.entries = {}
+        self.dirty = False
+
+    def load(self):
+        """Loads the manifest; a missing or invalid file gives no entries."""
+        self.entries = {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == MANIFEST_VERSION:
+                self.entries = data.get("entries", {})
+            else:
+                logger.info("Export manifest version changed, ignoring it.")
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read export manifest: {e}")
+        return self
+
+    def save(self):
+        """Writes the manifest atomically if it changed."""
+        if not self.dirty:
+            return
+        temp_path = f"{self.path}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": MANIFEST_VERSION,
+                           "entries": self.entries}, f, indent=1)
+            os.replace(temp_path, self.path)
+            self.dirty = False
+        except OSError as e:
+            logger.error(f"Could not write export manifest: {e}")
+
+    def is_up_to_date(self, object_name, fingerprint):
+        """
+        True if object_name was exported with this fingerprint and all of
+        its output files still exist.
+        """
+        entry = self.entries.get(object_name)
+        if not entry or entry.get("fingerprint") != fingerprint:
+            return False
+        files = entry.get("files", [])
+        return bool(files) and all(os.path.isfile(f) for f in files)
+
+    def update(self, object_name, fingerprint, files):
+        """Records a successful export."""
+        self.entries[object_name] = {
+            "fingerprint": fingerprint,
+            "files": list(files),
+        }
+        self.dirty = True
+
+    def remove(self, object_name):
+        """Forgets an object, e.g. after a failed export."""
+        if self.entries.pop(object_name, None) is not None:
+            self.dirty = True
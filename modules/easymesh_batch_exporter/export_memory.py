@@ -0,0 +1,251 @@
+# export_memory.py
+"""
+Memory tracking and orphan purging for long batches.
+
+Decimation, triangulation, texture levels and the exporters themselves
+can leave unused datablocks behind. In bounded-memory mode, datablocks
+the batch created that no longer have users are removed every few
+objects. session_uids only grow, so the batch records the uid range of
+each stretch of its own work; a modal batch only works during its ticks,
+and datablocks the user creates between them are never purged.
+Process RSS is sampled per object and datablock counts are compared
+before and after the batch to detect leaks.
+"""
+
+import bpy
+import os
+import sys
+import logging
+
+# --- Setup Logger ---
+logger = logging.getLogger(__name__)
+if not logger.handlers:
+    handler = logging.StreamHandler()
+    formatter = logging.Formatter("%(name)s:%(levelname)s: %(message)s")
+    handler.setFormatter(formatter)
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)  # Default level
+
+# --- Constants ---
+# bpy.data collections that are counted for leak reports
+COUNTED_DATA = ("objects", "meshes", "materials", "images", "textures",
+                "node_groups", "actions", "collections", "scenes")
+# Collections orphans are purged from, in dependency order: removing a
+# mesh can leave its materials unused, and those their images
+PURGED_DATA = ("meshes", "materials", "node_groups", "textures", "images")
+
+
+# --- Process Memory ---
+
+
+def get_rss_bytes():
+    """Current resident set size of this process, or None if unknown."""
+    if sys.platform.startswith("linux"):
+        try:
+            with open("/proc/self/statm") as f:
+                pages = int(f.read().split()[1])
+            return pages * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError, IndexError):
+            return None
+    if sys.platform == "win32":
+        counters = _windows_memory_counters()
+        return counters.WorkingSetSize if counters else None
+    return None
+
+
+def get_peak_rss_bytes():
+    """Peak resident set size over the process lifetime, or None."""
+    if sys.platform == "win32":
+        counters = _windows_memory_counters()
+        return counters.PeakWorkingSetSize if counters else None
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _windows_memory_counters():
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [
+                ("cb", wintypes.DWORD),
+                ("PageFaultCount", wintypes.DWORD),
+                ("PeakWorkingSetSize", ctypes.c_size_t),
+                ("WorkingSetSize", ctypes.c_size_t),
+                ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                ("PagefileUsage", ctypes.c_size_t),
+                ("PeakPagefileUsage", ctypes.c_size_t),
+            ]
+
+        counters = PROCESS_MEMORY_COUNTERS()
+        counters.cb = ctypes.sizeof(counters)
+        process = ctypes.windll.kernel32.GetCurrentProcess()
+        if ctypes.windll.psapi.GetProcessMemoryInfo(
+                process, ctypes.byref(counters), counters.cb):
+            return counters
+    except (AttributeError, OSError):
+        pass
+    return None
+
+
+def format_bytes(size):
+    """Formats a byte count as MB, or '?' if unknown."""
+    return "?" if size is None else f"{size / 2**20:.0f} MB"
+
+
+# --- Datablocks ---
+
+
+def datablock_counts():
+    """Returns {bpy.data collection name: number of datablocks}."""
+    return {name: len(getattr(bpy.data, name)) for name in COUNTED_DATA}
+
+
+def max_session_uid():
+    """Highest session_uid of the purgeable datablocks."""
+    return max((id_data.session_uid for name in PURGED_DATA
+                for id_data in getattr(bpy.data, name)), default=0)
+
+
+def _in_ranges(uid, uid_ranges):
+    return any(low < uid and (high is None or uid <= high)
+               for low, high in uid_ranges)
+
+
+def purge_orphans(uid_ranges, keep=()):
+    """
+    Removes unused datablocks whose session_uid lies in one of
+    uid_ranges. Datablocks outside them, with a fake user or in keep are
+    never touched.
+
+    Args:
+        uid_ranges (list): (low, high) session_uid ranges, exclusive of
+            low; high None means no upper bound.
+        keep (iterable): Datablocks to keep even if unused.
+
+    Returns:
+        int: Number of removed datablocks.
+    """
+    keep_uids = set()
+    for id_data in keep:
+        try:
+            keep_uids.add(id_data.session_uid)
+        except ReferenceError:
+            pass # Already removed
+    removed = 0
+    for name in PURGED_DATA:
+        orphans = [
+            id_data for id_data in getattr(bpy.data, name)
+            if id_data.users == 0 and not id_data.use_fake_user
+            and id_data.session_uid not in keep_uids
+            and _in_ranges(id_data.session_uid, uid_ranges)
+        ]
+        if orphans:
+            bpy.data.batch_remove(orphans)
+            removed += len(orphans)
+    return removed
+
+
+class MemoryMonitor:
+    """
+    Tracks RSS and datablock counts over one batch and, if
+    purge_interval is set, purges the batch's orphans every
+    purge_interval objects.
+
+    The batch's work starts with the monitor. A batch that lets the user
+    work in between brackets its own work with end_work and begin_work,
+    so only datablocks created inside those brackets are purged.
+    """
+
+    def __init__(self, purge_interval=0):
+        self.purge_interval = purge_interval
+        self.start_counts = datablock_counts()
+        self.end_counts = None
+        # Closed (low, high] session_uid ranges of the batch's work
+        self.work_ranges = []
+        # Lower bound of the current work, None between works
+        self.work_start = max_session_uid() if purge_interval else 0
+        self.start_rss = get_rss_bytes()
+        self.peak_rss = self.start_rss
+        self.end_rss = None
+        self.objects_done = 0
+        self.purged = 0
+
+    def sample(self):
+        rss = get_rss_bytes()
+        if rss is not None:
+            self.peak_rss = max(self.peak_rss or 0, rss)
+
+    def begin_work(self):
+        """Marks the start of the batch's own work, e.g. a modal tick."""
+        if self.purge_interval and self.work_start is None:
+            self.work_start = max_session_uid()
+
+    def end_work(self):
+        """Marks the end of the batch's own work, e.g. a modal tick."""
+        if self.work_start is None:
+            return
+        if self.purge_interval:
+            high = max_session_uid()
+            if self.work_ranges and self.work_ranges[-1][1] == \
+                    self.work_start:
+                # Nothing was created in between, extend the last range
+                self.work_ranges[-1] = (self.work_ranges[-1][0], high)
+            elif high > self.work_start:
+                self.work_ranges.append((self.work_start, high))
+        self.work_start = None
+
+    def _uid_ranges(self):
+        if self.work_start is None:
+            return self.work_ranges
+        return self.work_ranges + [(self.work_start, None)]
+
+    def object_done(self, keep=()):
+        """Call after each object; purges every purge_interval objects."""
+        self.objects_done += 1
+        self.sample()
+        if self.purge_interval and \
+                self.objects_done % self.purge_interval == 0:
+            self.purge(keep)
+
+    def purge(self, keep=()):
+        removed = purge_orphans(self._uid_ranges(), keep)
+        if removed:
+            self.purged += removed
+            logger.info(f"Purged {removed} orphan datablocks after "
+                        f"{self.objects_done} objects.")
+
+    def finish(self, keep=()):
+        """Final purge and measurement once temporary data is gone."""
+        if self.purge_interval:
+            self.purge(keep)
+        self.sample()
+        self.end_rss = get_rss_bytes()
+        self.end_counts = datablock_counts()
+
+    def leaks(self):
+        """Returns {collection name: datablocks gained during the batch}."""
+        if self.end_counts is None:
+            return {}
+        return {name: self.end_counts[name] - count
+                for name, count in self.start_counts.items()
+                if self.end_counts[name] > count}
+
+    def summary(self):
+        """One-line RSS summary for reports."""
+        peak = self.peak_rss
+        process_peak = get_peak_rss_bytes()
+        if peak is None:
+            peak = process_peak
+        return (f"RSS {format_bytes(self.start_rss)} → "
+                f"{format_bytes(self.end_rss)}, peak {format_bytes(peak)}"
+                + (f", purged {self.purged} orphans" if self.purged else ""))
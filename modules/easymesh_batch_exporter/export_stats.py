@@ -0,0 +1,235 @@
+# export_stats.py
+"""
+Per-stage timing instrumentation for the batch exporter.
+
+Every pipeline stage (copy, setup, modifiers, decimate, textures,
+triangulate, export, cleanup) is timed per object and per LOD together with its
+input/output polygon counts. The records of the last batch are kept for
+the statistics panel and can be dumped as CSV or JSON.
+"""
+
+import bpy
+import os
+import csv
+import json
+import time
+import contextlib
+import logging
+from bpy.types import Operator
+from bpy.props import EnumProperty
+
+# --- Setup Logger ---
+logger = logging.getLogger(__name__)
+if not logger.handlers:
+    handler = logging.StreamHandler()
+    formatter = logging.Formatter("%(name)s:%(levelname)s: %(message)s")
+    handler.setFormatter(formatter)
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)  # Default level
+
+# --- Constants ---
+STAGES = (
+    "create_export_copy",
+    "setup_export_object",
+    "apply_mesh_modifiers",
+    "apply_decimate_modifier",
+    "compress_textures",
+    "triangulate_mesh",
+    "export_object",
+    "cleanup_object",
+)
+RECORD_FIELDS = ("object", "lod", "stage", "seconds",
+                 "polys_in", "polys_out")
+
+# Stats of the last finished batch, shown in the panel
+_last_batch_stats = None
+
+
+# --- Recording ---
+
+
+def _poly_count(obj):
+    """Polygon count of obj's mesh, 0 if obj is gone or not a mesh."""
+    try:
+        if obj is not None and obj.type == "MESH":
+            return len(obj.data.polygons)
+    except ReferenceError:
+        pass
+    return 0
+
+
+class StageTimer:
+    """Handle yielded by timed_stage; reassign obj if the stage
+    replaces the object whose output polygons should be counted."""
+
+    def __init__(self, obj):
+        self.obj = obj
+
+
+@contextlib.contextmanager
+def timed_stage(records, stage, object_name, lod_level=None, obj=None):
+    """
+    Times one pipeline stage and appends a record to records.
+
+    Args:
+        records (list): Record list to append to (None disables timing).
+        stage (str): Stage name, one of STAGES.
+        object_name (str): Name of the original object.
+        lod_level (int, optional): LOD level, None for the prepared base.
+        obj (bpy.types.Object, optional): Object the stage works on.
+
+    Yields:
+        StageTimer: Handle whose obj is counted for polys_out.
+    """
+    timer = StageTimer(obj)
+    if records is None:
+        yield timer
+        return
+    polys_in = _poly_count(obj)
+    start = time.perf_counter()
+    try:
+        yield timer
+    finally:
+        records.append((
+            object_name, lod_level, stage, time.perf_counter() - start,
+            polys_in, _poly_count(timer.obj),
+        ))
+
+
+class ExportStats:
+    """Stage records of one batch with aggregation and dumping."""
+
+    def __init__(self):
+        self.records = []
+        self.export_dir = ""
+        self.finished_at = None
+        # See export_memory.MemoryMonitor.summary
+        self.memory_summary = ""
+        # Decimation cache lookups, see decimation_cache.DecimationCache
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def extend(self, records):
+        self.records.extend(tuple(record) for record in records)
+
+    def stage_table(self):
+        """
+        Aggregates records per stage.
+
+        Returns:
+            list: (stage, calls, total s, mean s, max s,
+                   polys in, polys out) in pipeline order.
+        """
+        table = {}
+        for _, _, stage, seconds, polys_in, polys_out in self.records:
+            row = table.setdefault(stage, [0, 0.0, 0.0, 0, 0])
+            row[0] += 1
+            row[1] += seconds
+            row[2] = max(row[2], seconds)
+            row[3] += polys_in
+            row[4] += polys_out
+        order = {stage: index for index, stage in enumerate(STAGES)}
+        return [
+            (stage, calls, total, total / calls, peak, p_in, p_out)
+            for stage, (calls, total, peak, p_in, p_out)
+            in sorted(table.items(), key=lambda item:
+                      order.get(item[0], len(order)))
+        ]
+
+    def slowest_objects(self, limit=5):
+        """Returns [(object name, total seconds)] of the slowest objects."""
+        totals = {}
+        for name, _, _, seconds, _, _ in self.records:
+            totals[name] = totals.get(name, 0.0) + seconds
+        return sorted(totals.items(), key=lambda item: item[1],
+                      reverse=True)[:limit]
+
+    @property
+    def total_seconds(self):
+        return sum(record[3] for record in self.records)
+
+    def dump(self, directory, file_format="CSV"):
+        """
+        Writes all records to a timestamped CSV or JSON file.
+
+        Returns:
+            str: The written file path.
+        """
+        stamp = time.strftime("%Y%m%d_%H%M%S",
+                              time.localtime(self.finished_at or time.time()))
+        ext = "json" if file_format == "JSON" else "csv"
+        path = os.path.join(directory, f"export_stats_{stamp}.{ext}")
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            if file_format == "JSON":
+                json.dump({
+                    "records": [dict(zip(RECORD_FIELDS, record))
+                                for record in self.records],
+                    "stages": [dict(zip(("stage", "calls", "total", "mean",
+                                         "max", "polys_in", "polys_out"),
+                                        row))
+                               for row in self.stage_table()],
+                }, f, indent=1)
+            else:
+                writer = csv.writer(f)
+                writer.writerow(RECORD_FIELDS)
+                for record in self.records:
+                    writer.writerow(
+                        ["" if value is None else value for value in record]
+                    )
+        return path
+
+
+def set_last_batch_stats(stats):
+    """Stores the stats of the batch that just finished."""
+    global _last_batch_stats
+    stats.finished_at = time.time()
+    _last_batch_stats = stats
+
+
+def get_last_batch_stats():
+    """Returns the stats of the last batch, or None."""
+    return _last_batch_stats
+
+
+# --- Operators ---
+
+
+class MESH_OT_dump_export_stats(Operator):
+    """Writes the last batch's stage timings next to the exported files"""
+    bl_idname = "mesh.dump_export_stats"
+    bl_label = "Save Export Timings"
+    bl_options = {"REGISTER"}
+
+    file_format: EnumProperty(
+        name="Format",
+        items=[
+            ("CSV", "CSV", "One row per stage record"),
+            ("JSON", "JSON", "Records and aggregated stage table"),
+        ],
+        default="CSV",
+    )
+
+    @classmethod
+    def poll(cls, context):
+        stats = get_last_batch_stats()
+        return stats is not None and bool(stats.records)
+
+    def execute(self, context):
+        stats = get_last_batch_stats()
+        directory = stats.export_dir or bpy.path.abspath(
+            context.scene.mesh_exporter.mesh_export_path
+        )
+        try:
+            os.makedirs(directory, exist_ok=True)
+            path = stats.dump(directory, self.file_format)
+        except OSError as e:
+            self.report({"ERROR"}, f"Could not write timings: {e}")
+            return {"CANCELLED"}
+        self.report({"INFO"}, f"Saved export timings to {path}")
+        logger.info(f"Saved export timings to {path}")
+        return {"FINISHED"}
+
+
+classes = (
+    MESH_OT_dump_export_stats,
+)
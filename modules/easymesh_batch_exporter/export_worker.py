@@ -0,0 +1,31 @@
+# export_worker.py
+"""
+Bootstrap script for parallel export workers.
+Started by parallel_export as:
+    blender -b snapshot.blend --python export_worker.py -- job.json
+Puts the add-on package on sys.path and hands over to run_worker.
+"""
+
+import sys
+import json
+import importlib
+
+
+def main():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    if not argv:
+        raise SystemExit("export_worker: no job file given")
+    job_path = argv[0]
+    with open(job_path, encoding="utf-8") as f:
+        job = json.load(f)
+    if job["package_root"] not in sys.path:
+        sys.path.insert(0, job["package_root"])
+    parallel_export = importlib.import_module(
+        f"{job['package']}.parallel_export"
+    )
+    exit_code = parallel_export.run_worker(job_path)
+    if exit_code:
+        raise SystemExit(exit_code)
+
+
+main()
@@ -8,13 +8,29 @@ texture compression, and cleanup of temporary objects.
 import bpy
 import os
 import time
-import contextlib
 import re
 import math
 import logging
+import sqlite3
+import shutil
+import collections
+from types import SimpleNamespace
 from bpy.types import Operator
 from bpy.props import StringProperty
+from mathutils import Matrix
 from . import export_indicators
+from . import export_stats
+from . import export_journal
+from . import export_memory
+from . import export_history
+from ..common import mesh_utils
+from . import decimation_cache
+from . import texture_lod
+from ..common.selection_utils import temp_selection_context, deselect_all
+from .export_stats import timed_stage
+from .parallel_export import estimate_export_cost
+from .properties import (settings_as_dict, upgrade_settings_dict,
+                         FORMAT_OPTIONS)
 
 # --- Setup Logger ---
 logger = logging.getLogger(__name__)
@@ -28,86 +44,147 @@ if not logger.handlers:
 # --- Constants ---
 EXPORT_TIME_PROP = "mesh_export_timestamp"
 EXPORT_STATUS_PROP = "mesh_export_status"
+SCRATCH_SCENE_NAME = ".EasyMesh_Export_Scene"
+# Unit settings the scratch scene copies from the exported scene
+SCRATCH_UNIT_SETTINGS = ("system", "system_rotation", "length_unit",
+                         "mass_unit", "time_unit", "temperature_unit",
+                         "scale_length")
+# Seconds of export work per modal timer tick, and the tick interval
+MODAL_TICK_BUDGET = 0.1
+MODAL_TIMER_INTERVAL = 0.01
+# Keys swallowed while a modal batch runs, as they could free or replace
+# the data it holds: undo/redo (with Ctrl/Cmd) everywhere, delete and
+# mode switch in the editors where they act on objects
+MODAL_UNDO_KEYS = {"Z", "Y"}
+MODAL_EDIT_KEYS = {"X", "DEL", "TAB"}
+MODAL_EDIT_AREAS = {"VIEW_3D", "OUTLINER"}
+# Export formats in the order they are written
+EXPORT_FORMATS = ("FBX", "OBJ", "GLTF", "USD", "STL")
+# glTF exporter options per kind of object, see get_gltf_profile
+GLTF_PROFILES = {
+    "STATIC": {"export_animations": False, "export_skins": False,
+               "export_morph": False, "export_def_bones": False},
+    "MORPH": {"export_animations": False, "export_skins": False,
+              "export_morph": True, "export_def_bones": False},
+    "ANIMATED": {"export_animations": True, "export_skins": False,
+                 "export_morph": True, "export_def_bones": False},
+    "SKINNED": {"export_animations": True, "export_skins": True,
+                "export_morph": True, "export_def_bones": True},
+}
+# Triangle-budget LOD ratio search
+LOD_SEARCH_MAX_TRIALS = 6
+LOD_BUDGET_TOLERANCE = 0.02  # Accept results within 2% under the budget
+LOD_RATIO_DECIMALS = 4
 
 
 # --- Core Functions ---
 
 
-@contextlib.contextmanager
-def temp_selection_context(context, active_object=None, selected_objects=None):
+def get_scratch_scene(source_scene):
     """
-    Temporarily set the active object and selection using direct API.
+    Returns the hidden scene that holds temporary export copies.
+    Creates it if needed and copies the unit and frame settings of
+    source_scene, which the exporters read from the active scene.
     
-    Args:
-        context (bpy.context): The current Blender context.
-        active_object (bpy.types.Object, optional): 
-            The object to set as active.
-        selected_objects (list, optional): List of objects to select.
+    Temporary objects never enter the user's scene, so depsgraph updates,
+    scene.objects scans and selection changes during the batch only pay
+    for the objects being processed.
     
+    Args:
+        source_scene (bpy.types.Scene): The scene being exported from.
+        
     Returns:
-        None
+        bpy.types.Scene: The scratch scene.
+    """
+    scene = bpy.data.scenes.get(SCRATCH_SCENE_NAME)
+    if scene is None:
+        # The leading "." hides the scene from the scene selector
+        scene = bpy.data.scenes.new(SCRATCH_SCENE_NAME)
+        logger.info(f"Created scratch scene '{scene.name}'")
+    if source_scene is not None and source_scene != scene:
+        for attr in SCRATCH_UNIT_SETTINGS:
+            setattr(scene.unit_settings, attr,
+                    getattr(source_scene.unit_settings, attr))
+        scene.render.fps = source_scene.render.fps
+        scene.render.fps_base = source_scene.render.fps_base
+        scene.frame_start = source_scene.frame_start
+        scene.frame_end = source_scene.frame_end
+        scene.frame_current = source_scene.frame_current
+    return scene
+
+
+def get_scratch_collection(context):
     """
-    # Store original state
-    original_active = context.view_layer.objects.active
-    original_selected = [obj for obj in context.scene.objects 
-                         if obj.select_get()]
+    Returns the collection that holds temporary export copies: the
+    master collection of the scratch scene.
     
-    try:
-        # Deselect all objects directly
-        for obj in context.scene.objects:
-            if obj.select_get():
-                obj.select_set(False)
-        
-        # Select requested objects directly
-        if selected_objects:
-            if not isinstance(selected_objects, list):
-                selected_objects = [selected_objects]
-            
-            for obj in selected_objects:
-                if obj and obj.name in context.scene.objects:
-                    try:
-                        obj.select_set(True)
-                    except ReferenceError:
-                        logger.warning(f"Could not select '{obj.name}' "
-                                       f"- object reference invalid.")
-        
-        # Set active object directly
-        if active_object and active_object.name in context.scene.objects:
-            context.view_layer.objects.active = active_object
-        elif selected_objects:
-            for obj in selected_objects:
-                if obj and obj.name in context.scene.objects:
-                    context.view_layer.objects.active = obj
-                    break
+    Args:
+        context (bpy.context): The current Blender context.
         
-        yield
+    Returns:
+        bpy.types.Collection: The scratch collection.
+    """
+    return get_scratch_scene(context.scene).collection
+
+
+def scratch_scene_override(context, scratch_scene):
+    """
+    Returns a context override that makes scratch_scene and its view layer
+    the active ones, so operators (modifier_apply, exporters) and the
+    evaluated depsgraph only see the temporary objects.
     
-    finally:
-        # Restore original state directly
-        for obj in context.scene.objects:
-            obj.select_set(False)
-            
-        for obj in original_selected:
-            if obj and obj.name in context.scene.objects:
-                try:
-                    obj.select_set(True)
-                except ReferenceError:
-                    pass
+    Args:
+        context (bpy.context): The current Blender context.
+        scratch_scene (bpy.types.Scene): The scratch scene.
         
-        if original_active and original_active.name in context.scene.objects:
-            try:
-                context.view_layer.objects.active = original_active
-            except ReferenceError:
-                pass
+    Returns:
+        A context manager (see bpy.types.Context.temp_override).
+    """
+    return context.temp_override(scene=scratch_scene,
+                                 view_layer=scratch_scene.view_layers[0])
+
+
+def remove_scratch_scene():
+    """
+    Removes the scratch scene and any temporary objects left in it in one
+    batch_remove call.
+    
+    Returns:
+        None
+    """
+    scene = bpy.data.scenes.get(SCRATCH_SCENE_NAME)
+    if scene is None:
+        return
+    objects = list(scene.collection.all_objects)
+    for obj in objects:
+        try:
+            restore_original_textures(obj)
+        except Exception as tex_e:
+            logger.warning(
+                f"Error restoring original textures for {obj.name}: {tex_e}"
+            )
+    # Meshes only used by the temporary objects go with them
+    meshes = {obj.data for obj in objects
+              if obj.type == "MESH" and obj.data.users == 1}
+    try:
+        bpy.data.batch_remove([*objects, *meshes, scene])
+        logger.info(f"Removed scratch scene ({len(objects)} leftover "
+                    f"objects).")
+    except (ReferenceError, RuntimeError) as e:
+        logger.warning(f"Issue removing scratch scene: {e}")
 
 
-def create_export_copy(original_obj, context):
+def create_export_copy(original_obj, context, collection=None):
     """
-    Creates a linked copy of the object and its data without mode switching.
+    Creates a copy of the object and its mesh data using the data API only.
+    The copy is linked into the scratch collection; selection and the
+    active object are left untouched.
     
     Args:
         original_obj (bpy.types.Object): The original object to copy.
         context (bpy.context): The current Blender context.
+        collection (bpy.types.Collection, optional): Collection to link the
+            copy into. Defaults to the scratch collection.
         
     Returns:
         bpy.types.Object: The copied object.
@@ -115,54 +192,36 @@ def create_export_copy(original_obj, context):
     if not original_obj or original_obj.type != "MESH":
         raise ValueError("Invalid object provided for copying.")
         
-    logger.info(f"Attempting to duplicate '{original_obj.name}' "
-                f"using operator...")
+    logger.info(f"Copying '{original_obj.name}' via data API...")
     
-    # Use the context manager to handle selection and active object
-    with temp_selection_context(context, 
-                                active_object=original_obj, 
-                                selected_objects=[original_obj]):
+    copy_obj = None
+    copy_mesh = None
+    try:
+        if collection is None:
+            collection = get_scratch_collection(context)
+        copy_mesh = original_obj.data.copy()
+        copy_obj = original_obj.copy()
+        copy_obj.data = copy_mesh
+        collection.objects.link(copy_obj)
+        logger.info(f"Successfully created copy '{copy_obj.name}'.")
+        return copy_obj
+        
+    except Exception as e:
+        logger.error(f"Error copying '{original_obj.name}': {e}",
+                     exc_info=True)
+        # Remove whatever was created before the failure
         try:
-            # Duplicate the active object (linked)
-            # more direct and conventional way to perform a non-interactive 
-            # linked duplication than bpy.ops.object.duplicate(linked=True)
-            bpy.ops.object.duplicate_move_linked(
-                OBJECT_OT_duplicate={"linked":True, "mode":'TRANSLATION'}, 
-                TRANSFORM_OT_translate={"value":(0, 0, 0)} # No actual move
-            )
-            
-            # The new duplicate becomes the active object 
-            # after the operator runs
-            copy_obj = context.view_layer.objects.active
-            logger.info(f"Successfully created duplicate "
-                        f"'{copy_obj.name}' via operator.")
-            
-            # Make Mesh Data Single User
-            if copy_obj and copy_obj.data and copy_obj.data.users > 1:
-                logger.info(f"Making mesh data single user for "
-                            f"'{copy_obj.name}'")
-                copy_obj.data = copy_obj.data.copy()
+            if copy_obj is not None:
+                bpy.data.objects.remove(copy_obj, do_unlink=True)
+            if copy_mesh is not None and not copy_mesh.users:
+                bpy.data.meshes.remove(copy_mesh)
+        except Exception as cleanup_e:
+             logger.warning(f"Issue during cleanup after copy "
+                            f"failure: {cleanup_e}")
 
-            return copy_obj
-            
-        except Exception as e:
-            logger.error(f"Error using duplicate_move_linked operator for "
-                         f"'{original_obj.name}': {e}", exc_info=True)
-            # Attempt cleanup if copy_obj was created but failed later
-            copy_obj_ref = None
-            try:
-                copy_obj_ref = context.view_layer.objects.active 
-                if copy_obj_ref and copy_obj_ref != original_obj:
-                    logger.info(f"Attempting cleanup of partially created "
-                                f"copy: {copy_obj_ref.name}")
-                    bpy.data.objects.remove(copy_obj_ref, do_unlink=True)
-            except Exception as cleanup_e:
-                 logger.warning(f"Issue during cleanup after copy "
-                                f"failure: {cleanup_e}")
-
-            raise RuntimeError(
-                f"Failed to create operator copy of {original_obj.name}: {e}"
-            ) from e
+        raise RuntimeError(
+            f"Failed to create copy of {original_obj.name}: {e}"
+        ) from e
 
 
 def sanitise_filename(name):
@@ -191,6 +250,51 @@ def sanitise_filename(name):
     return sanitised
 
 
+def get_export_base_name(original_obj_name, scene_props):
+    """
+    Builds the sanitised, prefixed/suffixed base name used for export files.
+    
+    Args:
+        original_obj_name (str): The original name of the object.
+        scene_props (bpy.types.PropertyGroup): Scene properties for export.
+    
+    Returns:
+        str: The base name.
+    """
+    # Sanitise the original object name
+    original_obj_name = sanitise_filename(original_obj_name)
+    base_name = (
+        scene_props.mesh_export_prefix +
+        original_obj_name +
+        scene_props.mesh_export_suffix
+    )
+    # Truncate if name too long (conservatively 100 chars)
+    max_base_length = 100
+    if len(base_name) > max_base_length:
+        truncated = base_name[:max_base_length-3] + "..."
+        logger.warning(
+            f"Name too long, truncating: {base_name} → {truncated}"
+        )
+        base_name = truncated
+    return base_name
+
+
+def get_lod_name(base_name, lod_level=None):
+    """
+    Appends the LOD suffix to a base name.
+    
+    Args:
+        base_name (str): The export base name.
+        lod_level (int, optional): LOD level. Defaults to None (no suffix).
+    
+    Returns:
+        str: The final name.
+    """
+    if lod_level is None:
+        return base_name
+    return f"{base_name}_LOD{lod_level:02d}"
+
+
 def setup_export_object(obj, original_obj_name, scene_props, lod_level=None):
     """
     Renames object, applies prefix/suffix/LOD naming, zeros location.
@@ -207,63 +311,20 @@ def setup_export_object(obj, original_obj_name, scene_props, lod_level=None):
     if not obj:
         return None, None
     try:
-        # Sanitise the original object name
-        original_obj_name = sanitise_filename(original_obj_name)
-        base_name = (
-            scene_props.mesh_export_prefix +
-            original_obj_name +
-            scene_props.mesh_export_suffix
-        )
-        # Truncate if name too long (conservatively 100 chars)
-        max_base_length = 100
-        if len(base_name) > max_base_length:
-            truncated = base_name[:max_base_length-3] + "..."
-            logger.warning(
-                f"Name too long, truncating: {base_name} → {truncated}"
-            )
-            base_name = truncated
-        final_name = (
-            f"{base_name}_LOD{lod_level:02d}"
-            if lod_level is not None
-            else base_name
-        )
+        base_name = get_export_base_name(original_obj_name, scene_props)
+        final_name = get_lod_name(base_name, lod_level)
         obj.name = final_name
         logger.info(f"Renamed to: {obj.name}")
 
-        # Check if object's scale is already 1.0
-        if obj.scale != (1.0, 1.0, 1.0):
-            # Apply scale transform if not 1.0
-            logger.info(f"Object scale is not 1.0: {obj.scale}, applying...")
-            apply_transforms(obj, apply_scale=True)
-
         # Zero location if specified in scene properties
         if scene_props.mesh_export_zero_location:
             obj.location = (0.0, 0.0, 0.0)
             logger.info(f"Zeroed location for {obj.name}")
 
-        # Calculate final scale factor
-        if (scene_props.mesh_export_format != "GLTF" 
-            or scene_props.mesh_export_format != "USD"):
-            # For GLTF, we don't want to apply scale here
-            final_scale_factor = scene_props.mesh_export_scale
-            if scene_props.mesh_export_units == "CENTIMETERS":
-                # Apply 100x scale for Meters (Blender default) 
-                # to Centimeters (UE default)
-                final_scale_factor *= 100.0 
-                logger.info("Applying M to CM scale factor (x100)")
-
-            # Set the object's scale
-            if abs(final_scale_factor - 1.0) > 1e-6: # Check if scaling is need
-                obj.scale = (final_scale_factor, 
-                            final_scale_factor, 
-                            final_scale_factor)
-                logger.info(f"Set object scale to {final_scale_factor:.2f}")
-            else:
-                logger.info("Final scale factor is 1.0. No scaling needed.")
-
-            # Apply the calculated scale and rotation transforms using the help
-            # We always want to apply rotation and scale at the end here.
-            apply_transforms(obj, apply_rotation=True, apply_scale=True)
+        # Bake source scale × rotation into the mesh. The prepared mesh is
+        # shared by every selected format, so it stays in metres and each
+        # format's unit/scale is applied by its exporter (see export_object)
+        bake_transform(obj)
 
         return obj.name, base_name
     except Exception as e:
@@ -272,63 +333,63 @@ def setup_export_object(obj, original_obj_name, scene_props, lod_level=None):
         ) from e
     
 
-def apply_transforms(obj, apply_location=False, 
-                     apply_rotation=False, apply_scale=False):
+def bake_transform(obj, scale_factor=1.0):
     """
-    Applies specified transforms to the object.
+    Bakes the object's rotation and scale, multiplied by an extra uniform
+    scale factor, directly into its mesh data with Mesh.transform.
+    Equivalent to applying scale, setting the scale factor and applying
+    rotation and scale with transform_apply, without any operator calls.
+    Location is kept on the object.
 
     Args:
-        obj (bpy.types.Object): The object to apply transforms to.
-        apply_location (bool): Whether to apply location transforms.
-        apply_rotation (bool): Whether to apply rotation transforms.
-        apply_scale (bool): Whether to apply scale transforms.
+        obj (bpy.types.Object): The object to bake.
+        scale_factor (float): Additional uniform scale (units/export scale).
 
     Returns:
         None
     """
-    if not obj:
-        logger.warning("Attempted to apply transforms to an invalid object.")
-        return
-    if not (apply_location or apply_rotation or apply_scale):
-        logger.info(f"No transforms requested for {obj.name}. Skipping apply.")
+    if not obj or obj.type != "MESH":
+        logger.warning("Attempted to bake transforms of an invalid object.")
         return
 
-    transforms_to_apply = []
-    if apply_location: 
-        transforms_to_apply.append("location")
-    if apply_rotation: 
-        transforms_to_apply.append("rotation")
-    if apply_scale: 
-        transforms_to_apply.append("scale")
-
-    logger.info(f"Applying {', '.join(transforms_to_apply)} "
-                f"transforms for {obj.name}...")
-    try:
-        with bpy.context.temp_override(
-            selected_editable_objects=[obj],
-            selected_objects=[obj], active_object=obj):
-            bpy.ops.object.transform_apply(location=apply_location,
-                                           rotation=apply_rotation,
-                                           scale=apply_scale)
-        logger.info(f"Successfully applied {', '.join(transforms_to_apply)} "
-                    f"for {obj.name}")
-    except Exception as e:
-        logger.error(f"Failed to apply transforms for {obj.name}: {e}")
-        raise
+    location, rotation, scale = obj.matrix_basis.decompose()
+    bake_matrix = (
+        rotation.to_matrix().to_4x4() 
+        @ Matrix.Diagonal((*(scale * scale_factor), 1.0))
+    )
+    if bake_matrix != Matrix.Identity(4):
+        logger.info(f"Baking rotation/scale (factor {scale_factor:.2f}) "
+                    f"into mesh of {obj.name}")
+        # Same mesh transform (incl. custom normals and shape keys)
+        # that transform_apply uses
+        obj.data.transform(bake_matrix, shape_keys=True)
+    else:
+        logger.info(f"No rotation/scale to bake for {obj.name}")
+    obj.matrix_basis = Matrix.Translation(location)
 
 
-def apply_mesh_modifiers(obj):
+def apply_mesh_modifiers(obj, use_depsgraph=False):
     """
     Apply all VISIBLE modifiers on a mesh object.
     
     Args:
         obj (bpy.types.Object): The object whose modifiers to apply.
+        use_depsgraph (bool): Build the mesh once from the evaluated
+            depsgraph instead of applying each modifier with an operator.
         
     Returns:
         None
     """
     if not obj or obj.type != "MESH":
         return
+    if use_depsgraph and obj.data.shape_keys is None:
+        apply_mesh_modifiers_evaluated(obj)
+        return
+    if use_depsgraph:
+        # new_from_object drops the shape keys, which modifier_apply keeps
+        # by refusing to apply
+        logger.warning(f"{obj.name} has shape keys, applying modifiers "
+                       f"with operators instead")
     logger.info(f"Applying base modifiers for {obj.name}...")
     current_mode = obj.mode
     if current_mode != "OBJECT":
@@ -365,14 +426,67 @@ def apply_mesh_modifiers(obj):
     )
 
 
-def compress_textures(obj, ratio):
+def apply_mesh_modifiers_evaluated(obj):
+    """
+    Replace the object's mesh with its depsgraph-evaluated mesh.
+    Gives the same result as applying every visible modifier in order,
+    without an operator call (and undo push) per modifier.
+    
+    Args:
+        obj (bpy.types.Object): The object whose modifiers to apply.
+        
+    Returns:
+        None
+    """
+    if not obj or obj.type != "MESH":
+        return
+    visible_modifiers = [mod.name for mod in obj.modifiers 
+                         if mod.show_viewport]
+    if not visible_modifiers:
+        logger.info(f"No visible modifiers on {obj.name}, skipping.")
+        return
+
+    logger.info(f"Evaluating modifiers for {obj.name}: {visible_modifiers}")
+    try:
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        obj_eval = obj.evaluated_get(depsgraph)
+        new_mesh = bpy.data.meshes.new_from_object(
+            obj_eval, preserve_all_data_layers=True, depsgraph=depsgraph
+        )
+    except (RuntimeError, ReferenceError) as e:
+        raise RuntimeError(
+            f"Could not evaluate modifiers on {obj.name}: {e}"
+        ) from e
+
+    old_mesh = obj.data
+    new_mesh.name = old_mesh.name
+    # Visible modifiers are baked into the new mesh, drop them so they
+    # aren't evaluated a second time. Disabled ones stay, as they would
+    # with modifier_apply.
+    for mod_name in visible_modifiers:
+        obj.modifiers.remove(obj.modifiers[mod_name])
+    obj.data = new_mesh
+    if not old_mesh.users:
+        bpy.data.meshes.remove(old_mesh)
+    logger.info(
+        f"Finished evaluating modifiers. Applied: {visible_modifiers}"
+    )
+
+
+def compress_textures(obj, lod_level, texture_pyramid=None):
     """
-    Compresses textures based on decimation ratio with no user input required.
+    Points the object's image texture nodes at the LOD level of their
+    images from the batch texture pyramid (longest side limited per
+    level, see texture_lod.LOD_TEXTURE_SIZES) until
+    restore_original_textures puts the originals back, so exported
+    material names stay unchanged.
     
     Args:
         obj:    The mesh object whose textures should be compressed
-        ratio:  The decimation ratio 
-                1.0 = full quality, 0.01 = heavy decimation
+        lod_level:  The LOD level being exported (1-4)
+        texture_pyramid (texture_lod.TexturePyramid, optional): Batch
+                pyramid of downscaled images. Without one the images are
+                owned by obj and removed by restore_original_textures.
         
     Returns:
         List of modified image names for reporting
@@ -380,131 +494,62 @@ def compress_textures(obj, ratio):
     if not obj or obj.type != "MESH":
         return []
     
-    logger.info(f"Compressing textures for {obj.name} "
-                f"(decimation ratio: {ratio:.3f})...")
+    logger.info(f"Compressing textures for {obj.name} (LOD{lod_level:02d})...")
     
     # Get all materials on the object
-    materials = obj.data.materials
+    materials = {slot.material for slot in obj.material_slots
+                 if slot.material and slot.material.node_tree}
     if not materials:
         logger.info(f"No materials found on {obj.name}, "
                     f"skipping texture compression")
         return []
     
+    owns_pyramid = texture_pyramid is None
+    if owns_pyramid:
+        texture_pyramid = texture_lod.TexturePyramid()
+
     modified_images = []
-    
-    # First pass - collect all unique images and nodes using them
-    image_nodes = {}  # {image: [nodes using this image]}
+    replaced_nodes = {}  # {material: {node: original image name}}
     for mat in materials:
-        if not mat or not mat.node_tree:
-            continue
-            
-        # Find all image texture nodes in the material
         for node in mat.node_tree.nodes:
-            if node.type == 'TEX_IMAGE' and node.image:
-                if node.image not in image_nodes:
-                    image_nodes[node.image] = []
-                image_nodes[node.image].append((mat, node))
-    
-    # Nothing to do if no images found
-    if not image_nodes:
-        logger.info(f"No texture images found on {obj.name}")
-        return []
-        
-    # Calculate compression amount based on decimation ratio
-    compression_factor = max(ratio**0.9, 0.05)  # Limit max compression to 1/20
-    min_dimension = 64  # Minimum texture size
-    
-    # Process each image
-    for orig_img, nodes_using_img in image_nodes.items():
-        # Skip already compressed or size-zero images
-        if (not orig_img.has_data 
-            or orig_img.size[0] == 0 
-            or orig_img.size[1] == 0):
-            continue
-            
-        # Calculate new resolution
-        orig_width, orig_height = orig_img.size
-        is_power_of_2 = ((orig_width & (orig_width - 1) == 0) 
-                         and (orig_height & (orig_height - 1) == 0))
-        
-        new_width = max(int(orig_width * compression_factor), min_dimension)
-        new_height = max(int(orig_height * compression_factor), min_dimension)
-        
-        # Round to power of 2 if original was power of 2
-        if is_power_of_2:
-            new_width = 2 ** (new_width - 1).bit_length()
-            new_height = 2 ** (new_height - 1).bit_length()
-            
-        # Skip if size hasn't changed
-        if (new_width, new_height) == (orig_width, orig_height):
-            continue
-        
-        # Create a copy of the original image
-        copy_name = f"{orig_img.name}_LOD"
-        
-        # Check if copy already exists, reuse if it does
-        copied_img = bpy.data.images.get(copy_name)
-        if copied_img:
-            # If dimensions don't match our target, recreate it
-            if (copied_img.size[0] != new_width 
-                or copied_img.size[1] != new_height):
-                bpy.data.images.remove(copied_img)
-                copied_img = None
-        
-        if not copied_img:
-            # Create new image with proper dimensions
-            copied_img = bpy.data.images.new(
-                name=copy_name,
-                width=new_width,
-                height=new_height
+            orig_img = node.image if node.type == "TEX_IMAGE" else None
+            # Skip missing or size-zero images
+            if not orig_img or not orig_img.has_data or 0 in orig_img.size:
+                continue
+            try:
+                small_img = texture_pyramid.get(orig_img, lod_level)
+            except Exception as e:
+                logger.warning(f"Error downscaling {orig_img.name}: {e}")
+                continue
+            # Skip if size hasn't changed
+            if small_img == orig_img:
+                continue
+            replaced_nodes.setdefault(mat.name, {})[node.name] = (
+                orig_img.name
             )
-            
-            # Copy pixel data from original and resize
-            if orig_img.has_data and orig_img.pixels:
-                try:
-                    # Make a copy of the original at the lower resolution
-                    # First match original size
-                    copied_img.scale(orig_width, orig_height)  
-                    # Copy pixels
-                    copied_img.pixels = orig_img.pixels[:]     
-                    # Then resize to target
-                    copied_img.scale(new_width, new_height)    
-                    
-                    # Copy other relevant properties
-                    copied_img.colourspace_settings.name = (
-                        orig_img.colourspace_settings.name
-                    )
-                    if orig_img.filepath:
-                        # For export reference
-                        copied_img.filepath = orig_img.filepath  
-                    
-                except Exception as e:
-                    logger.warning(f"Error copying pixels for "
-                                   f"{orig_img.name}: {e}")
-                    
-            logger.info(f"Created compressed copy of '{orig_img.name}' "
-                        f"at {new_width}x{new_height}")
-        
-        # Update material nodes to use the copied image
-        for mat, node in nodes_using_img:
-            node.image = copied_img
-        
-        modified_images.append(f"{orig_img.name} ({orig_width}x{orig_height} "
-                               f"→ {new_width}x{new_height})")
-        
-        # Store original image reference on the object for restoration
-        if "original_textures" not in obj:
-            obj["original_textures"] = {}
-        
-        obj["original_textures"][copy_name] = orig_img.name
-    
+            node.image = small_img
+            modified_images.append(
+                f"{orig_img.name} ({orig_img.size[0]}x{orig_img.size[1]} "
+                f"→ {small_img.size[0]}x{small_img.size[1]})"
+            )
+
+    # Store original image references on the object for restoration
+    obj["original_textures"] = {
+        "nodes": replaced_nodes,
+        "images": ([image.name for image in texture_pyramid.images.values()]
+                   if owns_pyramid else []),
+        "temp_dir": ((texture_pyramid.temp_dir or "") if owns_pyramid
+                     else ""),
+    }
     return modified_images
 
 
 def restore_original_textures(obj):
     """
-    Restores original textures after exportby replacing 
-    compressed copies with originals.
+    Restores original textures after export by pointing the image nodes
+    changed by compress_textures back at the originals. Images from a
+    batch texture pyramid are left to the pyramid; object-owned ones are
+    removed.
     
     Args:
         obj (bpy.types.Object): The object whose textures to restore.
@@ -515,47 +560,32 @@ def restore_original_textures(obj):
     if not obj or obj.type != "MESH" or "original_textures" not in obj:
         return
     
-    texture_map = obj.get("original_textures", {})
-    if not texture_map:
-        return
-    
+    texture_map = obj["original_textures"].to_dict()
+    del obj["original_textures"]
     logger.info(f"Restoring original textures for {obj.name}...")
-    
-    # Get all materials on the object
-    materials = obj.data.materials
-    if not materials:
-        return
-    
-    # Find all image texture nodes and restore originals
-    for mat in materials:
+    for mat_name, nodes in texture_map.get("nodes", {}).items():
+        mat = bpy.data.materials.get(mat_name)
         if not mat or not mat.node_tree:
             continue
-            
-        for node in mat.node_tree.nodes:
-            if node.type == "TEX_IMAGE" and node.image:
-                # Check if this is an LOD image that needs restoration
-                if node.image.name in texture_map:
-                    original_name = texture_map[node.image.name]
-                    original_img = bpy.data.images.get(original_name)
-                    
-                    if original_img:
-                        logger.info(f"Restoring {node.image.name} "
-                                    f"→ {original_name}")
-                        node.image = original_img
-    
-    # Clean up the mapping
-    del obj["original_textures"]
-    
-    # Delete any unused LOD textures
-    for img in bpy.data.images:
-        if img.name.endswith("_LOD") and not img.users:
+        for node_name, original_name in nodes.items():
+            node = mat.node_tree.nodes.get(node_name)
+            original_img = bpy.data.images.get(original_name)
+            if node and original_img:
+                node.image = original_img
+    for name in texture_map.get("images", []):
+        img = bpy.data.images.get(name)
+        if img:
             bpy.data.images.remove(img)
+    if texture_map.get("temp_dir"):
+        shutil.rmtree(texture_map["temp_dir"], ignore_errors=True)
 
 
 def apply_decimate_modifier(obj, ratio, decimate_type, 
-                            sym_axis="X", sym=False):
+                            sym_axis="X", sym=False, cache=None):
     """
     Adds, configures, and applies a Decimate modifier.
+    With a cache, a previously stored result for the same mesh and
+    settings is loaded instead, and new results are stored.
     
     Args:
         obj (bpy.types.Object): The object to apply the modifier to.
@@ -563,6 +593,7 @@ def apply_decimate_modifier(obj, ratio, decimate_type,
         decimate_type (str): The type of decimation to apply.
         sym_axis (str): The symmetry axis for decimation.
         sym (bool): Whether to apply symmetry.
+        cache (decimation_cache.DecimationCache, optional): Result cache.
 
     Returns:
         None
@@ -577,6 +608,21 @@ def apply_decimate_modifier(obj, ratio, decimate_type,
         f"(Ratio: {ratio:.3f}, Type: {decimate_type})..."
     )
 
+    cache_key = None
+    if cache is not None:
+        try:
+            cache_key = cache.make_key(obj, ratio, decimate_type.upper(),
+                                       sym_axis.upper(), sym)
+            if cache_key is not None and cache.load(cache_key, obj.data):
+                logger.info(
+                    f"Decimation cache hit: {initial_poly_count} "
+                    f"→ {len(obj.data.polygons)} polys"
+                )
+                return
+        except Exception as e:
+            logger.warning(f"Decimation cache lookup failed: {e}")
+            cache_key = None
+
     current_mode = obj.mode
     if current_mode != "OBJECT":
         bpy.ops.object.mode_set(mode="OBJECT")
@@ -630,6 +676,8 @@ def apply_decimate_modifier(obj, ratio, decimate_type,
             f"→ {final_poly_count} polys "
             f"(target: {ratio:.3f}, actual: {actual_ratio:.3f})"
         )
+        if cache_key is not None:
+            cache.store(cache_key, obj.data)
         
         # if compressed_textures:
         #     logger.info(f"Texture compression details: "
@@ -650,7 +698,8 @@ def apply_decimate_modifier(obj, ratio, decimate_type,
 
 def triangulate_mesh(obj, method="BEAUTY", keep_normals=True):
     """
-    Add and apply a triangulate modifier.
+    Triangulates the object's mesh data in place with bmesh
+    (see mesh_utils.triangulate_mesh_data).
     
     Args:
         obj (bpy.types.Object): The object to triangulate.
@@ -663,35 +712,132 @@ def triangulate_mesh(obj, method="BEAUTY", keep_normals=True):
     if not obj or obj.type != "MESH":
         return
     logger.info(f"Triangulating {obj.name}...")
-    current_mode = obj.mode
-    if current_mode != "OBJECT":
-        bpy.ops.object.mode_set(mode="OBJECT")
+    try:
+        split = mesh_utils.triangulate_mesh_data(
+            obj.data, quad_method=method, keep_normals=keep_normals
+        )
+        logger.info(f"Successfully triangulated ({split} faces split).")
+    except Exception as e:
+        logger.warning(f"Could not triangulate {obj.name}: {e}")
 
-    mod_name = "TempTriangulate"
-    tri_mod = obj.modifiers.new(name=mod_name, type="TRIANGULATE")
-    tri_mod.quad_method = method
-    tri_mod.keep_custom_normals = keep_normals
 
-    override = bpy.context.copy()
-    override["object"] = obj
-    override["active_object"] = obj
-    override["selected_objects"] = [obj]
-    override["selected_editable_objects"] = [obj]
+def get_export_formats(scene_props):
+    """
+    Returns the selected export formats.
+    
+    Args:
+        scene_props (bpy.types.PropertyGroup): Scene properties for export.
+    
+    Returns:
+        list: Format identifiers in EXPORT_FORMATS order.
+    """
+    formats = scene_props.mesh_export_formats
+    if isinstance(formats, str):
+        formats = {formats}
+    return [fmt for fmt in EXPORT_FORMATS if fmt in formats]
 
-    try:
-        with bpy.context.temp_override(**override):
-            bpy.ops.object.modifier_apply(modifier=mod_name)
-        logger.info("Successfully triangulated.")
-    except Exception as e:
-        logger.warning(
-            f"Could not apply triangulation modifier on {obj.name}: {e}"
-        )
-    finally:
-        if obj.mode != current_mode:
-            bpy.ops.object.mode_set(mode=current_mode)
+
+def get_format_options(scene_props, fmt):
+    """
+    Returns the unit, scale and axis options of one format.
+    
+    Args:
+        scene_props (bpy.types.PropertyGroup): Scene properties for export.
+        fmt (str): A format in FORMAT_OPTIONS.
+    
+    Returns:
+        MeshExportFormatOptions or SimpleNamespace: The format's options
+        (frozen settings store them as dicts).
+    """
+    options = getattr(scene_props, FORMAT_OPTIONS[fmt])
+    if isinstance(options, dict):
+        return SimpleNamespace(**options)
+    return options
+
+
+def get_format_scale(options):
+    """
+    Returns the global scale an exporter applies for a format's options:
+    the scale factor, times 100 when exporting in centimetres.
+    
+    Args:
+        options (MeshExportFormatOptions): See get_format_options.
+    
+    Returns:
+        float: The global scale.
+    """
+    scale = options.scale
+    if options.units == "CENTIMETERS":
+        # Meters (Blender default) to Centimeters (UE default)
+        scale *= 100.0
+    return scale
+
+
+def get_format_file_path(file_path, fmt, formats):
+    """
+    Returns the file path (without extension) for one format: inside a
+    sub-folder named after the format when several formats are exported.
+    
+    Args:
+        file_path (str): The file path without extension.
+        fmt (str): The format being exported.
+        formats (list): All exported formats (see get_export_formats).
+    
+    Returns:
+        str: The file path for fmt.
+    """
+    if len(formats) < 2:
+        return file_path
+    directory, name = os.path.split(file_path)
+    return os.path.join(directory, fmt.lower(), name)
+
+
+def get_export_filepath(file_path, scene_props, fmt=None):
+    """
+    Returns the full path (with extension) an export writes to.
+    
+    Args:
+        file_path (str): The file path without extension.
+        scene_props (bpy.types.PropertyGroup): Scene properties for export.
+        fmt (str, optional): The format. Defaults to the first selected.
+    
+    Returns:
+        str: The file path with the format's extension.
+    """
+    if fmt is None:
+        fmt = get_export_formats(scene_props)[0]
+    return f"{file_path}.{fmt.lower()}"
 
 
-def export_object(obj, file_path, scene_props):
+def get_gltf_profile(obj):
+    """
+    Picks the smallest GLTF_PROFILES entry that keeps everything obj
+    would export: skinned if it is deformed by an armature, animated if
+    it or its shape keys have an action or NLA tracks, morph if it has
+    shape keys, otherwise static.
+    
+    Args:
+        obj (bpy.types.Object): The prepared object to export.
+    
+    Returns:
+        str: A GLTF_PROFILES key.
+    """
+    if (obj.parent is not None and obj.parent_type == "ARMATURE") or any(
+            mod.type == "ARMATURE" and mod.object is not None
+            for mod in obj.modifiers):
+        return "SKINNED"
+    shape_keys = obj.data.shape_keys
+    for owner in (obj, shape_keys):
+        anim = owner.animation_data if owner is not None else None
+        if anim is not None and (anim.action is not None
+                                 or len(anim.nla_tracks)):
+            return "ANIMATED"
+    if shape_keys is not None and len(shape_keys.key_blocks) > 1:
+        return "MORPH"
+    return "STATIC"
+
+
+def export_object(obj, file_path, scene_props, fmt=None):
     """
     Exports a single object using scene properties.
     
@@ -699,11 +845,14 @@ def export_object(obj, file_path, scene_props):
         obj (bpy.types.Object): The object to export.
         file_path (str): The file path for the export.
         scene_props (bpy.types.PropertyGroup): Scene properties for export.
+        fmt (str, optional): The format to write. Defaults to the first
+            selected format.
     
     Returns:
         bool: True if export was successful, False otherwise.
     """
-    fmt = scene_props.mesh_export_format
+    if fmt is None:
+        fmt = get_export_formats(scene_props)[0]
     success = False
     
     # 确保文件路径使用UTF-8编码，处理中文字符
@@ -717,9 +866,7 @@ def export_object(obj, file_path, scene_props):
         safe_name = f"object_{hash(obj.name) % 10000:04d}"
         file_path = os.path.join(dir_path, safe_name)
     
-    # base_file_path = os.path.splitext(file_path)[0] # Ensure no extension yet
-    base_file_path = file_path
-    export_filepath = f"{base_file_path}.{fmt.lower()}"
+    export_filepath = get_export_filepath(file_path, scene_props, fmt)
 
     # GLTF material export type
     if scene_props.mesh_export_gltf_materials:
@@ -731,19 +878,19 @@ def export_object(obj, file_path, scene_props):
 
     if temp_lod_lvl == "LOD01":
         export_quality = math.ceil(scene_props.mesh_export_lod_ratio_01 * 100)
-        downscale_size = "2048"
     elif temp_lod_lvl == "LOD02":
         export_quality = math.ceil(scene_props.mesh_export_lod_ratio_02 * 100)
-        downscale_size = "1024"
     elif temp_lod_lvl == "LOD03":
         export_quality = math.ceil(scene_props.mesh_export_lod_ratio_03 * 100)
-        downscale_size = "512"
     elif temp_lod_lvl == "LOD04":
         export_quality = math.ceil(scene_props.mesh_export_lod_ratio_04 * 100)
-        downscale_size = "256"
     else:
         export_quality = 100
-        downscale_size = "KEEP"
+    # Same per-level sizes as the LOD texture pyramid
+    downscale_size = str(texture_lod.LOD_TEXTURE_SIZES.get(
+        int(temp_lod_lvl[3:]) if re.fullmatch(r"LOD\d\d", temp_lod_lvl)
+        else None, "KEEP"
+    ))
 
     # logger.info(f"[[quality: {export_quality}]]")
     # logger.info(f"[[downscale: {downscale_size}]]")
@@ -752,21 +899,33 @@ def export_object(obj, file_path, scene_props):
     logger.info(
         f"Exporting {os.path.basename(export_filepath)} ({fmt})..."
     )
-
+    # Written under the final name in a staging directory and moved into
+    # place once complete (see export_journal)
+    export_dir = os.path.dirname(export_filepath)
+    staging_dir = export_journal.get_staging_dir(export_dir)
+    staged_filepath = os.path.join(staging_dir,
+                                   os.path.basename(export_filepath))
+
+    # selected_objects is derived from the window's view layer, which a
+    # scratch scene override doesn't change, so it is overridden as well
     with temp_selection_context(bpy.context, active_object=obj,
-                                selected_objects=[obj]):
+                                selected_objects=[obj]), \
+            bpy.context.temp_override(selected_objects=[obj],
+                                      selected_editable_objects=[obj],
+                                      active_object=obj, object=obj):
         try:
             if fmt == "FBX":
                 try:
                     # 确保导出路径存在
                     os.makedirs(os.path.dirname(export_filepath), exist_ok=True)
                     
+                    options = get_format_options(scene_props, fmt)
                     fbx_export_params = {
-                        "filepath": export_filepath,
+                        "filepath": staged_filepath,
                         "use_selection": True,
-                        "global_scale": 1.0, # Scale applied setup_export_object
-                        "axis_forward": scene_props.mesh_export_coord_forward,
-                        "axis_up": scene_props.mesh_export_coord_up,
+                        "global_scale": get_format_scale(options),
+                        "axis_forward": options.coord_forward,
+                        "axis_up": options.coord_up,
                         "apply_unit_scale": False,
                         "apply_scale_options": "FBX_SCALE_ALL",
                         "object_types": {"MESH"},
@@ -786,7 +945,7 @@ def export_object(obj, file_path, scene_props):
                     logger.info("尝试使用备用方法导出FBX...")
                     try:
                         backup_fbx_params = {
-                            "filepath": export_filepath,
+                            "filepath": staged_filepath,
                             "use_selection": True,
                             "path_mode": "COPY",
                             "embed_textures": False,
@@ -798,12 +957,13 @@ def export_object(obj, file_path, scene_props):
                         logger.error(f"备用FBX导出也失败: {type(backup_e).__name__} - {str(backup_e)}", exc_info=True)
                         raise  # 重新抛出异常以便上层处理
             elif fmt == "OBJ":
+                options = get_format_options(scene_props, fmt)
                 bpy.ops.wm.obj_export(
-                    filepath=export_filepath,
+                    filepath=staged_filepath,
                     export_selected_objects=True,
-                    global_scale=1.0, # Scale applied setup_export_object
-                    forward_axis=scene_props.mesh_export_coord_forward,
-                    up_axis=scene_props.mesh_export_coord_up,
+                    global_scale=get_format_scale(options),
+                    forward_axis=options.coord_forward,
+                    up_axis=options.coord_up,
                     export_materials=scene_props.mesh_export_materials,
                     path_mode="COPY",
                     export_normals=True,
@@ -812,8 +972,12 @@ def export_object(obj, file_path, scene_props):
                     export_triangulated_mesh=False, # Handled triangulate_mesh
                 )
             elif fmt == "GLTF":
+                profile = (get_gltf_profile(obj)
+                           if scene_props.mesh_export_gltf_profile == "AUTO"
+                           else "SKINNED")
+                logger.info(f"glTF profile for {obj.name}: {profile}")
                 bpy.ops.export_scene.gltf(
-                    filepath=export_filepath,
+                    filepath=staged_filepath,
                     use_selection=True,
                     export_format=scene_props.mesh_export_gltf_type,
                     export_apply=False, # Transforms/Mods applied manually
@@ -824,26 +988,24 @@ def export_object(obj, file_path, scene_props):
                     export_vertex_color="MATERIAL", 
                     export_cameras=False,
                     export_lights=False,
-                    export_skins=True,
-                    export_animations=True,
                     export_extras=True,
                     export_yup=True, # Use Y-Up coordinate system
                     export_jpeg_quality=export_quality,
                     export_image_quality=export_quality,
-                    export_def_bones=True, # Export bones even if not animated
+                    # Animation, skin, shape key and bone export
+                    **GLTF_PROFILES[profile],
                     # Considering adding other options like Draco compression
                     # needs testing
                     # export_draco_mesh_compression_enable=True,
                     # export_draco_compression_level=6,
                 )
             elif fmt == "USD":
+                options = get_format_options(scene_props, fmt)
                 bpy.ops.wm.usd_export(
-                    filepath=export_filepath,
+                    filepath=staged_filepath,
                     selected_objects_only=True,
-                    export_global_forward_selection=(
-                        scene_props.mesh_export_coord_forward),
-                    export_global_up_selection=(
-                        scene_props.mesh_export_coord_up),
+                    export_global_forward_selection=options.coord_forward,
+                    export_global_up_selection=options.coord_up,
                     export_meshes=True,
                     export_materials=scene_props.mesh_export_materials,
                     export_normals=True,
@@ -858,19 +1020,22 @@ def export_object(obj, file_path, scene_props):
                     overwrite_textures=True,
                 )
             elif fmt == "STL":
+                options = get_format_options(scene_props, fmt)
                 bpy.ops.wm.stl_export(
-                    filepath=export_filepath,
+                    filepath=staged_filepath,
                     export_selected_objects=True,
                     use_selection=True,
-                    global_scale=1.0, # Scale applied setup_export_object
-                    forward_axis=scene_props.mesh_export_coord_forward,
-                    up_axis=scene_props.mesh_export_coord_up,
+                    global_scale=get_format_scale(options),
+                    forward_axis=options.coord_forward,
+                    up_axis=options.coord_up,
                     apply_modifiers=False, # Handled by apply_mesh_modifiers
                 )
             else:
                 logger.error(f"Unsupported export format '{fmt}'")
                 return False
 
+            export_journal.commit_staged_files(staging_dir, export_dir,
+                                               staged_filepath)
             logger.info(
                 f"Successfully exported {os.path.basename(export_filepath)}"
             )
@@ -880,6 +1045,8 @@ def export_object(obj, file_path, scene_props):
                 f"Failed exporting {obj.name} as {fmt}: {e}", exc_info=True
             )
             success = False
+        finally:
+            export_journal.remove_staging_dir(staging_dir)
     return success
 
 
@@ -900,12 +1067,12 @@ def cleanup_object(obj, obj_name_for_log):
     logger.info(f"Attempting cleanup for: {log_name}")
     
     # First restore original textures if they were compressed
-    # try:
-    #     restore_original_textures(obj)
-    # except Exception as tex_e:
-    #     logger.warning(
-    #       f"Error restoring original textures for {log_name}: {tex_e}"
-    #     )
+    try:
+        restore_original_textures(obj)
+    except Exception as tex_e:
+        logger.warning(
+          f"Error restoring original textures for {log_name}: {tex_e}"
+        )
     
     # Then remove the object
     try:
@@ -926,27 +1093,593 @@ def cleanup_object(obj, obj_name_for_log):
         logger.warning(f"Issue during cleanup of {log_name}: {remove_e}")
 
 
-# --- Operators ---
-
-class MESH_OT_open_export_directory(Operator):
-    """Opens the export directory in the file browser"""
-    bl_idname = "mesh.open_export_directory"
-    bl_label = "Open Export Directory"
-    bl_options = {"REGISTER"}
+def clone_export_object(obj, collection=None):
+    """
+    Copies an already prepared export object and its mesh data.
+    Used to derive LOD levels from a prepared base without redoing
+    the copy/setup/modifier steps.
     
-    @classmethod
-    def poll(cls, context):
-        """Enable only if export path is set and exists"""
-        scene_props = context.scene.mesh_exporter
-        if not scene_props or not scene_props.mesh_export_path:
-            return False
-        export_path = bpy.path.abspath(scene_props.mesh_export_path)
-        return os.path.exists(export_path)
+    Args:
+        obj (bpy.types.Object): The prepared object to clone.
+        collection (bpy.types.Collection, optional): Collection to link the
+            clone into. Defaults to the first collection of obj.
     
-    def execute(self, context):
-        """Opens the export directory"""
-        scene_props = context.scene.mesh_exporter
-        export_path = bpy.path.abspath(scene_props.mesh_export_path)
+    Returns:
+        bpy.types.Object: The cloned object.
+    """
+    if not obj or obj.type != "MESH":
+        raise ValueError("Invalid object provided for cloning.")
+    if collection is None:
+        collection = obj.users_collection[0]
+    clone_obj = obj.copy()
+    clone_obj.data = obj.data.copy()
+    collection.objects.link(clone_obj)
+    return clone_obj
+
+
+def get_lod_ratios(scene_props):
+    """
+    Returns the decimation ratio for every exported LOD level.
+    LOD0 is always the full resolution mesh (1.0).
+    
+    Args:
+        scene_props (bpy.types.PropertyGroup): Scene properties for export.
+    
+    Returns:
+        list: Ratios indexed by LOD level.
+    """
+    lod_ratios_prop = [
+        scene_props.mesh_export_lod_ratio_01,
+        scene_props.mesh_export_lod_ratio_02,
+        scene_props.mesh_export_lod_ratio_03,
+        scene_props.mesh_export_lod_ratio_04,
+    ]
+    return [1.0] + lod_ratios_prop[:scene_props.mesh_export_lod_count]
+
+
+def get_cascade_ratio(ratio, previous_ratio):
+    """
+    Converts an absolute LOD ratio into the ratio relative to the previous
+    LOD level, for decimating LODn from the output of LODn-1.
+    
+    Args:
+        ratio (float): Absolute ratio of this level (vs. full resolution).
+        previous_ratio (float): Absolute ratio of the previous level.
+    
+    Returns:
+        float: Relative ratio, clamped to 0.0-1.0.
+    """
+    if previous_ratio <= 0.0:
+        return ratio
+    return max(0.0, min(ratio / previous_ratio, 1.0))
+
+
+def get_collection_tri_budget(original_obj, scene_props):
+    """
+    Returns the triangle budget of the first collection of original_obj
+    that sets one, or the exporter's default budget.
+    """
+    for collection in original_obj.users_collection:
+        budget = getattr(collection, "mesh_export_tri_budget", 0)
+        if budget > 0:
+            return budget
+    return scene_props.mesh_export_lod_tri_budget
+
+
+def get_lod_tri_targets(scene_props, original_obj):
+    """
+    Returns the triangle budget of every exported LOD level.
+    
+    Args:
+        scene_props (bpy.types.PropertyGroup): Scene properties for export.
+        original_obj (bpy.types.Object): The original object, whose
+            collections may set a triangle budget.
+    
+    Returns:
+        list: Budgets indexed by LOD level (LOD0 is None, i.e. full
+            resolution), or None when LODs use plain ratios.
+    """
+    mode = scene_props.mesh_export_lod_target
+    count = scene_props.mesh_export_lod_count
+    if mode == "TRIANGLES":
+        budgets = [
+            scene_props.mesh_export_lod_tris_01,
+            scene_props.mesh_export_lod_tris_02,
+            scene_props.mesh_export_lod_tris_03,
+            scene_props.mesh_export_lod_tris_04,
+        ][:count]
+    elif mode == "BUDGET":
+        # The ratio fields are read as fractions of the collection budget
+        budget = get_collection_tri_budget(original_obj, scene_props)
+        budgets = [max(1, round(budget * ratio))
+                   for ratio in get_lod_ratios(scene_props)[1:]]
+    else:
+        return None
+    return [None] + budgets
+
+
+class DecimationTrials:
+    """
+    Trial decimations of one object's LOD chain, cached by source and
+    ratio so the ratio search never decimates the same thing twice.
+    """
+
+    def __init__(self):
+        # (source key, ratio) → (triangles, decimated mesh)
+        self.trials = {}
+
+    def get(self, source_key, ratio):
+        return self.trials.get((source_key, ratio))
+
+    def add(self, source_key, ratio, triangles, mesh):
+        self.trials[(source_key, ratio)] = (triangles, mesh)
+
+    def clear(self):
+        """Removes every cached trial mesh."""
+        for _, mesh in self.trials.values():
+            try:
+                bpy.data.meshes.remove(mesh)
+            except ReferenceError:
+                pass
+        self.trials.clear()
+
+
+def decimate_to_budget(obj, target_tris, scene_props, trials, source_key,
+                       cache=None):
+    """
+    Searches the decimation ratio whose result meets target_tris and
+    replaces obj's mesh with that result. Picks the largest result that
+    stays within the budget, or the smallest one if none does.
+    
+    Args:
+        obj (bpy.types.Object): The object to decimate.
+        target_tris (int): Triangle budget.
+        scene_props (bpy.types.PropertyGroup): Scene properties for export.
+        trials (DecimationTrials): Cache of trial decimations.
+        source_key (str): Identifies obj's current mesh within trials.
+        cache (decimation_cache.DecimationCache, optional): Result cache.
+    
+    Returns:
+        tuple: (ratio, triangles) of the chosen result.
+    """
+    source_tris = count_triangles(obj.data)
+    if source_tris <= target_tris:
+        logger.info(f"{obj.name}: {source_tris} tris already within "
+                    f"budget {target_tris}.")
+        return 1.0, source_tris
+
+    def run_trial(ratio):
+        ratio = round(ratio, LOD_RATIO_DECIMALS)
+        cached = trials.get(source_key, ratio)
+        if cached is not None:
+            return ratio, cached[0]
+        trial_obj = clone_export_object(obj)
+        try:
+            apply_decimate_modifier(
+                trial_obj, ratio,
+                scene_props.mesh_export_lod_type,
+                scene_props.mesh_export_lod_symmetry_axis,
+                scene_props.mesh_export_lod_symmetry,
+                cache,
+            )
+            triangles = count_triangles(trial_obj.data)
+            trials.add(source_key, ratio, triangles, trial_obj.data)
+        finally:
+            bpy.data.objects.remove(trial_obj, do_unlink=True)
+        return ratio, triangles
+
+    low, high = 0.0, 1.0
+    guess = target_tris / source_tris
+    best = None  # (ratio, triangles) of the largest result within budget
+    smallest = None
+    for _ in range(LOD_SEARCH_MAX_TRIALS):
+        ratio, triangles = run_trial(guess)
+        if smallest is None or triangles < smallest[1]:
+            smallest = (ratio, triangles)
+        if triangles <= target_tris:
+            if best is None or triangles > best[1]:
+                best = (ratio, triangles)
+            if triangles >= target_tris * (1.0 - LOD_BUDGET_TOLERANCE):
+                break
+            low = max(low, ratio)
+        else:
+            high = min(high, ratio)
+        # Proportional correction, kept inside the bracket
+        guess = ratio * target_tris / max(triangles, 1)
+        if not low < guess < high:
+            guess = (low + high) / 2.0
+        if high - low < 10 ** -LOD_RATIO_DECIMALS:
+            break
+
+    ratio, triangles = best or smallest
+    logger.info(f"{obj.name}: ratio {ratio:.4f} gives {triangles} tris "
+                f"(budget {target_tris}, {len(trials.trials)} trials cached)")
+    old_mesh = obj.data
+    obj.data = trials.get(source_key, ratio)[1].copy()
+    if old_mesh.users == 0:
+        bpy.data.meshes.remove(old_mesh)
+    return ratio, triangles
+
+
+def count_triangles(mesh):
+    """
+    Returns the number of triangles the mesh tessellates to.
+    Each polygon with n corners yields n - 2 triangles.
+    
+    Args:
+        mesh (bpy.types.Mesh): The mesh to count.
+    
+    Returns:
+        int: Triangle count.
+    """
+    if not mesh:
+        return 0
+    return len(mesh.loops) - 2 * len(mesh.polygons)
+
+
+class ObjectExportResult:
+    """Outcome of exporting one original object (all of its LOD levels)."""
+
+    def __init__(self, object_name):
+        self.object_name = object_name
+        self.exported_files = []
+        self.failures = []
+        # (lod_level, triangles, decimate seconds, total seconds)
+        self.lod_stats = []
+        # (path, lod_level, format, triangles, polygons, seconds) per
+        # written file, see export_history
+        self.file_records = []
+        # See export_stats.timed_stage
+        self.stage_records = []
+        # Decimation cache lookups of this object
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.elapsed = 0.0
+
+    @property
+    def success(self):
+        return not self.failures
+
+    def to_dict(self):
+        """Returns the result as a JSON-serialisable dict."""
+        return {
+            "object_name": self.object_name,
+            "exported_files": list(self.exported_files),
+            "failures": list(self.failures),
+            "lod_stats": [list(stat) for stat in self.lod_stats],
+            "file_records": [list(rec) for rec in self.file_records],
+            "stage_records": [list(rec) for rec in self.stage_records],
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "elapsed": self.elapsed,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Builds a result from a dict written by to_dict."""
+        result = cls(data["object_name"])
+        result.exported_files = list(data.get("exported_files", []))
+        result.failures = list(data.get("failures", []))
+        result.lod_stats = [tuple(stat) for stat in data.get("lod_stats", [])]
+        result.file_records = [tuple(rec) for rec
+                               in data.get("file_records", [])]
+        result.stage_records = [tuple(rec) for rec 
+                                in data.get("stage_records", [])]
+        result.cache_hits = data.get("cache_hits", 0)
+        result.cache_misses = data.get("cache_misses", 0)
+        result.elapsed = data.get("elapsed", 0.0)
+        return result
+
+
+def prepare_export_base(original_obj, context, scene_props, collection=None,
+                        records=None):
+    """
+    Builds the prepared base for an original object: copied, renamed,
+    transform-baked and with its base modifiers applied.
+    Every LOD level is cloned from this base.
+    
+    Args:
+        original_obj (bpy.types.Object): The original object.
+        context (bpy.context): The current Blender context.
+        scene_props (bpy.types.PropertyGroup): Scene properties for export.
+        collection (bpy.types.Collection, optional): Collection for the copy.
+        records (list, optional): Stage timing records to append to.
+    
+    Returns:
+        tuple: The prepared base object and the export base name.
+    """
+    name = original_obj.name
+    with timed_stage(records, "create_export_copy", name,
+                     obj=original_obj) as timer:
+        base_obj = create_export_copy(original_obj, context, collection)
+        timer.obj = base_obj
+    try:
+        with timed_stage(records, "setup_export_object", name, obj=base_obj):
+            (_, base_name) = setup_export_object(
+                base_obj, original_obj.name, scene_props
+            )
+        with timed_stage(records, "apply_mesh_modifiers", name, 
+                         obj=base_obj):
+            apply_mesh_modifiers(base_obj, 
+                                 scene_props.mesh_export_fast_modifiers)
+    except Exception:
+        cleanup_object(base_obj, f"{original_obj.name} (base)")
+        raise
+    return base_obj, base_name
+
+
+def decimate_export_object(obj, ratio, scene_props, result, lod_level,
+                           target_tris=None, trials=None, source_key=None,
+                           cache=None):
+    """
+    Applies the LOD decimation configured in scene_props to obj, either
+    with a fixed ratio or searching the ratio that meets target_tris.
+    Cache hits and misses are counted on result.
+    
+    Returns:
+        float: Seconds spent decimating.
+    """
+    if cache is not None:
+        hits, misses = cache.hits, cache.misses
+    with timed_stage(result.stage_records, "apply_decimate_modifier",
+                     result.object_name, lod_level, obj):
+        start = time.time()
+        if target_tris is not None:
+            decimate_to_budget(obj, target_tris, scene_props, trials,
+                               source_key, cache)
+        else:
+            apply_decimate_modifier(
+                obj, ratio,
+                scene_props.mesh_export_lod_type,
+                scene_props.mesh_export_lod_symmetry_axis,
+                scene_props.mesh_export_lod_symmetry,
+                cache,
+            )
+    if cache is not None:
+        result.cache_hits += cache.hits - hits
+        result.cache_misses += cache.misses - misses
+    return time.time() - start
+
+
+def finish_export_object(obj, file_path, scene_props, result, lod_level=None):
+    """
+    Triangulates (if enabled) and exports a prepared object to every
+    selected format, recording the written files in result.
+    
+    Returns:
+        bool: True if every format was exported.
+    """
+    name = result.object_name
+    records = result.stage_records
+    if scene_props.mesh_export_tri:
+        with timed_stage(records, "triangulate_mesh", name, lod_level, obj):
+            triangulate_mesh(
+                obj,
+                scene_props.mesh_export_tri_method,
+                scene_props.mesh_export_keep_normals
+            )
+    formats = get_export_formats(scene_props)
+    success = bool(formats)
+    triangles = count_triangles(obj.data)
+    polygons = len(obj.data.polygons)
+    for fmt in formats:
+        format_path = get_format_file_path(file_path, fmt, formats)
+        start = time.perf_counter()
+        with timed_stage(records, "export_object", name, lod_level, obj):
+            exported = export_object(obj, format_path, scene_props, fmt)
+        if exported:
+            path = get_export_filepath(format_path, scene_props, fmt)
+            result.exported_files.append(path)
+            result.file_records.append((
+                path, lod_level, fmt, triangles, polygons,
+                time.perf_counter() - start
+            ))
+        else:
+            success = False
+    return success
+
+
+def timed_cleanup(obj, obj_name_for_log, result, lod_level=None):
+    """cleanup_object with a stage timing record."""
+    if not obj:
+        return
+    with timed_stage(result.stage_records, "cleanup_object",
+                     result.object_name, lod_level, obj):
+        cleanup_object(obj, obj_name_for_log)
+
+
+def iter_export_steps(original_obj, context, scene_props, export_base_path,
+                      result, collection=None, texture_pyramid=None,
+                      cache=None):
+    """
+    Generator form of export_original_object. Yields after the base is
+    prepared and after each LOD level so callers can interleave UI work;
+    closing it early still removes every temporary object.
+    
+    Args:
+        original_obj (bpy.types.Object): The original object to export.
+        context (bpy.context): The current Blender context.
+        scene_props (bpy.types.PropertyGroup): Scene properties for export.
+        export_base_path (str): Absolute export directory.
+        result (ObjectExportResult): Result to fill in.
+        collection (bpy.types.Collection, optional): Collection for the
+            temporary objects. Defaults to the scratch collection.
+        texture_pyramid (texture_lod.TexturePyramid, optional): Batch
+            pyramid of downscaled LOD textures.
+        cache (decimation_cache.DecimationCache, optional): Batch
+            decimation result cache.
+    
+    Yields:
+        None
+    """
+    try:
+        base_obj, base_name = prepare_export_base(
+            original_obj, context, scene_props, collection,
+            result.stage_records
+        )
+    except Exception as e:
+        logger.error(f"Failed preparing {original_obj.name}: {e}")
+        result.failures.append(f"{original_obj.name} (Processing Error)")
+        return
+
+    if not scene_props.mesh_export_lod:
+        # --- Non-LOD Branch ---
+        export_obj_name = base_obj.name
+        try:
+            logger.info("Processing single export (no LODs)..")
+            file_path = os.path.join(export_base_path, base_name)
+            if not finish_export_object(base_obj, file_path, 
+                                        scene_props, result):
+                result.failures.append(original_obj.name)
+        except Exception as e:
+            logger.error(f"Failed processing {export_obj_name}: {e}")
+            result.failures.append(f"{original_obj.name} (Processing Error)")
+        finally:
+            timed_cleanup(base_obj, export_obj_name, result)
+        return
+
+    # --- LOD Branch ---
+    ratios = get_lod_ratios(scene_props)
+    targets = get_lod_tri_targets(scene_props, original_obj)
+    if targets is None:
+        targets = [None] * len(ratios)
+    trials = DecimationTrials()
+    cascade = scene_props.mesh_export_lod_cascade
+    logger.info(f"Generating {len(ratios)} LOD levels from prepared base "
+                f"({'cascaded' if cascade else 'absolute'} ratios)...")
+    chain_obj = None
+    chain_ratio = 1.0
+    try:
+        yield
+        for lod_level, ratio in enumerate(ratios):
+            lod_obj = None
+            lod_obj_name = None
+            level_start = time.time()
+            decimate_time = 0.0
+            try:
+                logger.info(f"Preparing LOD{lod_level}...")
+                if lod_level > 0 and cascade:
+                    # Decimate the running chain from the previous level's
+                    # output, then export a clone of it
+                    if chain_obj is None:
+                        chain_obj = clone_export_object(base_obj)
+                    decimate_time = decimate_export_object(
+                        chain_obj, get_cascade_ratio(ratio, chain_ratio),
+                        scene_props, result, lod_level,
+                        targets[lod_level], trials, f"chain{lod_level}",
+                        cache
+                    )
+                    chain_ratio = ratio
+                    source_obj = chain_obj
+                else:
+                    source_obj = base_obj
+                with timed_stage(result.stage_records, "create_export_copy",
+                                 original_obj.name, lod_level, 
+                                 source_obj) as timer:
+                    lod_obj = clone_export_object(source_obj)
+                    timer.obj = lod_obj
+                lod_obj.name = get_lod_name(base_name, lod_level)
+                lod_obj_name = lod_obj.name
+                if lod_level > 0 and not cascade:
+                    decimate_time = decimate_export_object(
+                        lod_obj, ratio, scene_props, result, lod_level,
+                        targets[lod_level], trials, "base", cache
+                    )
+                if lod_level > 0 and scene_props.mesh_export_lod_textures:
+                    with timed_stage(result.stage_records,
+                                     "compress_textures", original_obj.name,
+                                     lod_level, lod_obj):
+                        compress_textures(lod_obj, lod_level, texture_pyramid)
+                lod_file_path = os.path.join(export_base_path, lod_obj_name)
+                if not finish_export_object(lod_obj, lod_file_path,
+                                            scene_props, result, lod_level):
+                    raise RuntimeError("Export func failed")
+                triangles_before_export = count_triangles(lod_obj.data)
+                result.lod_stats.append((
+                    lod_level, triangles_before_export, decimate_time,
+                    time.time() - level_start
+                ))
+
+            except Exception as lod_e:
+                log_name = (
+                    lod_obj_name if lod_obj_name else
+                    f"{original_obj.name}_LOD{lod_level:02d}"
+                )
+                logger.error(f"Failed processing {log_name}: {lod_e}")
+                result.failures.append(
+                    f"{original_obj.name} (LOD{lod_level:02d})"
+                )
+            finally:
+                timed_cleanup(lod_obj, lod_obj_name, result, lod_level)
+            yield
+    finally:
+        trials.clear()
+        cleanup_object(chain_obj, f"{base_name} (LOD chain)")
+        timed_cleanup(base_obj, f"{base_name} (base)", result)
+
+    if result.lod_stats:
+        logger.info(
+            f"LOD summary for {original_obj.name} "
+            f"({'cascade' if cascade else 'absolute'}): " +
+            " | ".join(
+                f"LOD{lvl:02d}: {tris} tris, decimate {dec_t:.2f}s, "
+                f"total {tot_t:.2f}s"
+                for lvl, tris, dec_t, tot_t in result.lod_stats
+            )
+        )
+
+
+def export_original_object(original_obj, context, scene_props,
+                           export_base_path, collection=None,
+                           texture_pyramid=None, cache=None):
+    """
+    Runs the full export pipeline for one original object:
+    prepare base → (clone → decimate per LOD) → triangulate → export.
+    
+    Args:
+        original_obj (bpy.types.Object): The original object to export.
+        context (bpy.context): The current Blender context.
+        scene_props (bpy.types.PropertyGroup): Scene properties for export.
+        export_base_path (str): Absolute export directory.
+        collection (bpy.types.Collection, optional): Collection for the
+            temporary objects. Defaults to the scratch collection.
+        texture_pyramid (texture_lod.TexturePyramid, optional): Batch
+            pyramid of downscaled LOD textures.
+        cache (decimation_cache.DecimationCache, optional): Batch
+            decimation result cache.
+    
+    Returns:
+        ObjectExportResult: Exported files and failures for this object.
+    """
+    result = ObjectExportResult(original_obj.name)
+    for _ in iter_export_steps(original_obj, context, scene_props,
+                               export_base_path, result, collection,
+                               texture_pyramid, cache):
+        pass
+    return result
+
+
+# --- Operators ---
+
+class MESH_OT_open_export_directory(Operator):
+    """Opens the export directory in the file browser"""
+    bl_idname = "mesh.open_export_directory"
+    bl_label = "Open Export Directory"
+    bl_options = {"REGISTER"}
+    
+    @classmethod
+    def poll(cls, context):
+        """Enable only if export path is set and exists"""
+        scene_props = context.scene.mesh_exporter
+        if not scene_props or not scene_props.mesh_export_path:
+            return False
+        export_path = bpy.path.abspath(scene_props.mesh_export_path)
+        return os.path.exists(export_path)
+    
+    def execute(self, context):
+        """Opens the export directory"""
+        scene_props = context.scene.mesh_exporter
+        export_path = bpy.path.abspath(scene_props.mesh_export_path)
         
         if not os.path.exists(export_path):
             self.report({"ERROR"}, f"导出目录不存在: {export_path}")
@@ -973,34 +1706,256 @@ class MESH_OT_open_export_directory(Operator):
             return {"CANCELLED"}
 
 
+class ExportProgress:
+    """Throughput-based progress and ETA for a running batch."""
+
+    def __init__(self, total_work):
+        self.total_work = max(total_work, 1)
+        self.done_work = 0
+        self.start_time = time.time()
+
+    @property
+    def fraction(self):
+        return min(self.done_work / self.total_work, 1.0)
+
+    def eta(self):
+        """
+        Returns the estimated seconds left at the throughput measured so
+        far, or None until the first unit of work has finished.
+        """
+        elapsed = time.time() - self.start_time
+        if self.done_work <= 0 or elapsed <= 0:
+            return None
+        throughput = self.done_work / elapsed
+        return max(self.total_work - self.done_work, 0) / throughput
+
+
+def format_duration(seconds):
+    """Formats seconds as e.g. '45s', '3m 05s' or '1h 02m'."""
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m {seconds % 60:02d}s"
+    return f"{seconds // 3600}h {(seconds % 3600) // 60:02d}m"
+
+
+# The modal batch export currently running, if any
+_active_batch = None
+
+
+def get_active_batch():
+    """Returns the running modal MESH_OT_batch_export, or None."""
+    return _active_batch
+
+
 class MESH_OT_batch_export(Operator):
-    """Exports selected mesh objects sequentially with status bar progress."""
+    """Exports selected mesh objects with status bar progress and ETA.
+Press Esc to cancel"""
     bl_idname = "mesh.batch_export"
     bl_label = "Export Selected Meshes"
+    # UNDO keeps the nested operator calls (modifier_apply, exporters) from
+    # pushing undo steps of their own. The scratch scene is removed before
+    # the single push at the end, so that step only holds the export
+    # markers set on the original objects.
     bl_options = {"REGISTER", "UNDO"}
+    # Continue the unfinished batch of the export directory's journal
+    resuming = False
 
     @classmethod
     def poll(cls, context):
-        """Enable only if mesh objects are selected."""
+        """Enable only if mesh objects are selected and no batch runs."""
+        if get_active_batch() is not None:
+            return False
         return any(obj.type == "MESH" for obj in context.selected_objects)
 
     def execute(self, context):
-        """Runs the batch export process."""
-        scene = context.scene
-        scene_props = scene.mesh_exporter
+        """Runs the whole batch in one blocking call (scripts, headless)."""
+        status = self.begin_batch(context)
+        if status is not None:
+            return status
+
         wm = context.window_manager
-        start_time = time.time()
+        wm.progress_begin(0, len(self.objects_to_export))
+        # Nothing else can edit the file during a blocking batch
+        export_indicators.pause_dirty_tracking()
+        try:
+            if self.use_parallel():
+                self.export_parallel(context)
+            else:
+                self.export_sequential(context)
+        finally:
+            wm.progress_end()
+            self.end_batch(context)
+            export_indicators.resume_dirty_tracking()
 
-        objects_to_export = [
-            obj for obj in context.selected_objects if obj.type == "MESH"
-        ]
-        total_objects = len(objects_to_export)
+        self.report_results(context, time.time() - self.start_time)
+        return {"FINISHED"}
 
-        if not objects_to_export:
-            self.report({"WARNING"}, "No mesh objects selected.")
-            logger.warning("Export cancelled: No mesh objects selected.")
+    def invoke(self, context, event):
+        """
+        Starts a non-blocking batch: a modal timer runs a bounded amount
+        of export work per tick so the UI stays responsive.
+        """
+        global _active_batch
+
+        status = self.begin_batch(context)
+        if status is not None:
+            return status
+
+        self.job = None
+        self.job_recorded = False
+        self.steps = None
+        self.current_result = None
+        self.current_original = None
+        # Temporary objects in the scratch scene after the last tick
+        self.scratch_names = set()
+        self.status_text = ""
+        self.pending = collections.deque(
+            obj.name for obj in self.objects_to_export
+        )
+        self.started_count = 0
+        try:
+            if self.use_parallel():
+                self.job = self.create_parallel_job()
+                self.job.start()
+                self.progress = ExportProgress(self.job.total_objects)
+            else:
+                self.scratch_scene = get_scratch_scene(context.scene)
+                self.scratch_names = {
+                    obj.name for obj in self.scratch_scene.collection.objects
+                }
+                lod_count = (self.settings.mesh_export_lod_count
+                             if self.settings.mesh_export_lod else 0)
+                self.costs = {
+                    obj.name: estimate_export_cost(obj, lod_count)
+                    for obj in self.objects_to_export
+                }
+                self.progress = ExportProgress(sum(self.costs.values()))
+        except Exception as e:
+            logger.error(f"Could not start export: {e}", exc_info=True)
+            self.report({"ERROR"}, f"Could not start export: {e}")
+            if self.job:
+                self.job.cancel()
+            remove_scratch_scene()
+            self.end_batch(context)
             return {"CANCELLED"}
 
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(MODAL_TIMER_INTERVAL,
+                                         window=context.window)
+        wm.modal_handler_add(self)
+        _active_batch = self
+        # The user works between ticks; only the ticks' datablocks are
+        # the batch's to purge
+        self.memory.end_work()
+        self.update_status(context)
+        return {"RUNNING_MODAL"}
+
+    def modal(self, context, event):
+        """Advances the batch on timer ticks; Esc cancels it."""
+        if event.type == "ESC" and event.value == "PRESS":
+            logger.info("Export cancelled by user.")
+            self.cancelled = True
+            return self.finish_modal(context)
+        if event.type != "TIMER":
+            if self.is_blocked_event(context, event):
+                return {"RUNNING_MODAL"}
+            return {"PASS_THROUGH"}
+
+        if not self.job and not self.batch_data_valid():
+            # Undo from a menu or a script removed data the batch holds
+            logger.error("Export data changed during the batch, aborting.")
+            self.failed_exports.append("Batch (Data Changed)")
+            self.overall_success = False
+            self.cancelled = True
+            return self.finish_modal(context)
+
+        # Only this tick's own edits (temporary objects, texture LODs on
+        # shared materials) are ignored; user edits between ticks still
+        # mark objects dirty
+        export_indicators.pause_dirty_tracking()
+        self.memory.begin_work()
+        try:
+            if self.job:
+                done = self.poll_parallel()
+            else:
+                with scratch_scene_override(context, self.scratch_scene):
+                    done = self.step_sequential(context)
+                    self.scratch_names = {
+                        obj.name
+                        for obj in self.scratch_scene.collection.objects
+                    }
+        except Exception as e:
+            logger.error(f"Unexpected error during export: {e}",
+                         exc_info=True)
+            self.failed_exports.append("Batch (Outer Error)")
+            self.overall_success = False
+            self.cancelled = True
+            done = True
+        finally:
+            self.memory.end_work()
+            export_indicators.resume_dirty_tracking()
+        if done:
+            return self.finish_modal(context)
+        self.update_status(context)
+        return {"PASS_THROUGH"}
+
+    def is_blocked_event(self, context, event):
+        """
+        True for undo/redo, and for editing keys (see MODAL_EDIT_KEYS) in
+        the 3D Viewport and Outliner. Text and node editors keep their
+        keys; batch_data_valid catches anything else that frees data.
+        """
+        if event.type in MODAL_UNDO_KEYS:
+            return event.ctrl or event.oskey
+        if event.type not in MODAL_EDIT_KEYS:
+            return False
+        # context.area is the area the batch started in, keys go to the
+        # area under the mouse
+        screen = context.window.screen if context.window else None
+        for area in (screen.areas if screen else ()):
+            if (area.x <= event.mouse_x < area.x + area.width
+                    and area.y <= event.mouse_y < area.y + area.height):
+                return area.type in MODAL_EDIT_AREAS
+        return False
+
+    def batch_data_valid(self):
+        """
+        Checks that the data a sequential batch holds between ticks still
+        exists: the scratch scene, the temporary objects in it and the
+        object being exported.
+        """
+        try:
+            if bpy.data.scenes.get(SCRATCH_SCENE_NAME) != self.scratch_scene:
+                return False
+            names = {obj.name
+                     for obj in self.scratch_scene.collection.objects}
+            if self.current_original is not None and (
+                    bpy.data.objects.get(self.current_result.object_name)
+                    != self.current_original):
+                return False
+        except ReferenceError:
+            return False
+        return names == self.scratch_names
+
+    def cancel(self, context):
+        """Called by Blender if the modal batch is aborted externally."""
+        self.cancelled = True
+        self.finish_modal(context, report=False)
+
+    def begin_batch(self, context):
+        """
+        Validates the selection and export path and initialises the batch
+        state shared by execute and invoke.
+        
+        Returns:
+            set: An operator return value if there is nothing to export,
+                otherwise None.
+        """
+        scene_props = context.scene.mesh_exporter
+        self.start_time = time.time()
+
         # Validate export path
         export_base_path = bpy.path.abspath(scene_props.mesh_export_path)
         if not os.path.isdir(export_base_path):
@@ -1016,176 +1971,556 @@ class MESH_OT_batch_export(Operator):
                 logger.error(err_msg)
                 return {"CANCELLED"}
 
-        successful_exports = 0
-        failed_exports = []
-        overall_success = True
+        # Settings are frozen for the whole batch, so edits made while a
+        # modal export runs don't leak into half of the objects
+        self.settings_dict = settings_as_dict(scene_props)
+        self.journal = export_journal.ExportJournal(export_base_path)
+        if self.resuming:
+            self.journal.load()
+            if not self.journal.resumable:
+                self.report({"WARNING"}, "No unfinished batch to resume.")
+                return {"CANCELLED"}
+            # A resumed batch continues with the settings it started with
+            self.settings_dict.update(upgrade_settings_dict(
+                dict(self.journal.header["settings"])
+            ))
+        self.settings = SimpleNamespace(**self.settings_dict)
+        if not get_export_formats(self.settings):
+            self.report({"WARNING"}, "No export format selected.")
+            return {"CANCELLED"}
+        self.export_base_path = export_base_path
+        self.successful_exports = 0
+        self.failed_exports = []
+        self.overall_success = True
+        self.cancelled = False
+        # {lod_level: [triangles, decimate seconds, total seconds]}
+        self.lod_totals = {}
+        self.object_time = 0.0
+        self.worker_count = 0
+        self.manifest = None
+        self.fingerprints = {}
+        self.settings_hash = None
+        self.mesh_cache = {}
+        self.skipped_objects = 0
+        self.finished_objects = 0
+        # {representative name: [names of its duplicates]}
+        self.duplicates = {}
+        self.deduplicated_objects = 0
+        self.instance_mapping = None
+
+        objects_to_export = self.collect_objects(context)
+        if not objects_to_export:
+            if self.resuming:
+                message = (f"All {self.skipped_objects} objects of the "
+                           f"last batch are exported. Nothing to resume.")
+                self.journal.end()
+                logger.info(message)
+                self.report({"INFO"}, message)
+                return {"FINISHED"}
+            self.report({"WARNING"}, "No mesh objects selected.")
+            logger.warning("Export cancelled: No mesh objects selected.")
+            return {"CANCELLED"}
+
+        if self.settings.mesh_export_incremental:
+            objects_to_export = self.filter_unchanged(objects_to_export)
+            if not objects_to_export:
+                self.manifest.save()
+                message = (f"All {self.skipped_objects} selected objects "
+                           f"are up to date. Nothing exported.")
+                logger.info(message)
+                self.report({"INFO"}, message)
+                return {"FINISHED"}
+
+        # Batch resources are created once nothing can end the batch
+        # before end_batch releases them
+        self.stats = export_stats.ExportStats()
+        self.stats.export_dir = export_base_path
+        self.decimation_cache = decimation_cache.get_cache(self.settings)
+        self.texture_pyramid = texture_lod.TexturePyramid(
+            self.settings.mesh_export_texture_cache_mb * 1024 * 1024
+        )
+        self.memory = export_memory.MemoryMonitor(
+            self.settings.mesh_export_purge_interval
+            if self.settings.mesh_export_bounded_memory else 0
+        )
+        self.history = None
+        if self.settings.mesh_export_history:
+            try:
+                self.history = export_history.ExportHistory(
+                    export_base_path
+                ).open()
+            except sqlite3.Error as e:
+                logger.warning(f"Export history disabled: {e}")
 
+        if not self.resuming:
+            self.journal.start([obj.name for obj in objects_to_export],
+                               self.settings_dict)
+
+        if self.settings.mesh_export_dedupe != "NONE":
+            objects_to_export = self.group_duplicates(objects_to_export)
+
+        self.objects_to_export = objects_to_export
         logger.info(
-            f"Starting batch export for {total_objects} "
+            f"Starting batch export for {len(objects_to_export)} "
             f"objects to {export_base_path}"
         )
-        wm.progress_begin(0, total_objects)
-        try:
-            # --- Main Export Loop ---
-            for index, original_obj in enumerate(objects_to_export):
-                wm.progress_update(index + 1)
-                logger.info(
-                    f"Processing ({index + 1}/{total_objects}): "
-                    f"{original_obj.name}"
-                )
-                object_processed_successfully = True
+        return None
+
+    def end_batch(self, context):
+        """
+        Frees batch textures, saves the manifest and the timings, and
+        closes the journal once every object is done.
+        """
+        self.texture_pyramid.release()
+        if self.decimation_cache is not None:
+            self.decimation_cache.evict()
+        self.memory.finish()
+        self.stats.memory_summary = self.memory.summary()
+        if self.manifest:
+            self.manifest.save()
+        if self.instance_mapping:
+            self.instance_mapping.save()
+        if self.history:
+            try:
+                self.history.close()
+            except sqlite3.Error as e:
+                logger.error(f"Could not write export history: {e}")
+        if (not self.cancelled
+                and self.finished_objects == len(self.objects_to_export)):
+            self.journal.end()
+        export_stats.set_last_batch_stats(self.stats)
+
+    def use_parallel(self):
+        return (self.settings.mesh_export_parallel
+                and len(self.objects_to_export) > 1)
+
+    def collect_objects(self, context):
+        """Returns the objects to export: the selected meshes."""
+        return [
+            obj for obj in context.selected_objects if obj.type == "MESH"
+        ]
 
-                try:
-                    # --- Process One Original Object ---
-                    if scene_props.mesh_export_lod:
-                        # --- LOD Branch ---
-                        logger.info(
-                            f"Generating "
-                            f"{scene_props.mesh_export_lod_count + 1} "
-                            f"LOD levels..."
-                        )
-                        lod_ratios_prop = [
-                            scene_props.mesh_export_lod_ratio_01,
-                            scene_props.mesh_export_lod_ratio_02,
-                            scene_props.mesh_export_lod_ratio_03,
-                            scene_props.mesh_export_lod_ratio_04,
-                        ]
-                        ratios = (
-                            [1.0] 
-                            + lod_ratios_prop[
-                                :scene_props.mesh_export_lod_count
-                            ]
-                        )
+    def get_fingerprint(self, obj):
+        """
+        Returns obj's export fingerprint (see export_manifest), computed
+        once per batch. Raises if obj can't be fingerprinted.
+        """
+        from . import export_manifest
+
+        fingerprint = self.fingerprints.get(obj.name)
+        if fingerprint is None:
+            fingerprint = export_manifest.fingerprint_object(
+                obj, self.get_settings_hash(), self.mesh_cache
+            )
+            self.fingerprints[obj.name] = fingerprint
+        return fingerprint
 
-                        for lod_level, ratio in enumerate(ratios):
-                            lod_obj = None
-                            lod_obj_name = None
-                            try:
-                                logger.info(f"Preparing LOD{lod_level}...")
-                                lod_obj = create_export_copy(
-                                    original_obj, 
-                                    context
-                                )
-                                (lod_obj_name, _) = setup_export_object(
-                                    lod_obj, original_obj.name,
-                                    scene_props, lod_level
-                                )
-                                apply_mesh_modifiers(lod_obj) # Base modifiers
-                                if lod_level > 0:
-                                    apply_decimate_modifier(
-                                        lod_obj, ratio,
-                                        scene_props.mesh_export_lod_type,
-                                        scene_props.mesh_export_lod_symmetry_axis,
-                                        scene_props.mesh_export_lod_symmetry,
-                                    )
-                                if scene_props.mesh_export_tri:
-                                    # Trying to avoid long line
-                                    method=scene_props.mesh_export_tri_method
-                                    k_nrms=scene_props.mesh_export_keep_normals
-                                    triangulate_mesh(lod_obj, method, k_nrms)
-
-                                lod_file_path = os.path.join(export_base_path,
-                                                             lod_obj_name)
-                                if export_object(lod_obj, lod_file_path,
-                                                 scene_props):
-                                    successful_exports += 1
-                                else:
-                                    raise RuntimeError("Export func failed")
-
-                            except Exception as lod_e:
-                                object_processed_successfully = False
-                                log_name = (
-                                    lod_obj_name if lod_obj_name else
-                                    f"{original_obj.name}_LOD{lod_level:02d}"
-                                    )
-                                logger.error(
-                                    f"Failed processing {log_name}: {lod_e}"
-                                )
-                                failed_exports.append(
-                                    f"{original_obj.name} (LOD{lod_level:02d})"
-                                )
-                            finally:
-                                cleanup_object(lod_obj, lod_obj_name)
-                        # --- End LOD Level Loop ---
-
-                    else:
-                        # --- Non-LOD Branch ---
-                        export_obj = None
-                        export_obj_name = None
-                        try:
-                            logger.info("Processing single export (no LODs)..")
-                            export_obj = create_export_copy(
-                                original_obj, 
-                                context
-                            )
-                            (export_obj_name, base_name) = setup_export_object(
-                                export_obj, original_obj.name, scene_props
-                            )
-                            apply_mesh_modifiers(export_obj)
-                            if scene_props.mesh_export_tri:
-                                triangulate_mesh(
-                                    export_obj,
-                                    scene_props.mesh_export_tri_method,
-                                    scene_props.mesh_export_keep_normals
-                                )
-
-                            file_path = os.path.join(
-                                export_base_path, base_name)
-                            if export_object(
-                                export_obj, file_path, scene_props):
-                                successful_exports += 1
-                            else:
-                                object_processed_successfully = False
-                                failed_exports.append(original_obj.name)
-
-                        except Exception as e:
-                            object_processed_successfully = False
-                            log_name = (export_obj_name if export_obj_name else
-                                        original_obj.name)
-                            logger.error(f"Failed processing {log_name}: {e}")
-                            failed_exports.append(
-                                f"{original_obj.name} (Processing Error)"
-                            )
-                        finally:
-                            cleanup_object(export_obj, export_obj_name)
-                    # --- End Non-LOD Branch ---
-
-                except Exception as outer_e:
-                    logger.error(
-                        f"Unexpected outer error during processing of "
-                        f"{original_obj.name}: {outer_e}",
-                        exc_info=True
+    def get_settings_hash(self):
+        """Hash of the batch's output settings, computed once."""
+        from . import export_manifest
+
+        if self.settings_hash is None:
+            self.settings_hash = export_manifest.fingerprint_settings(
+                self.settings_dict
+            )
+        return self.settings_hash
+
+    def filter_unchanged(self, objects_to_export):
+        """
+        Drops objects whose fingerprint matches the manifest and whose
+        output files still exist.
+        """
+        from . import export_manifest
+
+        self.manifest = export_manifest.ExportManifest(
+            self.export_base_path
+        ).load()
+        changed = []
+        for obj in objects_to_export:
+            try:
+                fingerprint = self.get_fingerprint(obj)
+            except Exception as e:
+                logger.warning(f"Could not fingerprint {obj.name}, "
+                               f"exporting it: {e}")
+                changed.append(obj)
+                continue
+            if self.manifest.is_up_to_date(obj.name, fingerprint):
+                self.skipped_objects += 1
+            else:
+                changed.append(obj)
+        logger.info(f"Incremental export: {len(changed)} changed, "
+                    f"{self.skipped_objects} unchanged objects.")
+        return changed
+
+    def group_duplicates(self, objects_to_export):
+        """
+        Keeps one representative per group of objects with identical
+        export output. The others are handled by record_duplicates once
+        their representative is exported.
+        """
+        from . import export_dedupe
+
+        groups = export_dedupe.group_duplicates(objects_to_export,
+                                                self.settings_dict)
+        for group in groups:
+            if len(group) > 1:
+                self.duplicates[group[0].name] = [obj.name
+                                                  for obj in group[1:]]
+        if self.settings.mesh_export_dedupe == "MAPPING":
+            self.instance_mapping = export_dedupe.InstanceMapping(
+                self.export_base_path
+            ).load()
+        logger.info(f"Deduplication: {len(groups)} of "
+                    f"{len(objects_to_export)} objects to export.")
+        return [group[0] for group in groups]
+
+    # --- Sequential ---
+
+    def export_sequential(self, context):
+        """
+        Exports objects one after another in this Blender process.
+        All temporary work happens inside the scratch scene.
+        """
+        wm = context.window_manager
+        total_objects = len(self.objects_to_export)
+        scratch_scene = get_scratch_scene(context.scene)
+        try:
+            with scratch_scene_override(context, scratch_scene):
+                # --- Main Export Loop ---
+                for index, original_obj in enumerate(self.objects_to_export):
+                    wm.progress_update(index + 1)
+                    logger.info(
+                        f"Processing ({index + 1}/{total_objects}): "
+                        f"{original_obj.name}"
                     )
-                    object_processed_successfully = False
-                    failed_exports.append(f"{original_obj.name} (Outer Error)")
-                finally:
-                    # Mark Original Object
-                    if original_obj and object_processed_successfully:
-                        export_indicators.mark_object_as_exported(original_obj)
-                        logger.info(
-                            f"Marked original {original_obj.name} as exported."
+                    result = ObjectExportResult(original_obj.name)
+                    object_start = time.time()
+                    try:
+                        result = export_original_object(
+                            original_obj, context, self.settings,
+                            self.export_base_path, scratch_scene.collection,
+                            self.texture_pyramid, self.decimation_cache
                         )
-                    elif original_obj:
-                        logger.info(
-                            f"Skipped marking original {original_obj.name} "
-                            f"due to errors."
+                    except Exception as outer_e:
+                        logger.error(
+                            f"Unexpected outer error during processing of "
+                            f"{original_obj.name}: {outer_e}",
+                            exc_info=True
                         )
-                        overall_success = False
-            # --- End Main Object Loop ---
+                        result.failures.append(
+                            f"{original_obj.name} (Outer Error)"
+                        )
+                    result.elapsed = time.time() - object_start
+                    self.record_result(original_obj, result)
+                # --- End Main Object Loop ---
         finally:
-            wm.progress_end()
+            remove_scratch_scene()
+
+    def step_sequential(self, context):
+        """
+        Runs export steps (base preparation, single LOD levels) until
+        this tick's time budget is used up.
+        
+        Returns:
+            bool: True once every object has been processed.
+        """
+        tick_end = time.perf_counter() + MODAL_TICK_BUDGET
+        while True:
+            if self.steps is None:
+                if not self.pending:
+                    return True
+                self.start_next_object(context)
+                continue
+            try:
+                next(self.steps)
+            except StopIteration:
+                self.finish_current_object()
+            except Exception as outer_e:
+                logger.error(
+                    f"Unexpected outer error during processing of "
+                    f"{self.current_result.object_name}: {outer_e}",
+                    exc_info=True
+                )
+                self.current_result.failures.append(
+                    f"{self.current_result.object_name} (Outer Error)"
+                )
+                self.finish_current_object()
+            if time.perf_counter() >= tick_end:
+                return False
+
+    def start_next_object(self, context):
+        """Creates the export step generator for the next queued object."""
+        name = self.pending.popleft()
+        self.started_count += 1
+        self.current_result = ObjectExportResult(name)
+        self.current_start = time.time()
+        original_obj = bpy.data.objects.get(name)
+        if original_obj is None or original_obj.type != "MESH":
+            # Deleted or renamed while the batch was running
+            logger.warning(f"Skipping {name}: object no longer exists.")
+            self.current_result.failures.append(f"{name} (Missing)")
+            self.finish_current_object()
+            return
+        logger.info(f"Processing ({self.started_count}/"
+                    f"{len(self.objects_to_export)}): {name}")
+        self.current_original = original_obj
+        self.steps = iter_export_steps(
+            original_obj, context, self.settings, self.export_base_path,
+            self.current_result, self.scratch_scene.collection,
+            self.texture_pyramid, self.decimation_cache
+        )
+
+    def finish_current_object(self):
+        result = self.current_result
+        result.elapsed = time.time() - self.current_start
+        self.steps = None
+        self.current_result = None
+        self.current_original = None
+        self.progress.done_work += self.costs.get(result.object_name, 0)
+        self.record_result(bpy.data.objects.get(result.object_name), result)
+
+    # --- Parallel ---
 
-        # --- Final Report ---
-        end_time = time.time()
-        elapsed_time = end_time - start_time
-        log_level = logging.INFO if overall_success else logging.WARNING
+    def create_parallel_job(self):
+        from . import parallel_export
+
+        job = parallel_export.ParallelExportJob(
+            self.objects_to_export, self.settings_dict,
+            self.export_base_path, self.settings.mesh_export_parallel_workers
+        )
+        self.worker_count = len(job.shards)
+        logger.info(f"Exporting in {self.worker_count} worker processes...")
+        return job
+
+    def export_parallel(self, context):
+        """Exports objects in background worker processes."""
+        wm = context.window_manager
+        job = self.create_parallel_job()
+        try:
+            job.start()
+            job.wait(progress_callback=wm.progress_update)
+            self.record_parallel_results(job)
+        except Exception:
+            job.cancel()
+            raise
+        finally:
+            job.cleanup()
+
+    def poll_parallel(self):
+        """
+        Updates progress from the workers without blocking.
+        
+        Returns:
+            bool: True once every worker has exited.
+        """
+        self.progress.done_work = self.job.completed_count()
+        if self.job.is_running():
+            return False
+        self.record_parallel_results(self.job)
+        self.job_recorded = True
+        return True
+
+    def record_parallel_results(self, job, missing_label="Worker Error"):
+        for data in job.collect_results(missing_label):
+            result = ObjectExportResult.from_dict(data)
+            self.record_result(
+                bpy.data.objects.get(result.object_name), result
+            )
+
+    # --- Modal ---
+
+    def update_status(self, context):
+        """Shows progress, throughput ETA and the cancel hint."""
+        total = len(self.objects_to_export)
+        text = (f"Exporting {self.finished_objects}/{total} "
+                f"({self.progress.fraction:.0%})")
+        if self.current_result:
+            text += f": {self.current_result.object_name}"
+        eta = self.progress.eta()
+        text += (f" | ETA {format_duration(eta)}" if eta is not None
+                 else " | ETA estimating...")
+        text += " | Esc to cancel"
+        self.status_text = text
+        context.workspace.status_text_set(text)
+        for window in context.window_manager.windows:
+            for area in window.screen.areas:
+                if area.type == "VIEW_3D":
+                    area.tag_redraw()
+
+    def finish_modal(self, context, report=True):
+        """Stops the timer, cleans up and reports (partial) results."""
+        global _active_batch
+
+        context.window_manager.event_timer_remove(self._timer)
+        self._timer = None
+        # Cleanup restores materials and removes temporary objects
+        export_indicators.pause_dirty_tracking()
+        self.memory.begin_work()
+        try:
+            if self.job:
+                if not self.job_recorded:
+                    self.job.cancel()
+                    # Only objects the workers finished before cancelling
+                    self.record_parallel_results(self.job, None)
+                self.job.cleanup()
+            else:
+                if self.steps is not None:
+                    # Runs the pipeline's cleanup of temporary objects
+                    try:
+                        self.steps.close()
+                    except Exception as e:
+                        # Objects freed by an undo can't be cleaned up
+                        logger.warning(f"Cleanup after cancel failed: {e}")
+                    self.current_result.failures.append(
+                        f"{self.current_result.object_name} (Cancelled)"
+                    )
+                    self.finish_current_object()
+                remove_scratch_scene()
+        finally:
+            context.workspace.status_text_set(None)
+            _active_batch = None
+            self.end_batch(context)
+            export_indicators.resume_dirty_tracking()
+
+        if report:
+            self.report_results(context, time.time() - self.start_time)
+        return {"CANCELLED"} if self.cancelled else {"FINISHED"}
+
+    def record_result(self, original_obj, result):
+        """Merges one object's result into the batch totals and marks it."""
+        self.finished_objects += 1
+        self.successful_exports += len(result.exported_files)
+        self.failed_exports.extend(result.failures)
+        self.object_time += result.elapsed
+        self.stats.extend(result.stage_records)
+        self.stats.cache_hits += result.cache_hits
+        self.stats.cache_misses += result.cache_misses
+        for lvl, tris, dec_t, tot_t in result.lod_stats:
+            totals = self.lod_totals.setdefault(lvl, [0, 0.0, 0.0])
+            totals[0] += tris
+            totals[1] += dec_t
+            totals[2] += tot_t
+
+        if self.instance_mapping is not None:
+            self.instance_mapping.remove(result.object_name)
+        self.mark_original(original_obj, result, result.exported_files)
+        if result.object_name in self.duplicates:
+            self.record_duplicates(result)
+        # Between objects no temporary data is in use, only batch textures
+        self.memory.object_done(self.texture_pyramid.images.values())
+
+    def record_duplicates(self, result):
+        """
+        Writes the duplicates of a finished representative as file copies
+        or mapping entries, and marks them like exported objects.
+        """
+        from . import export_dedupe
+
+        source_base_name = get_export_base_name(result.object_name,
+                                                self.settings)
+        for name in self.duplicates.pop(result.object_name):
+            obj = bpy.data.objects.get(name)
+            dup_result = ObjectExportResult(name)
+            files = result.exported_files
+            if obj is None:
+                dup_result.failures.append(f"{name} (Missing)")
+            elif not result.success:
+                dup_result.failures.append(f"{name} (Source Failed)")
+            elif self.instance_mapping is not None:
+                self.instance_mapping.update(obj, result.object_name, files)
+            else:
+                pairs = export_dedupe.get_duplicate_paths(
+                    files, source_base_name,
+                    get_export_base_name(name, self.settings)
+                )
+                source_records = {rec[0]: rec for rec in result.file_records}
+                try:
+                    for source, target in pairs:
+                        export_dedupe.link_or_copy(source, target)
+                        dup_result.exported_files.append(target)
+                        if source in source_records:
+                            dup_result.file_records.append(
+                                (target,) + source_records[source][1:5]
+                                + (0.0,)
+                            )
+                except OSError as e:
+                    logger.error(f"Could not copy files for {name}: {e}")
+                    dup_result.failures.append(f"{name} (Copy Error)")
+                if not pairs:
+                    dup_result.failures.append(f"{name} (No Files)")
+                files = dup_result.exported_files
+            self.failed_exports.extend(dup_result.failures)
+            if dup_result.success:
+                self.deduplicated_objects += 1
+            self.mark_original(obj, dup_result, files)
+
+    def mark_original(self, original_obj, result, files):
+        """
+        Updates the manifest, the journal, the history and the export
+        marker of an original.
+        """
+        if self.history is not None and result.file_records:
+            try:
+                self.history.record(result.object_name, result.file_records,
+                                    self.get_settings_hash())
+            except sqlite3.Error as e:
+                logger.error(f"Could not record export history: {e}")
+        if original_obj and result.success:
+            try:
+                fingerprint = self.get_fingerprint(original_obj)
+            except Exception as e:
+                logger.warning(f"Could not fingerprint "
+                               f"{original_obj.name}: {e}")
+                fingerprint = None
+            self.journal.record(result.object_name, files, fingerprint)
+        if self.manifest is not None:
+            fingerprint = self.fingerprints.get(result.object_name)
+            if result.success and fingerprint:
+                self.manifest.update(result.object_name, fingerprint, files)
+            else:
+                self.manifest.remove(result.object_name)
+
+        # Mark Original Object
+        if original_obj and result.success:
+            export_indicators.mark_object_as_exported(original_obj)
+            logger.info(
+                f"Marked original {original_obj.name} as exported."
+            )
+        else:
+            logger.info(
+                f"Skipped marking original {result.object_name} "
+                f"due to errors."
+            )
+            self.overall_success = False
+
+    def report_results(self, context, elapsed_time):
+        """Logs and reports the batch summary and redraws the UI."""
+        log_level = logging.INFO if self.overall_success else logging.WARNING
         message = (
             f"Export finished in {elapsed_time:.2f}s. "
-            f"Exported {successful_exports} files."
+            f"Exported {self.successful_exports} files."
         )
-        if failed_exports:
+        if self.cancelled:
+            remaining = len(self.objects_to_export) - self.finished_objects
+            message = (
+                f"Export cancelled after {elapsed_time:.2f}s. "
+                f"Exported {self.successful_exports} files, "
+                f"{remaining} objects not exported."
+            )
+            log_level = logging.WARNING
+        if self.skipped_objects:
+            message += f" Skipped {self.skipped_objects} unchanged objects."
+        if self.deduplicated_objects:
+            how = ("mapped" if self.instance_mapping is not None
+                   else "copied")
+            message += (f" {self.deduplicated_objects} duplicates "
+                        f"{how} from their source.")
+        if self.worker_count:
+            message += (f" Used {self.worker_count} workers "
+                        f"({self.object_time:.2f}s object time).")
+        if self.failed_exports:
             unique_fails = sorted(list(set(f.split(' (')[0]
-                                            for f in failed_exports)))
+                                            for f in self.failed_exports)))
             fail_summary = (
                 f"Failed exports logged for: {len(unique_fails)} original "
                 f"objects ({', '.join(unique_fails[:5])}"
@@ -1194,8 +2529,31 @@ class MESH_OT_batch_export(Operator):
             message += f" {fail_summary}"
             logger.warning(f"Failures occurred for: {', '.join(unique_fails)}")
 
+        leaks = self.memory.leaks()
+        if leaks:
+            leak_summary = ", ".join(f"{name} +{count}"
+                                     for name, count in leaks.items())
+            message += f" Datablocks left behind: {leak_summary}."
+            logger.warning(f"Batch leaked datablocks: {leak_summary}")
+
         logger.log(log_level, message)
-        report_type = {"INFO"} if overall_success else {"WARNING"}
+        logger.info(f"Memory: {self.memory.summary()}")
+        if self.stats.cache_hits or self.stats.cache_misses:
+            logger.info(f"Decimation cache: {self.stats.cache_hits} hits, "
+                        f"{self.stats.cache_misses} misses")
+        for stage, calls, total, mean, peak, _, _ in self.stats.stage_table():
+            logger.info(f"  {stage}: {calls} calls, {total:.2f}s total, "
+                        f"{mean:.3f}s mean, {peak:.3f}s max")
+        if self.lod_totals:
+            mode = ("cascade" if self.settings.mesh_export_lod_cascade
+                    else "absolute")
+            logger.info(f"LOD totals ({mode}):")
+            for lvl in sorted(self.lod_totals):
+                tris, dec_t, tot_t = self.lod_totals[lvl]
+                logger.info(f"  LOD{lvl:02d}: {tris} tris, "
+                            f"decimate {dec_t:.2f}s, total {tot_t:.2f}s")
+        report_type = ({"INFO"} if self.overall_success 
+                       and not self.cancelled else {"WARNING"})
         self.report(report_type, message)
 
         # --- Trigger redraw ---
@@ -1203,7 +2561,154 @@ class MESH_OT_batch_export(Operator):
             for area in window.screen.areas:
                 area.tag_redraw()
 
+
+class MESH_OT_resume_batch_export(MESH_OT_batch_export):
+    """Resumes the last unfinished batch in the export directory,
+skipping objects that were already exported"""
+    bl_idname = "mesh.resume_batch_export"
+    bl_label = "Resume Last Batch"
+    resuming = True
+
+    @classmethod
+    def poll(cls, context):
+        """Enable only if the export directory has an unfinished batch."""
+        if get_active_batch() is not None:
+            return False
+        export_dir = bpy.path.abspath(
+            context.scene.mesh_exporter.mesh_export_path
+        )
+        return export_journal.get_pending_count(export_dir) > 0
+
+    def collect_objects(self, context):
+        """
+        Returns the objects of the journaled batch that weren't exported,
+        or changed or lost their files since.
+        """
+        objects_to_export = []
+        for name in self.journal.header["objects"]:
+            obj = bpy.data.objects.get(name)
+            if obj is None or obj.type != "MESH":
+                logger.warning(f"Skipping {name}: object no longer exists.")
+                continue
+            try:
+                finished = self.journal.is_finished(
+                    name, self.get_fingerprint(obj)
+                )
+            except Exception:
+                finished = False
+            if finished:
+                self.skipped_objects += 1
+            else:
+                objects_to_export.append(obj)
+        logger.info(f"Resuming batch: {len(objects_to_export)} objects left, "
+                    f"{self.skipped_objects} already exported.")
+        return objects_to_export
+
+
+def get_history_filters(scene_props):
+    """
+    Returns the history panel's filters as export_history arguments.
+
+    Returns:
+        tuple: (object prefix, format, since time or None).
+
+    Raises:
+        ValueError: If the since text is invalid.
+    """
+    fmt = scene_props.mesh_export_history_format
+    return (scene_props.mesh_export_history_object,
+            "" if fmt == "ALL" else fmt,
+            export_history.parse_since(scene_props.mesh_export_history_since))
+
+
+def export_objects_by_name(operator, context, names, empty_message):
+    """
+    Selects the named mesh objects of the view layer and starts a batch
+    export of them. The batch runs as its own modal operator, so the
+    calling operator finishes once it has started.
+
+    Returns:
+        set: {"FINISHED"} if the batch started, else {"CANCELLED"}.
+    """
+    # Only objects that still exist and can be selected here
+    view_layer_objects = context.view_layer.objects
+    objects = [view_layer_objects[name] for name in names
+               if name in view_layer_objects
+               and view_layer_objects[name].type == "MESH"]
+    if not objects:
+        operator.report({"INFO"}, empty_message)
+        return {"CANCELLED"}
+
+    deselect_all(context.view_layer)
+    for obj in objects:
+        obj.select_set(True)
+    context.view_layer.objects.active = objects[0]
+    result = bpy.ops.mesh.batch_export("INVOKE_DEFAULT")
+    if result & {"RUNNING_MODAL", "FINISHED"}:
         return {"FINISHED"}
+    return {"CANCELLED"}
+
+
+class MESH_OT_reexport_stale(Operator):
+    """Exports the objects in the history filter that weren't exported
+since the given date"""
+    bl_idname = "mesh.reexport_stale"
+    bl_label = "Re-export Stale"
+    bl_options = {"REGISTER"}
+
+    @classmethod
+    def poll(cls, context):
+        """Enable only if there is a history and no batch runs."""
+        if get_active_batch() is not None:
+            return False
+        scene_props = context.scene.mesh_exporter
+        export_dir = bpy.path.abspath(scene_props.mesh_export_path)
+        history_path = export_history.get_history_path(export_dir)
+        return (bool(scene_props.mesh_export_history_since.strip())
+                and os.path.isfile(history_path))
+
+    def execute(self, context):
+        scene_props = context.scene.mesh_exporter
+        export_dir = bpy.path.abspath(scene_props.mesh_export_path)
+        try:
+            object_prefix, fmt, since = get_history_filters(scene_props)
+        except ValueError as e:
+            self.report({"ERROR"}, str(e))
+            return {"CANCELLED"}
+
+        history = export_history.ExportHistory(export_dir)
+        try:
+            history.open(read_only=True)
+            names = history.stale_objects(since, object_prefix, fmt)
+        except sqlite3.Error as e:
+            self.report({"ERROR"}, f"Could not read export history: {e}")
+            return {"CANCELLED"}
+        finally:
+            history.close()
+
+        logger.info(f"Re-exporting objects not exported since "
+                    f"{scene_props.mesh_export_history_since}.")
+        return export_objects_by_name(self, context, names,
+                                      "No stale objects to re-export.")
+
+
+class MESH_OT_export_dirty(Operator):
+    """Exports every object that changed since it was exported"""
+    bl_idname = "mesh.export_dirty"
+    bl_label = "Export Changed"
+    bl_options = {"REGISTER"}
+
+    @classmethod
+    def poll(cls, context):
+        """Enable only if objects changed and no batch runs."""
+        return (get_active_batch() is None
+                and export_indicators.get_dirty_count() > 0)
+
+    def execute(self, context):
+        names = [obj.name for obj in export_indicators.get_dirty_objects()]
+        logger.info(f"Exporting {len(names)} objects changed since export.")
+        return export_objects_by_name(self, context, names,
+                                      "No changed objects to export.")
 
 
 class OBJECT_OT_select_by_name(Operator):
@@ -1226,9 +2731,7 @@ class OBJECT_OT_select_by_name(Operator):
             return {"CANCELLED"}
         
         # Deselect all objects directly
-        for obj in context.scene.objects:
-            if obj.select_get():
-                obj.select_set(False)
+        deselect_all(context.view_layer)
                 
         # Select target and make it active
         target_obj.select_set(True)
@@ -1240,6 +2743,9 @@ class OBJECT_OT_select_by_name(Operator):
 # --- Registration ---
 classes = (
     MESH_OT_batch_export,
+    MESH_OT_resume_batch_export,
+    MESH_OT_reexport_stale,
+    MESH_OT_export_dirty,
     MESH_OT_open_export_directory,
     OBJECT_OT_select_by_name,
 )
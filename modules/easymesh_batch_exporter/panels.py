@@ -11,6 +11,11 @@ import logging
 import os
 from bpy.types import Panel
 from . import export_indicators
+from . import export_stats
+from . import export_journal
+from . import export_history
+from . import operators
+from .properties import FORMAT_OPTIONS
 
 # --- Setup Logger ---
 logger = logging.getLogger(__name__)
@@ -75,10 +80,15 @@ class MESH_PT_exporter_panel(Panel):
 
         # Export path settings
         layout.prop(settings, "mesh_export_path")
-        layout.prop(settings, "mesh_export_format")
+        layout.prop(settings, "mesh_export_formats")
+        formats = settings.mesh_export_formats
+        if len(formats) > 1:
+            row = layout.row()
+            row.alignment = "RIGHT"
+            row.label(text="One sub-folder per format", icon="FILE_FOLDER")
 
         # Format-specific settings
-        if settings.mesh_export_format == "GLTF":
+        if "GLTF" in formats:
             # GLTF-specific settings
             col = layout.column(heading="GLTF Type", align=True)
             row = col.row(align=True)
@@ -88,27 +98,38 @@ class MESH_PT_exporter_panel(Panel):
             row = col.row(align=True)
             row.prop(settings, "mesh_export_gltf_materials")
 
-        # Coordinate system settings
-        if self.format_has_coordinates(settings.mesh_export_format):
-            col = layout.column(heading="Coordinate system", align=True)
+            col = layout.column(heading="Profile", align=True)
             row = col.row(align=True)
-            row.prop(settings, "mesh_export_coord_up", expand=True)
+            row.prop(settings, "mesh_export_gltf_profile", expand=True)
+
+            row = layout.row()
+            row.alignment = "RIGHT"
+            row.label(text="Exported in metres, +Y up", icon="INFO")
+
+        # Per-format coordinate system, scale and units settings
+        for fmt in operators.get_export_formats(settings):
+            if not self.format_has_coordinates(fmt):
+                continue
+            options = getattr(settings, FORMAT_OPTIONS[fmt])
+            box = layout.box()
+            box.label(text=f"{fmt} Options")
+
+            col = box.column(heading="Coordinate system", align=True)
             row = col.row(align=True)
-            row.prop(settings, "mesh_export_coord_forward", expand=True)
+            row.prop(options, "coord_up", expand=True)
+            row = col.row(align=True)
+            row.prop(options, "coord_forward", expand=True)
 
-        # Scale settings
-        if self.format_has_scale(settings.mesh_export_format):
-            col = layout.column(heading="Scale", align=True)
-            col.prop(settings, "mesh_export_scale")
+            if self.format_has_scale(fmt):
+                col = box.column(heading="Scale", align=True)
+                col.prop(options, "scale")
 
-        # Units settings
-        if self.format_has_scale(settings.mesh_export_format):
-            col = layout.column(heading="Units", align=True)
-            row = col.row(align=True)
-            row.prop(settings, "mesh_export_units", expand=True)
+                col = box.column(heading="Units", align=True)
+                row = col.row(align=True)
+                row.prop(options, "units", expand=True)
 
         # Smoothing settings
-        if self.format_has_smoothing(settings.mesh_export_format):
+        if any(self.format_has_smoothing(fmt) for fmt in formats):
             # Only show if the format supports smoothing
             col = layout.column(heading="Smoothing", align=True)
             row = col.row(align=True)
@@ -118,6 +139,9 @@ class MESH_PT_exporter_panel(Panel):
         col = layout.column(heading="Transform", align=True)
         col.prop(settings, "mesh_export_zero_location")
 
+        # Modifier settings
+        col = layout.column(heading="Modifiers", align=True)
+        col.prop(settings, "mesh_export_fast_modifiers")
 
         # Triangulate settings
         col = layout.column(heading="Triangulate", align=True)
@@ -141,6 +165,31 @@ class MESH_PT_exporter_panel(Panel):
         col = layout.column(heading="Materials", align=True)
         col.prop(settings, "mesh_export_materials")
         
+        # Incremental export settings
+        col = layout.column(heading="Incremental", align=True)
+        col.prop(settings, "mesh_export_incremental")
+        col.prop(settings, "mesh_export_dedupe")
+
+        # Parallel export settings
+        col = layout.column(heading="Parallel", align=True)
+        row = col.row(align=True)
+        row.prop(settings, "mesh_export_parallel", text="")
+        sub = row.row(align=True)
+        sub.enabled = settings.mesh_export_parallel
+        sub.prop(settings, "mesh_export_parallel_workers")
+
+        # Memory settings
+        col = layout.column(heading="Memory", align=True)
+        row = col.row(align=True)
+        row.prop(settings, "mesh_export_bounded_memory", text="")
+        sub = row.row(align=True)
+        sub.enabled = settings.mesh_export_bounded_memory
+        sub.prop(settings, "mesh_export_purge_interval")
+
+        # History settings
+        col = layout.column(heading="History", align=True)
+        col.prop(settings, "mesh_export_history")
+
         # Export Button 
         mesh_count = sum(
             1 for obj in context.selected_objects if obj.type == "MESH"
@@ -150,6 +199,12 @@ class MESH_PT_exporter_panel(Panel):
         # row = box.row()
         # row.label(text=f"Selected Meshes: {mesh_count}", icon="MESH_DATA")
         # Export button (always enabled unless poll() fails)
+        active_batch = operators.get_active_batch()
+        if active_batch is not None:
+            # A modal export is running; show its progress instead
+            box = layout.box()
+            box.label(text=active_batch.status_text or "Exporting...",
+                      icon="SORTTIME")
         row = layout.row()
         # Generate the button text first
         button_text = (
@@ -157,9 +212,25 @@ class MESH_PT_exporter_panel(Panel):
             else "Export Meshes")
         # Pass the generated text to the "text" parameter
         row.operator("mesh.batch_export", text=button_text, icon="EXPORT")
+
+        # Resume button for a batch that crashed or was cancelled
+        export_path = bpy.path.abspath(settings.mesh_export_path)
+        pending = export_journal.get_pending_count(export_path)
+        if pending and active_batch is None:
+            row = layout.row()
+            row.operator("mesh.resume_batch_export",
+                         text=f"Resume Last Batch ({pending} left)",
+                         icon="RECOVER_LAST")
+
+        # Export button for objects changed since their export
+        dirty = export_indicators.get_dirty_count()
+        if dirty and active_batch is None:
+            row = layout.row()
+            row.operator("mesh.export_dirty",
+                         text=f"Export Changed ({dirty})",
+                         icon="FILE_REFRESH")
         
         # Open Export Directory button
-        export_path = bpy.path.abspath(settings.mesh_export_path)
         if os.path.exists(export_path):
             row = layout.row()
             row.operator("mesh.open_export_directory", text="打开导出目录", icon="FILEBROWSER")
@@ -213,14 +284,58 @@ class MESH_PT_exporter_panel_lod(Panel):
 
         col = layout.column(align=True)
         col.prop(settings, "mesh_export_lod_count")
+        col.prop(settings, "mesh_export_lod_cascade")
+        col.prop(settings, "mesh_export_lod_target")
+        row = col.row(align=True)
+        row.prop(settings, "mesh_export_lod_textures")
+        sub = row.row(align=True)
+        sub.enabled = settings.mesh_export_lod_textures
+        sub.prop(settings, "mesh_export_texture_cache_mb", text="MB")
+
+        col = layout.column(heading="Cache", align=True)
+        row = col.row(align=True)
+        row.prop(settings, "mesh_export_decimate_cache", text="")
+        sub = row.row(align=True)
+        sub.enabled = settings.mesh_export_decimate_cache
+        sub.prop(settings, "mesh_export_decimate_cache_mb", text="MB")
+        row.operator("mesh.clear_decimation_cache", text="", icon="TRASH")
         # Hide the decimate type bc I'm not sure if it's needed yet
         # col.prop(settings, "mesh_export_lod_type")
 
+        if settings.mesh_export_lod_target == "BUDGET":
+            # Budget of the active object's collection, if it sets one
+            col = layout.column(align=True)
+            obj = context.active_object
+            budget_collection = None
+            if obj:
+                budget_collection = next(
+                    (c for c in obj.users_collection
+                     if c.mesh_export_tri_budget > 0),
+                    obj.users_collection[0] if obj.users_collection else None
+                )
+            if budget_collection:
+                col.prop(budget_collection, "mesh_export_tri_budget",
+                         text=f"{budget_collection.name} Budget")
+            col.prop(settings, "mesh_export_lod_tri_budget")
+
         box = layout.box()
         col = box.column(align=True)
         # col.label(text="Ratios:")
         # Display relevant properties based on type
-        if settings.mesh_export_lod_type == "COLLAPSE":
+        if settings.mesh_export_lod_target == "TRIANGLES":
+            for lod in range(1, 5):
+                row = col.row(align=True)
+                row.prop(settings, f"mesh_export_lod_tris_{lod:02d}",
+                         text=f"LOD{lod}")
+                # Visual indicator for which LODs are disabled
+                row.enabled = settings.mesh_export_lod_count >= lod
+        elif settings.mesh_export_lod_target == "BUDGET":
+            for lod in range(1, 5):
+                row = col.row(align=True)
+                row.prop(settings, f"mesh_export_lod_ratio_{lod:02d}",
+                         text=f"LOD{lod} of Budget")
+                row.enabled = settings.mesh_export_lod_count >= lod
+        elif settings.mesh_export_lod_type == "COLLAPSE":
             row = col.row(align=True)
             row.prop(settings, "mesh_export_lod_ratio_01", text="LOD1")
             row = col.row(align=True)
@@ -265,11 +380,13 @@ class MESH_EXPORT_PT_recent_exports(Panel):
     def draw(self, context):
         layout = self.layout
 
+        max_items = 10 # Limit display length
         try:
-            # Use the function from the export_indicators module
+            # Read from the indicator registry, no scan of the file
             recently_exported = (
-                export_indicators.get_recently_exported_objects()
+                export_indicators.get_recently_exported_objects(max_items)
             )
+            total_count = export_indicators.get_recent_export_count()
         except AttributeError:
             layout.label(text="Indicator system not fully loaded.")
             return
@@ -283,17 +400,7 @@ class MESH_EXPORT_PT_recent_exports(Panel):
         box = layout.box()
         col = box.column(align=True)
 
-        max_items = 10 # Limit display length
-        for i, (obj, export_time) in enumerate(recently_exported):
-            if i >= max_items:
-                row = col.row()
-                row.label(text=f"... and "
-                          f"{len(recently_exported) - max_items} more")
-                break
-
-            if not obj: 
-                continue # Skip if object deleted
-
+        for obj, export_time in recently_exported:
             row = col.row(align=True)
             icon = "HIDE_OFF" # Default icon
 
@@ -318,6 +425,10 @@ class MESH_EXPORT_PT_recent_exports(Panel):
             else:
                 time_str = f"{int(time_diff/3600)}h ago"
             row.label(text=time_str)
+        if total_count > len(recently_exported):
+            row = col.row()
+            row.label(text=f"... and "
+                      f"{total_count - len(recently_exported)} more")
 
         # Clear Indicators button if indicators are present
         if hasattr(export_indicators, "MESH_OT_clear_all_indicators"):
@@ -327,12 +438,126 @@ class MESH_EXPORT_PT_recent_exports(Panel):
             )
 
 
+# Export History Panel
+class MESH_PT_exporter_panel_history(Panel):
+    bl_label = "Export History"
+    bl_idname = "MESH_PT_exporter_panel_history"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "Exporter"
+    bl_parent_id = "MESH_PT_exporter_panel"
+    bl_options = {"DEFAULT_CLOSED"}
+
+    max_rows = 15 # Newest matching exports shown
+
+    def draw(self, context):
+        layout = self.layout
+        settings = context.scene.mesh_exporter
+
+        col = layout.column(align=True)
+        col.prop(settings, "mesh_export_history_object", icon="VIEWZOOM")
+        col.prop(settings, "mesh_export_history_format", text="")
+        col.prop(settings, "mesh_export_history_since")
+
+        try:
+            object_prefix, fmt, since = operators.get_history_filters(
+                settings
+            )
+        except ValueError as e:
+            layout.label(text=str(e), icon="ERROR")
+            return
+
+        # Cached until the database changes, so redraws are free
+        rows = export_history.query_cached(
+            bpy.path.abspath(settings.mesh_export_path),
+            object_prefix, fmt, since, self.max_rows
+        )
+        if not rows:
+            layout.label(text="No matching exports.")
+        else:
+            box = layout.box()
+            col = box.column(align=True)
+            for (exported, name, lod, file_format, _, _, triangles,
+                    _, _, _) in rows:
+                row = col.row(align=True)
+                row.label(text=name if lod is None
+                          else f"{name} LOD{lod:02d}")
+                row.label(text=f"{file_format} {triangles} tris")
+                row.label(text=time.strftime("%m-%d %H:%M",
+                                             time.localtime(exported)))
+
+        row = layout.row()
+        row.operator("mesh.reexport_stale", icon="FILE_REFRESH")
+
+
+# Export Timings Panel
+class MESH_PT_exporter_panel_stats(Panel):
+    bl_label = "Export Timings"
+    bl_idname = "MESH_PT_exporter_panel_stats"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "Exporter"
+    bl_parent_id = "MESH_PT_exporter_panel"
+    bl_options = {"DEFAULT_CLOSED"}
+
+    def draw(self, context):
+        layout = self.layout
+        stats = export_stats.get_last_batch_stats()
+        if stats is None or not stats.records:
+            layout.label(text="No export timings yet.")
+            return
+
+        layout.label(text=f"Last batch: {stats.total_seconds:.2f}s "
+                     f"across all stages")
+        if stats.memory_summary:
+            layout.label(text=stats.memory_summary, icon="MEMORY")
+        if stats.cache_hits or stats.cache_misses:
+            layout.label(text=f"Decimation cache: {stats.cache_hits} hits, "
+                         f"{stats.cache_misses} misses", icon="DISK_DRIVE")
+
+        # Per-stage table
+        box = layout.box()
+        col = box.column(align=True)
+        row = col.row(align=True)
+        for header in ("Stage", "Calls", "Total", "Mean", "Max"):
+            row.label(text=header)
+        for stage, calls, total, mean, peak, p_in, p_out in (
+                stats.stage_table()):
+            row = col.row(align=True)
+            row.label(text=stage.replace("_", " ").title())
+            row.label(text=str(calls))
+            row.label(text=f"{total:.2f}s")
+            row.label(text=f"{mean:.3f}s")
+            row.label(text=f"{peak:.3f}s")
+            if p_in != p_out:
+                sub = col.row(align=True)
+                sub.label(text=f"    polys {p_in} → {p_out}")
+
+        # Slowest objects
+        box = layout.box()
+        col = box.column(align=True)
+        col.label(text="Slowest objects:")
+        for name, seconds in stats.slowest_objects():
+            row = col.row(align=True)
+            row.label(text=name)
+            row.label(text=f"{seconds:.2f}s")
+
+        row = layout.row(align=True)
+        op = row.operator(export_stats.MESH_OT_dump_export_stats.bl_idname,
+                          text="Save CSV", icon="FILE")
+        op.file_format = "CSV"
+        op = row.operator(export_stats.MESH_OT_dump_export_stats.bl_idname,
+                          text="Save JSON", icon="FILE_TEXT")
+        op.file_format = "JSON"
+
 
 # Registration
 classes = (
     MESH_PT_exporter_panel,
     MESH_PT_exporter_panel_lod,
     MESH_EXPORT_PT_recent_exports,
+    MESH_PT_exporter_panel_history,
+    MESH_PT_exporter_panel_stats,
 )
 
 # register/unregister functions handled by __init__.py
\ No newline at end of file
@@ -0,0 +1,329 @@
+# parallel_export.py
+"""
+Sharded batch export using headless Blender worker processes.
+
+The main process saves a snapshot of the current file, splits the objects
+into balanced shards and starts one `blender -b` worker per shard. Each
+worker runs the regular export pipeline (operators.export_original_object)
+on its shard and writes its results to a JSON file, which the main process
+merges back into its report and the export indicators.
+"""
+
+import bpy
+import os
+import json
+import time
+import heapq
+import shutil
+import tempfile
+import subprocess
+import logging
+from types import SimpleNamespace
+
+# --- Setup Logger ---
+logger = logging.getLogger(__name__)
+if not logger.handlers:
+    handler = logging.StreamHandler()
+    formatter = logging.Formatter("%(name)s:%(levelname)s: %(message)s")
+    handler.setFormatter(formatter)
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)  # Default level
+
+# --- Constants ---
+WORKER_SCRIPT = os.path.join(os.path.dirname(__file__), "export_worker.py")
+SNAPSHOT_NAME = "snapshot.blend"
+# Fixed per-object cost so shards of tiny meshes still balance
+OBJECT_BASE_COST = 1000
+
+
+# --- Main Process ---
+
+
+def get_package_root():
+    """
+    Returns the directory that has to be on sys.path for a worker to
+    import this package by its full name.
+    """
+    root = os.path.dirname(os.path.abspath(__file__))
+    for _ in __package__.split("."):
+        root = os.path.dirname(root)
+    return root
+
+
+def estimate_export_cost(obj, lod_count=0):
+    """
+    Relative amount of work needed to export obj: its polygon count
+    times the number of LOD levels plus a fixed per-object cost.
+    """
+    return len(obj.data.polygons) * (lod_count + 1) + OBJECT_BASE_COST
+
+
+def shard_objects(objects, shard_count, lod_count=0):
+    """
+    Splits objects into shards of roughly equal work.
+    Uses longest-processing-time-first assignment with polygon count
+    (times the number of LOD levels) as the cost estimate.
+
+    Args:
+        objects (list): Mesh objects to split.
+        shard_count (int): Number of shards.
+        lod_count (int): Additional LOD levels per object.
+
+    Returns:
+        list: A list of object-name lists, one per non-empty shard.
+    """
+    costs = sorted(
+        ((estimate_export_cost(obj, lod_count), obj.name)
+         for obj in objects),
+        reverse=True
+    )
+    shard_count = max(1, min(shard_count, len(costs)))
+    # (load, shard index) min-heap
+    loads = [(0, index) for index in range(shard_count)]
+    shards = [[] for _ in range(shard_count)]
+    for cost, name in costs:
+        load, index = heapq.heappop(loads)
+        shards[index].append(name)
+        heapq.heappush(loads, (load + cost, index))
+    return [shard for shard in shards if shard]
+
+
+class ParallelExportJob:
+    """Runs a sharded export in background Blender processes."""
+
+    def __init__(self, objects, settings, export_base_path, shard_count):
+        lod_count = (settings.get("mesh_export_lod_count", 0)
+                     if settings.get("mesh_export_lod") else 0)
+        self.shards = shard_objects(objects, shard_count, lod_count)
+        self.settings = settings
+        self.export_base_path = export_base_path
+        self.temp_dir = None
+        self.processes = []
+        self.start_time = None
+
+    @property
+    def total_objects(self):
+        return sum(len(shard) for shard in self.shards)
+
+    def _shard_path(self, index, kind, ext):
+        return os.path.join(self.temp_dir, f"{kind}_{index:02d}.{ext}")
+
+    def start(self):
+        """Saves the snapshot and launches one worker per shard."""
+        self.temp_dir = tempfile.mkdtemp(prefix="easymesh_parallel_")
+        snapshot_path = os.path.join(self.temp_dir, SNAPSHOT_NAME)
+        logger.info(f"Saving scene snapshot to {snapshot_path}")
+        bpy.ops.wm.save_as_mainfile(
+            filepath=snapshot_path, copy=True, check_existing=False
+        )
+
+        package_root = get_package_root()
+        self.start_time = time.time()
+        for index, shard in enumerate(self.shards):
+            job_path = self._shard_path(index, "job", "json")
+            job = {
+                "package": __package__,
+                "package_root": package_root,
+                "objects": shard,
+                "settings": self.settings,
+                "export_path": self.export_base_path,
+                "progress_path": self._shard_path(index, "progress", "txt"),
+                "results_path": self._shard_path(index, "results", "json"),
+            }
+            with open(job_path, "w", encoding="utf-8") as f:
+                json.dump(job, f)
+
+            log_file = open(self._shard_path(index, "worker", "log"), "w",
+                            encoding="utf-8")
+            command = [
+                bpy.app.binary_path, "-b", snapshot_path,
+                "--python-exit-code", "1",
+                "--python", WORKER_SCRIPT,
+                "--", job_path,
+            ]
+            try:
+                process = subprocess.Popen(
+                    command, stdout=log_file, stderr=subprocess.STDOUT
+                )
+            finally:
+                log_file.close()
+            self.processes.append(process)
+            logger.info(f"Started worker {index} (pid {process.pid}) "
+                        f"with {len(shard)} objects")
+
+    def is_running(self):
+        """Returns True while any worker process is still running."""
+        return any(process.poll() is None for process in self.processes)
+
+    def completed_count(self):
+        """Returns how many objects the workers have finished so far."""
+        completed = 0
+        for index in range(len(self.processes)):
+            try:
+                with open(self._shard_path(index, "progress", "txt"),
+                          encoding="utf-8") as f:
+                    completed += int(f.read().strip() or 0)
+            except (OSError, ValueError):
+                continue
+        return completed
+
+    def wait(self, progress_callback=None, poll_interval=0.25):
+        """
+        Blocks until every worker has exited.
+
+        Args:
+            progress_callback (callable, optional): Called with the number
+                of completed objects on every poll.
+            poll_interval (float): Seconds between polls.
+        """
+        while self.is_running():
+            if progress_callback:
+                progress_callback(self.completed_count())
+            time.sleep(poll_interval)
+        if progress_callback:
+            progress_callback(self.completed_count())
+
+    def cancel(self):
+        """Terminates all running workers."""
+        for process in self.processes:
+            if process.poll() is None:
+                process.terminate()
+        for process in self.processes:
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+    def collect_results(self, missing_label="Worker Error"):
+        """
+        Reads each worker's results. Objects of a worker that crashed or
+        wrote no results are returned as failures.
+
+        Args:
+            missing_label (str, optional): Failure label for objects no
+                worker reported. None leaves them out, e.g. after cancel.
+
+        Returns:
+            list: Result dicts (see operators.ObjectExportResult.to_dict).
+        """
+        results = []
+        for index, shard in enumerate(self.shards):
+            shard_results = []
+            try:
+                with open(self._shard_path(index, "results", "json"),
+                          encoding="utf-8") as f:
+                    shard_results = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.error(f"Worker {index} produced no results "
+                             f"(exit code {self.processes[index].returncode}"
+                             f"): {e}")
+                self._log_worker_tail(index)
+            reported = {item["object_name"] for item in shard_results}
+            results.extend(shard_results)
+            if missing_label is None:
+                continue
+            for name in shard:
+                if name not in reported:
+                    results.append({
+                        "object_name": name,
+                        "exported_files": [],
+                        "failures": [f"{name} ({missing_label})"],
+                        "lod_stats": [],
+                        "stage_records": [],
+                        "elapsed": 0.0,
+                    })
+        return results
+
+    def _log_worker_tail(self, index, lines=20):
+        try:
+            with open(self._shard_path(index, "worker", "log"),
+                      encoding="utf-8", errors="replace") as f:
+                tail = f.readlines()[-lines:]
+            logger.error(f"Worker {index} log tail:\n{''.join(tail)}")
+        except OSError:
+            pass
+
+    def cleanup(self):
+        """Removes the snapshot and all job files."""
+        if self.temp_dir and os.path.isdir(self.temp_dir):
+            shutil.rmtree(self.temp_dir, ignore_errors=True)
+        self.temp_dir = None
+
+
+# --- Worker Process ---
+
+
+def _write_json_atomic(path, data):
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(temp_path, path)
+
+
+def run_worker(job_path):
+    """
+    Worker entry point: exports every object of one shard.
+
+    Args:
+        job_path (str): Path to the shard's job JSON file.
+
+    Returns:
+        int: Process exit code.
+    """
+    from . import operators
+    from . import texture_lod
+    from . import export_memory
+    from . import decimation_cache
+
+    with open(job_path, encoding="utf-8") as f:
+        job = json.load(f)
+    scene_props = SimpleNamespace(**job["settings"])
+    context = bpy.context
+    results = []
+
+    logger.info(f"Worker exporting {len(job['objects'])} objects")
+    scratch_scene = operators.get_scratch_scene(context.scene)
+    texture_pyramid = texture_lod.TexturePyramid(
+        scene_props.mesh_export_texture_cache_mb * 1024 * 1024
+    )
+    memory = export_memory.MemoryMonitor(
+        scene_props.mesh_export_purge_interval
+        if scene_props.mesh_export_bounded_memory else 0
+    )
+    cache = decimation_cache.get_cache(scene_props)
+    try:
+        with operators.scratch_scene_override(context, scratch_scene):
+            for index, name in enumerate(job["objects"]):
+                original_obj = bpy.data.objects.get(name)
+                result = operators.ObjectExportResult(name)
+                start = time.time()
+                if original_obj is None or original_obj.type != "MESH":
+                    result.failures.append(f"{name} (Missing In Snapshot)")
+                else:
+                    try:
+                        result = operators.export_original_object(
+                            original_obj, context, scene_props,
+                            job["export_path"], scratch_scene.collection,
+                            texture_pyramid, cache
+                        )
+                    except Exception as e:
+                        logger.error(f"Worker failed on {name}: {e}",
+                                     exc_info=True)
+                        result.failures.append(f"{name} (Outer Error)")
+                result.elapsed = time.time() - start
+                results.append(result.to_dict())
+                # Written after every object so a cancelled worker still
+                # reports what it finished
+                _write_json_atomic(job["results_path"], results)
+                with open(job["progress_path"], "w", encoding="utf-8") as f:
+                    f.write(str(index + 1))
+                memory.object_done(texture_pyramid.images.values())
+    finally:
+        texture_pyramid.release()
+        if cache is not None:
+            cache.evict()
+        operators.remove_scratch_scene()
+        _write_json_atomic(job["results_path"], results)
+        memory.finish()
+        logger.info(f"Worker memory: {memory.summary()}")
+    return 0
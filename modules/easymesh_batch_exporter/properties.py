@@ -6,12 +6,72 @@ triangulation, LOD generation, and more.
 """
 
 import bpy
+from bpy.app.handlers import persistent
 from bpy.props import (StringProperty, EnumProperty, 
                       FloatProperty, IntProperty, BoolProperty,
                       PointerProperty)
 from bpy.types import PropertyGroup
 
 
+# Formats with their own unit, scale and axis options → property name.
+# glTF is always written in metres with +Y up.
+FORMAT_OPTIONS = {
+    "FBX": "mesh_export_fbx_options",
+    "OBJ": "mesh_export_obj_options",
+    "USD": "mesh_export_usd_options",
+    "STL": "mesh_export_stl_options",
+}
+# Formats whose exporter takes a global scale; USD only takes axes
+SCALED_FORMATS = {"FBX", "OBJ", "STL"}
+
+
+class MeshExportFormatOptions(PropertyGroup):
+    """Unit, scale and axis options of one export format."""
+
+    # Scale property
+    scale: FloatProperty(
+        name="Scale",
+        description="Scale factor for exported meshes",
+        default=1.0,
+        min=0.001,
+        max=1000.0,
+        soft_min=0.01,
+        soft_max=100.0
+    )
+    
+    # Units property
+    units: EnumProperty(
+        name="Units",
+        description="Unit system for exported meshes",
+        items=[
+            ("METERS", "m", "Use meters as export unit"),
+            ("CENTIMETERS", "cm", "Use centimeters as export unit"),
+        ],
+        default="METERS",
+    )
+
+    # Coordinate system properties
+    coord_up: EnumProperty(
+        name="Up Axis",
+        description="Up axis for exported meshes",
+        items=[
+            ("X", "X", ""),("Y", "Y", ""),("Z", "Z", ""),
+            ("-X", "-X", ""),("-Y", "-Y", ""),("-Z", "-Z", "")
+        ],
+        default="Y"
+    )
+
+    coord_forward: EnumProperty(
+        name="Forward Axis",
+        description="Forward axis for exported meshes",
+        items=[
+            ("X", "X", ""),("Y", "Y", ""),("Z", "Z", ""),
+            ("-X", "-X", ""),("-Y", "-Y", ""),("-Z", "-Z", "")
+        ],
+        default="Z"
+    )
+
+
 class MeshExporterSettings(PropertyGroup):
     # Export path property
     # Default to the current blend file directory 
@@ -23,7 +83,8 @@ class MeshExporterSettings(PropertyGroup):
         subtype="DIR_PATH"
     )
 
-    # Export format property
+    # Legacy single export format, kept so saved files can be converted
+    # to mesh_export_formats (see migrate_settings)
     mesh_export_format: EnumProperty(
         name="Format",
         description="File format to export meshes",
@@ -34,7 +95,25 @@ class MeshExporterSettings(PropertyGroup):
              ("USD", "USD", "Export as USD"),
              ("STL", "STL", "Export as STL"),
         ],
-        default="FBX"
+        default="FBX",
+        options={"HIDDEN"}
+    )
+
+    # Export formats property
+    mesh_export_formats: EnumProperty(
+        name="Format",
+        description="File formats to export meshes to. Objects are "
+                    "prepared once and written to every selected format; "
+                    "with several formats each gets its own sub-folder",
+        items=[
+             ("FBX", "FBX", "Export as FBX"),
+             ("OBJ", "OBJ", "Export as OBJ"),
+             ("GLTF", "glTF", "Export as glTF"),
+             ("USD", "USD", "Export as USD"),
+             ("STL", "STL", "Export as STL"),
+        ],
+        options={"ENUM_FLAG"},
+        default={"FBX"}
     )
 
     # GLTF type property
@@ -55,18 +134,36 @@ class MeshExporterSettings(PropertyGroup):
         default=True
     )
 
-    # Scale property
+    # GLTF exporter profile property
+    mesh_export_gltf_profile: EnumProperty(
+        name="glTF Profile",
+        description="Animation, skin and shape key data written to glTF",
+        items=[
+            ("AUTO", "Auto",
+             "Only process the animation, skin and shape key data each "
+             "object has; static meshes skip animation and skin export"),
+            ("FULL", "Full",
+             "Always export animations, skins and all bones"),
+        ],
+        default="AUTO"
+    )
+
+    # Per-format unit, scale and axis options (see FORMAT_OPTIONS)
+    mesh_export_fbx_options: PointerProperty(type=MeshExportFormatOptions)
+    mesh_export_obj_options: PointerProperty(type=MeshExportFormatOptions)
+    mesh_export_usd_options: PointerProperty(type=MeshExportFormatOptions)
+    mesh_export_stl_options: PointerProperty(type=MeshExportFormatOptions)
+
+    # Legacy options shared by all formats, kept so saved files can be
+    # converted to the per-format options (see migrate_settings)
     mesh_export_scale: FloatProperty(
         name="Scale",
         description="Scale factor for exported meshes",
         default=1.0,
         min=0.001,
         max=1000.0,
-        soft_min=0.01,
-        soft_max=100.0
+        options={"HIDDEN"}
     )
-    
-    # Units property
     mesh_export_units: EnumProperty(
         name="Units",
         description="Unit system for exported meshes",
@@ -75,9 +172,8 @@ class MeshExporterSettings(PropertyGroup):
             ("CENTIMETERS", "cm", "Use centimeters as export unit"),
         ],
         default="METERS",
+        options={"HIDDEN"}
     )
-
-    # Coordinate system properties
     mesh_export_coord_up: EnumProperty(
         name="Up Axis",
         description="Up axis for exported meshes",
@@ -85,9 +181,9 @@ class MeshExporterSettings(PropertyGroup):
             ("X", "X", ""),("Y", "Y", ""),("Z", "Z", ""),
             ("-X", "-X", ""),("-Y", "-Y", ""),("-Z", "-Z", "")
         ],
-        default="Y"
+        default="Y",
+        options={"HIDDEN"}
     )
-
     mesh_export_coord_forward: EnumProperty(
         name="Forward Axis",
         description="Forward axis for exported meshes",
@@ -95,7 +191,8 @@ class MeshExporterSettings(PropertyGroup):
             ("X", "X", ""),("Y", "Y", ""),("Z", "Z", ""),
             ("-X", "-X", ""),("-Y", "-Y", ""),("-Z", "-Z", "")
         ],
-        default="Z"
+        default="Z",
+        options={"HIDDEN"}
     )
 
     mesh_export_smoothing: EnumProperty(
@@ -124,6 +221,111 @@ class MeshExporterSettings(PropertyGroup):
         default=True
     )
 
+    # Modifier evaluation property
+    mesh_export_fast_modifiers: BoolProperty(
+        name="Evaluate Modifiers",
+        description="Build the export mesh once from the evaluated "
+                    "depsgraph instead of applying each modifier "
+                    "with an operator. Objects with shape keys still use "
+                    "the operators, which keep their shape keys",
+        default=False
+    )
+
+    # Incremental export property
+    mesh_export_incremental: BoolProperty(
+        name="Skip Unchanged",
+        description="Skip objects whose mesh, modifiers, materials and "
+                    "export settings haven't changed since their last "
+                    "export and whose files still exist",
+        default=False
+    )
+
+    mesh_export_dedupe: EnumProperty(
+        name="Duplicates",
+        description="How objects with identical export output (linked "
+                    "duplicates or identical geometry, modifiers, "
+                    "materials, rotation and scale) are handled",
+        items=[
+            ("NONE", "Export All", "Export every object separately"),
+            ("COPY", "Copy Files",
+             "Export one object per group and hardlink (or copy) its "
+             "files under the other objects' names. The copies keep "
+             "the exported object's internal name"),
+            ("MAPPING", "Mapping File",
+             "Export one object per group and list the others with "
+             "their source files and transforms in "
+             "easymesh_instances.json"),
+        ],
+        default="NONE",
+    )
+
+    # Parallel export properties
+    mesh_export_parallel: BoolProperty(
+        name="Parallel Export",
+        description="Split the selection into shards and export them in "
+                    "background Blender worker processes",
+        default=False
+    )
+
+    mesh_export_parallel_workers: IntProperty(
+        name="Workers",
+        description="Number of background Blender processes to start",
+        default=4, min=2, max=64,
+    )
+
+    # Memory properties
+    mesh_export_bounded_memory: BoolProperty(
+        name="Bounded Memory",
+        description="Regularly remove unused meshes, materials and images "
+                    "the batch itself created, so memory stays flat over "
+                    "long batches. Data you create while a batch runs is "
+                    "never removed",
+        default=False
+    )
+
+    mesh_export_purge_interval: IntProperty(
+        name="Every",
+        description="Number of exported objects between orphan purges",
+        default=50, min=1, max=10000,
+    )
+
+    # Export history properties
+    mesh_export_history: BoolProperty(
+        name="Export History",
+        description="Record every exported file (object, LOD, format, "
+                    "size, polygon counts, duration and settings) in a "
+                    "history database in the export directory",
+        default=False
+    )
+
+    mesh_export_history_object: StringProperty(
+        name="Object",
+        description="Show exports of objects whose name starts with this",
+        default="",
+    )
+
+    mesh_export_history_format: EnumProperty(
+        name="Format",
+        description="Show exports to this format",
+        items=[
+             ("ALL", "All Formats", "Show exports to every format"),
+             ("FBX", "FBX", "Show FBX exports"),
+             ("OBJ", "OBJ", "Show OBJ exports"),
+             ("GLTF", "glTF", "Show glTF exports"),
+             ("USD", "USD", "Show USD exports"),
+             ("STL", "STL", "Show STL exports"),
+        ],
+        default="ALL"
+    )
+
+    mesh_export_history_since: StringProperty(
+        name="Since",
+        description="Show exports since this date (YYYY-MM-DD or "
+                    "YYYY-MM-DD HH:MM) or age (30m, 12h, 3d, 2w). "
+                    "Re-export Stale exports objects not exported since",
+        default="",
+    )
+
     # Triangulate properties
     mesh_export_tri: BoolProperty(
         name="Triangulate Faces",
@@ -182,6 +384,15 @@ class MeshExporterSettings(PropertyGroup):
         default=4, min=1, max=4, # Max 4 due to 4 ratio properties
     )
 
+    # LOD cascade property
+    mesh_export_lod_cascade: BoolProperty(
+        name="Cascade",
+        description="Build each LOD from the previous LOD instead of the "
+                    "full resolution mesh, using the relative ratio. "
+                    "Faster on dense meshes",
+        default=False
+    )
+
     # LOD symmetry property
     mesh_export_lod_symmetry: BoolProperty(
         name="Symmetry",
@@ -214,6 +425,59 @@ class MeshExporterSettings(PropertyGroup):
         default="COLLAPSE",
     )
 
+    # LOD target mode property
+    mesh_export_lod_target: EnumProperty(
+        name="Target",
+        description="How the size of each LOD level is specified",
+        items=[
+            ("RATIO", "Ratio", 
+             "Decimate each LOD by a fixed ratio"),
+            ("TRIANGLES", "Triangles", 
+             "Search the ratio that meets an absolute triangle budget"),
+            ("BUDGET", "Budget %", 
+             "Search the ratio that meets a percentage of the collection's "
+             "triangle budget"),
+        ],
+        default="RATIO"
+    )
+
+    # Triangle budget used by collections without their own budget
+    mesh_export_lod_tri_budget: IntProperty(
+        name="Default Budget",
+        description="Triangle budget for objects whose collections don't "
+                    "set one",
+        default=10000, min=1,
+    )
+
+    # LOD texture property
+    mesh_export_lod_textures: BoolProperty(
+        name="Downscale Textures",
+        description="Export LODs with downscaled copies of their image "
+                    "textures (originals are not modified)",
+        default=False
+    )
+
+    mesh_export_texture_cache_mb: IntProperty(
+        name="Texture Memory (MB)",
+        description="Memory cap for the downscaled LOD textures kept "
+                    "during a batch. Unused levels beyond it are freed",
+        default=1024, min=64,
+    )
+
+    # Decimation cache properties
+    mesh_export_decimate_cache: BoolProperty(
+        name="Cache Decimation",
+        description="Reuse decimation results stored on disk when the "
+                    "mesh and LOD settings haven't changed",
+        default=True
+    )
+    mesh_export_decimate_cache_mb: IntProperty(
+        name="Cache Size (MB)",
+        description="Maximum disk space for cached decimation results. "
+                    "The least recently used results are removed first",
+        default=1024, min=16,
+    )
+
     # LOD ratio properties
     mesh_export_lod_ratio_01: FloatProperty(
         name="LOD1 Ratio", 
@@ -236,13 +500,129 @@ class MeshExporterSettings(PropertyGroup):
         default=0.10, min=0.0, max=1.0, subtype="FACTOR"
     )
 
+    # LOD triangle budget properties
+    mesh_export_lod_tris_01: IntProperty(
+        name="LOD1 Triangles",
+        description="Triangle budget for LOD 1",
+        default=5000, min=1,
+    )
+    mesh_export_lod_tris_02: IntProperty(
+        name="LOD2 Triangles",
+        description="Triangle budget for LOD 2",
+        default=2500, min=1,
+    )
+    mesh_export_lod_tris_03: IntProperty(
+        name="LOD3 Triangles",
+        description="Triangle budget for LOD 3",
+        default=1000, min=1,
+    )
+    mesh_export_lod_tris_04: IntProperty(
+        name="LOD4 Triangles",
+        description="Triangle budget for LOD 4",
+        default=500, min=1,
+    )
+
+
+# Shared legacy options → MeshExportFormatOptions property
+LEGACY_FORMAT_OPTIONS = {
+    "mesh_export_scale": "scale",
+    "mesh_export_units": "units",
+    "mesh_export_coord_up": "coord_up",
+    "mesh_export_coord_forward": "coord_forward",
+}
+# Properties replaced by newer ones; converted by migrate_settings and
+# left out of settings_as_dict
+LEGACY_PROPERTIES = {"mesh_export_format", *LEGACY_FORMAT_OPTIONS}
+
+
+def migrate_settings(settings):
+    """
+    Converts legacy properties stored in a saved file: the single
+    mesh_export_format becomes the mesh_export_formats set, and the
+    shared unit, scale and axis options are copied to every format's
+    options. Converted properties are unset, so this runs once per file.
+
+    Args:
+        settings (MeshExporterSettings): A scene's exporter settings.
+
+    Returns:
+        bool: True if anything was converted.
+    """
+    converted = False
+    if settings.is_property_set("mesh_export_format"):
+        settings.mesh_export_formats = {settings.mesh_export_format}
+        settings.property_unset("mesh_export_format")
+        converted = True
+    for legacy_name, option in LEGACY_FORMAT_OPTIONS.items():
+        if not settings.is_property_set(legacy_name):
+            continue
+        value = getattr(settings, legacy_name)
+        for options_name in FORMAT_OPTIONS.values():
+            setattr(getattr(settings, options_name), option, value)
+        settings.property_unset(legacy_name)
+        converted = True
+    return converted
+
+
+def migrate_all_scenes():
+    """Runs migrate_settings on every scene. Also used as a timer."""
+    for scene in bpy.data.scenes:
+        settings = getattr(scene, "mesh_exporter", None)
+        if settings is not None and migrate_settings(settings):
+            print(f"Converted legacy export settings of scene {scene.name}")
+    return None
+
+
+@persistent
+def _on_load_post(*args):
+    migrate_all_scenes()
+
+
+def upgrade_settings_dict(values):
+    """
+    Converts legacy keys of settings frozen by an older version (e.g. in
+    a batch journal) in place.
+
+    Args:
+        values (dict): Settings as written by settings_as_dict.
+
+    Returns:
+        dict: values.
+    """
+    legacy_format = values.pop("mesh_export_format", None)
+    if legacy_format is not None and "mesh_export_formats" not in values:
+        values["mesh_export_formats"] = (
+            [legacy_format] if isinstance(legacy_format, str)
+            else list(legacy_format)
+        )
+    for legacy_name, option in LEGACY_FORMAT_OPTIONS.items():
+        if legacy_name not in values:
+            continue
+        value = values.pop(legacy_name)
+        for options_name in FORMAT_OPTIONS.values():
+            values.setdefault(options_name, {}).setdefault(option, value)
+    return values
+
 
 def register_properties():
     """Register the property group and create the Scene property"""
     try:
+        bpy.utils.register_class(MeshExportFormatOptions)
         bpy.utils.register_class(MeshExporterSettings)
         bpy.types.Scene.mesh_exporter = PointerProperty(
             type=MeshExporterSettings)
+        if _on_load_post not in bpy.app.handlers.load_post:
+            bpy.app.handlers.load_post.append(_on_load_post)
+        # bpy.data isn't accessible during registration; converts the
+        # file that is open when the add-on is enabled
+        bpy.app.timers.register(migrate_all_scenes, first_interval=0.0)
+        # Per-collection triangle budget for "Budget %" LOD targets
+        bpy.types.Collection.mesh_export_tri_budget = IntProperty(
+            name="Triangle Budget",
+            description="Triangle budget per object in this collection "
+                        "(0 uses the exporter's default budget)",
+            default=0, min=0,
+        )
         # Verification
         test = bpy.types.Scene.bl_rna.properties.get("mesh_exporter")
         if test:
@@ -255,6 +635,44 @@ def register_properties():
 
 def unregister_properties():
     """Unregister the property group and remove the Scene property"""
+    if _on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post)
+    if bpy.app.timers.is_registered(migrate_all_scenes):
+        bpy.app.timers.unregister(migrate_all_scenes)
     if hasattr(bpy.types.Scene, "mesh_exporter"):
         delattr(bpy.types.Scene, "mesh_exporter")
-    bpy.utils.unregister_class(MeshExporterSettings)
\ No newline at end of file
+    if hasattr(bpy.types.Collection, "mesh_export_tri_budget"):
+        delattr(bpy.types.Collection, "mesh_export_tri_budget")
+    bpy.utils.unregister_class(MeshExporterSettings)
+    bpy.utils.unregister_class(MeshExportFormatOptions)
+
+def settings_as_dict(settings):
+    """
+    Returns the exporter settings as a plain, JSON-serialisable dict.
+    Enum-flag (set) values are stored as sorted lists, nested property
+    groups (the per-format options) as dicts. Legacy properties are left
+    out.
+    
+    Args:
+        settings (MeshExporterSettings): The settings to convert.
+    
+    Returns:
+        dict: {property identifier: value}
+    """
+    values = {}
+    for prop in settings.bl_rna.properties:
+        if (prop.identifier == "rna_type"
+                or prop.identifier in LEGACY_PROPERTIES):
+            continue
+        value = getattr(settings, prop.identifier)
+        if isinstance(value, PropertyGroup):
+            value = settings_as_dict(value)
+        elif isinstance(value, set):
+            value = sorted(value)
+        elif not isinstance(value, (str, int, float, bool)):
+            try:
+                value = list(value)
+            except TypeError:
+                continue # Pointers/collections aren't settings
+        values[prop.identifier] = value
+    return values
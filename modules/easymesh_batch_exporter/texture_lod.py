@@ -0,0 +1,333 @@
+# texture_lod.py
+"""
+Texture downscaling for LOD exports.
+
+Pixels are read and written in bulk through foreach_get/foreach_set
+into float32 buffers and reduced with a vectorised area (box) filter.
+A batch-scoped texture pyramid holds every LOD resolution of each source
+image, so an image shared by several objects and LOD levels is only
+reduced once per level, each level from the next larger one.
+
+Every level is saved to a temporary file, because FBX and OBJ reference
+or copy textures by their file path. The files are removed with the
+pyramid.
+"""
+
+import bpy
+import os
+import shutil
+import logging
+import tempfile
+import collections
+import numpy as np
+
+# --- Setup Logger ---
+logger = logging.getLogger(__name__)
+if not logger.handlers:
+    handler = logging.StreamHandler()
+    formatter = logging.Formatter("%(name)s:%(levelname)s: %(message)s")
+    handler.setFormatter(formatter)
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)  # Default level
+
+# --- Constants ---
+# Longest texture side per LOD level; matches the usdz_downscale_size
+# used by export_object
+LOD_TEXTURE_SIZES = {1: 2048, 2: 1024, 3: 512, 4: 256}
+# File formats level images are saved in → file extension
+FILE_EXTENSIONS = {
+    "PNG": ".png",
+    "JPEG": ".jpg",
+    "TARGA": ".tga",
+    "TIFF": ".tif",
+    "BMP": ".bmp",
+    "OPEN_EXR": ".exr",
+}
+
+
+# --- Pixels ---
+
+
+def read_pixels(image):
+    """
+    Reads an image's pixels into a float32 array of shape
+    (height, width, channels).
+    """
+    width, height = image.size
+    channels = image.channels
+    pixels = np.empty(width * height * channels, dtype=np.float32)
+    image.pixels.foreach_get(pixels)
+    return pixels.reshape(height, width, channels)
+
+
+def area_taps(size, new_size):
+    """
+    Returns the source texels each destination texel covers and their
+    coverage weights, as two (new_size, taps) arrays. A destination texel
+    covers at most ceil(size / new_size) + 1 source texels, so the filter
+    is banded; unused taps have weight 0.
+    """
+    scale = size / new_size
+    edges = np.arange(new_size + 1, dtype=np.float64) * scale
+    taps = int(np.ceil(scale)) + 1
+    texels = (np.floor(edges[:-1]).astype(np.int64)[:, None]
+              + np.arange(taps)[None, :])
+    overlap = (np.minimum(edges[1:, None], texels + 1.0)
+               - np.maximum(edges[:-1, None], texels))
+    weights = (np.clip(overlap, 0.0, None) / scale).astype(np.float32)
+    return np.minimum(texels, size - 1), weights
+
+
+def resample_axis(pixels, new_size, axis):
+    """
+    Reduces pixels along axis (0 = rows, 1 = columns) with a coverage-
+    weighted area filter, gathering only the covered texels per tap.
+    """
+    texels, weights = area_taps(pixels.shape[axis], new_size)
+    shape = list(pixels.shape)
+    shape[axis] = new_size
+    result = np.zeros(shape, dtype=np.float32)
+    broadcast = (slice(None), None) if axis == 0 else (None, slice(None))
+    for tap in range(texels.shape[1]):
+        result += (np.take(pixels, texels[:, tap], axis=axis)
+                   * weights[:, tap][broadcast + (None,)])
+    return result
+
+
+def downscale_pixels(pixels, new_width, new_height):
+    """
+    Reduces a (height, width, channels) array with an area filter.
+    Integer factors use a reshape-and-mean box filter, other factors
+    a separable banded filter over the covered texels.
+
+    Args:
+        pixels (numpy.ndarray): Source pixels.
+        new_width (int): Target width, at most the source width.
+        new_height (int): Target height, at most the source height.
+
+    Returns:
+        numpy.ndarray: (new_height, new_width, channels) float32 pixels.
+    """
+    height, width, channels = pixels.shape
+    if width % new_width == 0 and height % new_height == 0:
+        factor_y, factor_x = height // new_height, width // new_width
+        return pixels.reshape(
+            new_height, factor_y, new_width, factor_x, channels
+        ).mean(axis=(1, 3), dtype=np.float32)
+    if new_height != height:
+        pixels = resample_axis(pixels, new_height, 0)
+    if new_width != width:
+        pixels = resample_axis(pixels, new_width, 1)
+    return pixels.astype(np.float32, copy=False)
+
+
+def to_rgba(pixels):
+    """Expands (h, w, 1|2|3) pixels to RGBA, as new images are RGBA."""
+    channels = pixels.shape[2]
+    if channels == 4:
+        return pixels
+    rgba = np.ones(pixels.shape[:2] + (4,), dtype=np.float32)
+    if channels >= 3:
+        rgba[..., :3] = pixels[..., :3]
+    else:
+        rgba[..., :3] = pixels[..., :1]
+        if channels == 2:
+            rgba[..., 3] = pixels[..., 1]
+    return rgba
+
+
+def get_lod_texture_size(image, lod_level):
+    """
+    Returns the size of image at an LOD level: its longest side is
+    limited to LOD_TEXTURE_SIZES[lod_level], keeping the aspect ratio.
+
+    Returns:
+        tuple: (width, height), the original size if no reduction is needed.
+    """
+    width, height = image.size
+    limit = LOD_TEXTURE_SIZES.get(lod_level)
+    if limit is None or max(width, height) <= limit:
+        return width, height
+    scale = limit / max(width, height)
+    return (max(int(round(width * scale)), 1),
+            max(int(round(height * scale)), 1))
+
+
+def image_bytes(image):
+    """Approximate memory of an image's pixel buffer."""
+    width, height = image.size
+    return width * height * 4 * (4 if image.is_float else 1)
+
+
+def save_level_image(image, source, directory, file_stem):
+    """
+    Saves a level image as directory/file_stem in the source's file
+    format where possible, PNG (or OpenEXR for float images) otherwise,
+    so exporters that copy textures by path find it.
+    """
+    file_format = source.file_format
+    if file_format not in FILE_EXTENSIONS:
+        file_format = "OPEN_EXR" if image.is_float else "PNG"
+    file_name = bpy.path.clean_name(file_stem) + FILE_EXTENSIONS[file_format]
+    image.filepath_raw = os.path.join(directory, file_name)
+    image.file_format = file_format
+    image.save()
+
+
+def remove_level_image(image):
+    """Removes a level image and its saved file."""
+    path = bpy.path.abspath(image.filepath_raw)
+    bpy.data.images.remove(image)
+    if path:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def create_downscaled_image(image, new_width, new_height, name,
+                            directory=None, file_stem=None):
+    """
+    Creates a new image holding image reduced to new_width x new_height.
+    With a directory, the image is also saved there (see
+    save_level_image).
+
+    Returns:
+        bpy.types.Image: The new image.
+    """
+    pixels = to_rgba(downscale_pixels(read_pixels(image),
+                                      new_width, new_height))
+    new_image = bpy.data.images.new(
+        name=name, width=new_width, height=new_height,
+        alpha=image.alpha_mode != "NONE", float_buffer=image.is_float
+    )
+    new_image.pixels.foreach_set(pixels.ravel())
+    new_image.colorspace_settings.name = image.colorspace_settings.name
+    new_image.alpha_mode = image.alpha_mode
+    new_image.update()
+    if directory is not None:
+        try:
+            save_level_image(new_image, image, directory, file_stem or name)
+        except Exception:
+            bpy.data.images.remove(new_image)
+            raise
+    return new_image
+
+
+# --- Batch Pyramid ---
+
+
+class TexturePyramid:
+    """
+    Downscaled LOD levels of source images for one batch.
+    Levels are created on first use from the next larger level still
+    resident, kept in least recently used order and evicted (if unused)
+    once their total size exceeds max_bytes. Level files are saved in
+    a temporary directory that release removes.
+    """
+
+    def __init__(self, max_bytes=None):
+        self.max_bytes = max_bytes
+        self.temp_dir = None
+        # (source image name, lod level) → image, oldest first
+        self.levels = collections.OrderedDict()
+        self.level_bytes = {}
+        self.total_bytes = 0
+
+    @property
+    def images(self):
+        return self.levels
+
+    def _resident(self, key):
+        image = self.levels.get(key)
+        if image is None:
+            return None
+        try:
+            image.name # Still valid?
+        except ReferenceError:
+            self._forget(key)
+            return None
+        self.levels.move_to_end(key)
+        return image
+
+    def get(self, image, lod_level):
+        """
+        Returns image at an LOD level, creating that level on first use.
+
+        Returns:
+            bpy.types.Image: The level image, or image itself if the level
+                needs no reduction.
+        """
+        width, height = get_lod_texture_size(image, lod_level)
+        if (width, height) == tuple(image.size):
+            return image
+        key = (image.name, lod_level)
+        level_image = self._resident(key)
+        if level_image is not None:
+            return level_image
+
+        # Reduce from the next larger resident level, or the source
+        source = image
+        for larger_level in range(lod_level - 1, 0, -1):
+            larger = self._resident((image.name, larger_level))
+            if larger is not None:
+                source = larger
+                break
+        if self.temp_dir is None:
+            self.temp_dir = tempfile.mkdtemp(prefix="easymesh_textures_")
+        stem = os.path.splitext(image.name)[0]
+        level_image = create_downscaled_image(
+            source, width, height, f"{image.name}_LOD{lod_level:02d}",
+            self.temp_dir, f"{stem}_LOD{lod_level:02d}"
+        )
+        logger.info(f"Texture pyramid: '{image.name}' LOD{lod_level:02d} "
+                    f"{source.size[0]}x{source.size[1]} → {width}x{height}")
+        self.levels[key] = level_image
+        self.level_bytes[key] = image_bytes(level_image)
+        self.total_bytes += self.level_bytes[key]
+        self.evict(keep=key)
+        return level_image
+
+    def _forget(self, key):
+        del self.levels[key]
+        self.total_bytes -= self.level_bytes.pop(key, 0)
+
+    def evict(self, keep=None):
+        """
+        Removes least recently used levels that no material uses until
+        the pyramid fits in max_bytes.
+        """
+        if self.max_bytes is None:
+            return
+        for key in list(self.levels):
+            if self.total_bytes <= self.max_bytes:
+                break
+            image = self.levels[key]
+            try:
+                in_use = image.users > 0
+            except ReferenceError:
+                self._forget(key)
+                continue
+            if key == keep or in_use:
+                continue
+            self._forget(key)
+            remove_level_image(image)
+            logger.info(f"Texture pyramid: evicted {key[0]} "
+                        f"LOD{key[1]:02d}")
+
+    def release(self):
+        """Removes every level created during the batch and its files."""
+        for image in self.levels.values():
+            try:
+                bpy.data.images.remove(image)
+            except ReferenceError:
+                pass
+        if self.temp_dir is not None:
+            shutil.rmtree(self.temp_dir, ignore_errors=True)
+            self.temp_dir = None
+        if self.levels:
+            logger.info(f"Texture pyramid: released {len(self.levels)} "
+                        f"levels ({self.total_bytes / 2**20:.1f} MB)")
+        self.levels.clear()
+        self.level_bytes.clear()
+        self.total_bytes = 0
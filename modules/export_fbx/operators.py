@@ -4,6 +4,8 @@ import os
 import subprocess
 import math
 from datetime import datetime
+from ..common.mesh_utils import triangulate_mesh_data
+from ..common.selection_utils import deselect_all
 
 # Operator classes will be moved here
 class MultiExport(bpy.types.Operator):
@@ -87,7 +89,7 @@ class MultiExport(bpy.types.Operator):
 			name = bpy.context.active_object.name
 
 			# Filtering selected objects. Exclude all not meshes, empties, armatures, curves and text
-			bpy.ops.object.select_all(action='DESELECT')
+			deselect_all(bpy.context.view_layer)
 			for x in current_selected_obj:
 				if x.type == 'MESH' or x.type == 'EMPTY' or x.type == 'ARMATURE' or x.type == 'CURVE' or x.type == 'FONT':
 					x.select_set(True)
@@ -111,7 +113,7 @@ class MultiExport(bpy.types.Operator):
 
 			# Convert all non-mesh objects to mesh (except empties)
 			for obj in exp_objects:
-				bpy.ops.object.select_all(action='DESELECT')
+				deselect_all(bpy.context.view_layer)
 				obj.select_set(True)
 				bpy.context.view_layer.objects.active = obj
 
@@ -160,18 +162,13 @@ class MultiExport(bpy.types.Operator):
 							o.data.materials.pop(index=q)
 
 			# Triangulate meshes (Optional)
+			# Works on mesh data directly: no Edit Mode, no selection changes
 			if act.triangulate_before_export:
+				triangulated_meshes = set()
 				for o in exp_objects:
-					if o.type == 'MESH':
-						bpy.ops.object.select_all(action='DESELECT')
-						o.select_set(True)
-						bpy.context.view_layer.objects.active = o
-						bpy.ops.object.mode_set(mode='EDIT')
-						bpy.ops.mesh.reveal()
-						bpy.ops.mesh.select_all(action='SELECT')
-						bpy.ops.mesh.quads_convert_to_tris(quad_method='BEAUTY', ngon_method='BEAUTY')
-						bpy.ops.mesh.select_all(action='DESELECT')
-						bpy.ops.object.mode_set(mode='OBJECT')
+					if o.type == 'MESH' and o.data.name not in triangulated_meshes:
+						triangulated_meshes.add(o.data.name)
+						triangulate_mesh_data(o.data, quad_method='BEAUTY', ngon_method='BEAUTY')
 
 			# Select all exported objects
 			for obj in exp_objects:
@@ -181,7 +178,7 @@ class MultiExport(bpy.types.Operator):
 			# Processing only objects without linked data
 			if (act.export_target_engine == 'UNITY2023' and act.export_format == 'FBX') or act.export_format == 'GLTF':
 				current_active = bpy.context.view_layer.objects.active
-				bpy.ops.object.select_all(action='DESELECT')
+				deselect_all(bpy.context.view_layer)
 				for x in exp_objects:
 					if (x.type == 'MESH' and x.data.users < 2) or x.type != 'MESH':
 						bpy.context.view_layer.objects.active = x
@@ -197,7 +194,7 @@ class MultiExport(bpy.types.Operator):
 
 					# Operate only with higher level parents
 					for x in exp_objects:
-						bpy.ops.object.select_all(action='DESELECT')
+						deselect_all(bpy.context.view_layer)
 
 						if x.parent is None:
 							x.select_set(True)
@@ -211,7 +208,7 @@ class MultiExport(bpy.types.Operator):
 								if abs(y.rotation_euler.x) + abs(y.rotation_euler.y) + abs(y.rotation_euler.z) > 0.017:
 									child_rotated = True
 
-							bpy.ops.object.select_all(action='DESELECT')
+							deselect_all(bpy.context.view_layer)
 							x.select_set(True)
 
 							# X-rotation fix
@@ -228,7 +225,7 @@ class MultiExport(bpy.types.Operator):
 									proportional_size=1)
 								bpy.ops.object.select_grouped(extend=True, type='CHILDREN_RECURSIVE')
 								bpy.ops.object.transform_apply(location=False, rotation=True, scale=False)
-								bpy.ops.object.select_all(action='DESELECT')
+								deselect_all(bpy.context.view_layer)
 								x.select_set(True)
 								bpy.ops.transform.rotate(
 									value=(math.pi * 90 / 180), orient_axis='X',
@@ -238,7 +235,7 @@ class MultiExport(bpy.types.Operator):
 									use_proportional_edit=False, proportional_edit_falloff='SMOOTH',
 									proportional_size=1)
 
-			bpy.ops.object.select_all(action='DESELECT')
+			deselect_all(bpy.context.view_layer)
 
 			# Select exported objects
 			for x in exp_objects:
@@ -293,7 +290,7 @@ class MultiExport(bpy.types.Operator):
 					object_loc = (0.0, 0.0, 0.0)
 					bpy.context.scene.tool_settings.transform_pivot_point = 'MEDIAN_POINT'
 					# Select only current object
-					bpy.ops.object.select_all(action='DESELECT')
+					deselect_all(bpy.context.view_layer)
 					x.select_set(True)
 					bpy.context.view_layer.objects.active = x
 
@@ -328,7 +325,7 @@ class MultiExport(bpy.types.Operator):
 
 			# Export by parents
 			if act.fbx_export_mode == 'PARENT':
-				bpy.ops.object.select_all(action='DESELECT')
+				deselect_all(bpy.context.view_layer)
 
 				# Select only top level parents
 				for x in exp_objects:
@@ -338,7 +335,7 @@ class MultiExport(bpy.types.Operator):
 				parent_objs = bpy.context.selected_objects
 
 				for x in parent_objs:
-					bpy.ops.object.select_all(action='DESELECT')
+					deselect_all(bpy.context.view_layer)
 					bpy.context.view_layer.objects.active = x
 					x.select_set(True)
 					# Combine All Meshes (Optional)
@@ -397,7 +394,7 @@ class MultiExport(bpy.types.Operator):
 					object_loc = (0.0, 0.0, 0.0)
 					bpy.context.scene.tool_settings.transform_pivot_point = 'MEDIAN_POINT'
 					# Select only current object
-					bpy.ops.object.select_all(action='DESELECT')
+					deselect_all(bpy.context.view_layer)
 
 					current_parent.select_set(True)
 					bpy.context.view_layer.objects.active = current_parent
@@ -430,7 +427,7 @@ class MultiExport(bpy.types.Operator):
 
 					# Export FBX/OBJ/GLTF
 					utils.export_model(path, name)
-					bpy.ops.object.select_all(action='DESELECT')
+					deselect_all(bpy.context.view_layer)
 					current_parent.select_set(True)
 
 					# Restore object location
@@ -459,7 +456,7 @@ class MultiExport(bpy.types.Operator):
 
 				# Select objects by collection and export
 				for c in used_collections:
-					bpy.ops.object.select_all(action='DESELECT')
+					deselect_all(bpy.context.view_layer)
 
 					# Select Objects in Collection
 					set_active_mesh = False
@@ -499,12 +496,12 @@ class MultiExport(bpy.types.Operator):
 					# Export FBX/OBJ/GLTF
 					utils.export_model(path, name)
 
-				bpy.ops.object.select_all(action='DESELECT')
+				deselect_all(bpy.context.view_layer)
 
 			if act.export_combine_meshes and (act.fbx_export_mode == 'PARENT' or act.fbx_export_mode == 'COLLECTION'):
 				exp_objects = combined_meshes
 
-			bpy.ops.object.select_all(action='DESELECT')
+			deselect_all(bpy.context.view_layer)
 
 			for obj in exp_objects:
 				obj.select_set(True)
@@ -519,7 +516,7 @@ class MultiExport(bpy.types.Operator):
 					continue
 
 			# Select again original objects and set active object
-			bpy.ops.object.select_all(action='DESELECT')
+			deselect_all(bpy.context.view_layer)
 
 			# Restore names of objects (remove "_ex" from name)
 			for j in current_selected_obj: